@@ -6,8 +6,11 @@ from typing import Dict, List, Optional, Tuple
 
 import pygame
 
-# Initialize pygame mixer
-pygame.mixer.init()
+# Initialize pygame mixer (there may be no audio device, e.g. on a CI server)
+try:
+    pygame.mixer.init()
+except pygame.error:
+    pass
 
 class AudioManager:
     """
@@ -53,6 +56,12 @@ class AudioManager:
 
         # Current music
         self.current_music: Optional[str] = None
+
+        # Without a mixer every call below becomes a silent no-op
+        if not pygame.mixer.get_init():
+            self.music_enabled = False
+            self.sfx_enabled = False
+            return
         
         # Reserved channels
         self.ui_channel = pygame.mixer.Channel(0)
@@ -169,13 +178,15 @@ class AudioManager:
     
     def stop_music(self, fade_ms: int = 1000) -> None:
         """Stop the currently playing music with optional fade out."""
-        pygame.mixer.music.fadeout(fade_ms)
+        if pygame.mixer.get_init():
+            pygame.mixer.music.fadeout(fade_ms)
         self.current_music = None
     
     def set_music_volume(self, volume: float) -> None:
         """Set music volume (0.0 to 1.0)."""
         self.music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.music_volume)
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(self.music_volume)
     
     def set_sfx_volume(self, volume: float) -> None:
         """Set sound effects volume (0.0 to 1.0)."""
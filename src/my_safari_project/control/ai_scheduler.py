@@ -0,0 +1,114 @@
+# my_safari_project/control/ai_scheduler.py
+"""
+Level-of-detail scheduling for animal decisions.
+
+Vitals (age, hunger, thirst, cooldowns) and collisions are integrated for
+every animal on every tick. What the scheduler thins out is the *decision*
+work: memory cleanup, interrupts and the state machine in
+AnimalAI._process_behaviours. Animals inside the camera view decide every
+tick, up to `view_budget` of them (the ones that waited longest first, so a
+view holding more animals than that takes turns); the rest decide when they
+are due, at most `budget` of them per tick, most overdue first. The game
+time an animal skipped is accumulated and handed to it in full the next
+time it decides, so state timers run down as they would have. When an
+animal changes state outside its own decision (a collision starts it
+drinking, eating or mating), what it had accumulated is dropped: the new
+state's timer is charged only from the tick it started in, and the animal
+is due again straight away.
+
+An animal is due again
+  - when its timed state (resting, eating, ...) is about to run out, but at
+    least every `idle_interval` seconds so needs can still interrupt it, or
+  - every `far_interval` seconds while it is seeking or otherwise untimed.
+
+The camera view is set by the GUI. Headless runs have none, so their
+schedule depends only on the simulation and stays replayable.
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from my_safari_project.control.animal_ai import AnimalAI
+
+AI_BUDGET     = 200     # out-of-view decisions per tick
+VIEW_BUDGET   = 400     # in-view decisions per tick
+FAR_INTERVAL  = 0.5     # seconds between decisions of a seeking animal out of view
+IDLE_INTERVAL = 2.0     # longest an animal in a timed state goes without deciding
+
+
+class AIScheduler:
+    def __init__(self, budget: int = AI_BUDGET, far_interval: float = FAR_INTERVAL,
+                 idle_interval: float = IDLE_INTERVAL, view_budget: int = VIEW_BUDGET):
+        self.budget = budget
+        self.view_budget = view_budget
+        self.far_interval = far_interval
+        self.idle_interval = idle_interval
+        self.view: Tuple[float, float, float, float] | None = None  # (min_x, min_y, max_x, max_y) in tiles
+        self._pending: Dict[int, float] = {}    # animal_id -> game time not yet decided on
+        self._due: Dict[int, float] = {}        # animal_id -> simulation time of next decision
+        self._deciding: Dict[int, float] = {}   # this tick's selection, as returned by select()
+        self._tick_dt = 0.0
+
+    def in_view(self, pos) -> bool:
+        view = self.view
+        return view is not None and view[0] <= pos.x < view[2] and view[1] <= pos.y < view[3]
+
+    def select(self, ai: "AnimalAI", dt: float) -> Dict[int, float]:
+        """Return {animal_id: accumulated dt} for the animals that decide this tick."""
+        now = ai.simulation_time
+        pending, due = self._pending, self._due
+        urgent: List[int] = []
+        waiting: List[Tuple[float, int]] = []
+        for animal in ai.board.animals:
+            if not animal.is_alive:
+                continue
+            aid = animal.animal_id
+            pending[aid] = pending.get(aid, 0.0) + dt
+            if self.in_view(animal.position):
+                urgent.append(aid)
+            else:
+                when = due.get(aid, now)
+                if when <= now:
+                    waiting.append((when, aid))
+
+        room = max(self.view_budget, 0)
+        if len(urgent) > room:
+            urgent.sort(key=pending.__getitem__, reverse=True)     # longest without a decision first
+            del urgent[room:]
+        room = max(self.budget, 0)
+        if len(waiting) > room:
+            waiting.sort()                      # most overdue first
+            del waiting[room:]
+        thinking = {aid: pending.pop(aid) for aid in urgent}
+        for _, aid in waiting:
+            thinking[aid] = pending.pop(aid)
+
+        if len(pending) > len(ai.board.animals):
+            self._forget({a.animal_id for a in ai.board.animals})
+        self._deciding, self._tick_dt = thinking, dt
+        return thinking
+
+    def state_changed(self, aid: int) -> None:
+        """<aid> entered a new state this tick: charge its timer from this tick on."""
+        if aid in self._deciding:
+            # changed during collisions, before it decides with what it had accumulated
+            self._deciding[aid] = self._tick_dt
+        else:
+            self._pending[aid] = self._tick_dt
+            self._due.pop(aid, None)
+
+    def reschedule(self, ai: "AnimalAI", decided: Iterable[int]) -> None:
+        """Set the next decision time of the animals that just decided."""
+        now = ai.simulation_time
+        for aid in decided:
+            status = ai.animal_states.get(aid)
+            if status is not None and status.timer > 0:
+                self._due[aid] = now + min(status.timer, self.idle_interval)
+            else:
+                self._due[aid] = now + self.far_interval
+
+    def _forget(self, alive: set) -> None:
+        for table in (self._pending, self._due):
+            for aid in [aid for aid in table if aid not in alive]:
+                del table[aid]
@@ -1,14 +1,22 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Set, TYPE_CHECKING
 from enum import Enum, auto
 from pygame import Surface, draw, font, Color
 from pygame.math import Vector2
-import random, math
+import heapq, itertools, random, math
 
 from my_safari_project.model.board import Board
 from my_safari_project.model.herbivore import Herbivore
 from my_safari_project.model.carnivore import Carnivore
+from my_safari_project.model.spatial_hash import SpatialHash
+from my_safari_project.model.events import Eaten
+from my_safari_project.model.animal_arrays import AnimalArrays, ArrayField, HAS_NUMPY
+from my_safari_project.control.profiler import profiler
+from my_safari_project.control.ai_scheduler import AIScheduler
+
+if TYPE_CHECKING:
+    from my_safari_project.view.text_cache import TextCache
 
 # Constants
 COLLISION_RADIUS  = 0.5
@@ -64,7 +72,10 @@ class AnimalState(Enum):
 
     @property
     def time(self):
-        # Duration (in seconds) the animal spends in each state.
+        return self.duration(random)
+
+    def duration(self, rng) -> float:
+        # Duration (in seconds) the animal spends in each state, drawn from <rng>.
         # States with a duration of 0.0 represent continuous behavior until a new state is triggered.
         return {
             AnimalState.SEEKING_WATER : 0.0,
@@ -74,8 +85,8 @@ class AnimalState(Enum):
             AnimalState.EATING        : 5.0,
             AnimalState.REPRODUCING   : 5.0,
             AnimalState.RESTING       : 8.0,
-            AnimalState.MIGRATING     : random.uniform(5.0, 12.0),
-            AnimalState.WANDER        : max(4.0, random.uniform(MIN_WANDER_DISTANCE, MAX_WANDER_DISTANCE)/max(SPEEDS["WANDERING"], 0.1)*1.5)
+            AnimalState.MIGRATING     : rng.uniform(5.0, 12.0),
+            AnimalState.WANDER        : max(4.0, rng.uniform(MIN_WANDER_DISTANCE, MAX_WANDER_DISTANCE)/max(SPEEDS["WANDERING"], 0.1)*1.5)
         }[self]
 
 @dataclass
@@ -90,53 +101,105 @@ class AnimalStatus:
         "food": [], "water": [], "same_species": [] # (entity, last_seen)
     })
     last_state_change: float = 0.0
+    rng: Any = field(default=random, repr=False, compare=False)   # the owning simulation's stream
+    # (last_seen, seq, category, entity) for every memory entry, oldest first
+    expiry: List = field(default_factory=list, repr=False, compare=False)
+    # cooldowns move to an AnimalArrays row when the vectorised engine is on
+    # (see animal_arrays.backed_class)
+    _soa = None
+    _soa_row = -1
+    _plain_class = None
+    _array_fields = {
+        "reproduction_cooldown": ArrayField("reproduction_cooldown"),
+        "migration_cooldown":    ArrayField("migration_cooldown"),
+    }
     def __post_init__(self):
-        self.timer = self.state.time
+        self.timer = self.state.duration(self.rng)
 
 class AnimalAI:
-    def __init__(self, board: Board):
+    def __init__(self, board: Board, vectorized: bool = False, scheduler: AIScheduler | None = None):
         self.board = board
+        self.rng = board.rng
+        # optional LOD scheduler; without one every animal decides every tick
+        self.scheduler = scheduler
+        # optional struct-of-arrays engine for vitals (needs numpy)
+        self.arrays: AnimalArrays | None = AnimalArrays() if vectorized and HAS_NUMPY else None
         self.collision_shapes: Dict[int, Dict] = {}
         self.detected_entities: Dict[int, Dict[str, List[Any]]] = {}
         self.animal_states: Dict[int, AnimalStatus] = {}
+        self.spatial: Dict[str, SpatialHash] = board.spatial.grids   # kind -> grid, shared with the renderer
         self.simulation_time = 0.0
+
+        # memory bookkeeping: who remembers each entity, so a despawn only
+        # touches those animals' memories (and timeouts pop off per-animal heaps)
+        self._rememberers: Dict[Any, Set[int]] = {}
+        # animal_id -> despawned entities it still remembers until its next memory cleanup
+        self._departed: Dict[int, List[Any]] = {}
+        self._memory_seq = itertools.count()
+        for entities in (board.animals, board.plants, board.ponds):
+            entities.watch(on_remove=self._forget_entity)
         
-        for animal in self.board.animals: self.animal_states[animal.animal_id] = AnimalStatus()
+        for animal in self.board.animals: self.animal_states[animal.animal_id] = AnimalStatus(rng=self.rng)
         
-        # debug setup
+        # debug setup (fonts are created on first render so headless runs never touch them)
         self.debug_mode = False
-        self.label = font.SysFont(None, LABEL_FONT_SIZE, bold=True)
-        self.state_label = font.SysFont(None, int(LABEL_FONT_SIZE*2/3), bold=True)
+        self.label = None
+        self.state_label = None
+        self.texts: TextCache | None = None     # outlined labels, when rendered without BoardGUI's
 
     def update(self, dt: float) -> None:
         self.simulation_time += dt
         self._remove_dead_animals()
-        self._process_stats(dt)        
-        self._process_collisions()
-        self._process_behaviours(dt)
+        # {animal_id: dt to decide on} for the animals the scheduler picked, or None for all
+        deciding = self.scheduler.select(self, dt) if self.scheduler is not None else None
+        with profiler.section("animals.stats"):
+            self._process_stats(dt, deciding)
+        with profiler.section("animals.collisions"):
+            self._process_collisions()
+        with profiler.section("animals.behaviours"):
+            self._process_behaviours(dt, deciding)
+        if deciding is not None:
+            self.scheduler.reschedule(self, deciding)
     
-    def _process_stats(self, dt: float) -> None:
+    def _process_stats(self, dt: float, deciding: Dict[int, float] | None = None) -> None:
         current_time = self.simulation_time
+        if self.arrays is not None:
+            for animal in self.board.animals:
+                if animal.is_alive and animal.animal_id not in self.animal_states:
+                    self.animal_states[animal.animal_id] = AnimalStatus(rng=self.rng)
+            self.arrays.sync(self.board.animals, self.animal_states)
+            self.arrays.step_vitals(dt, REPRODUCTION_COOLDOWN_RATE, MIGRATION_COOLDOWN_RATE)
         for animal in self.board.animals:
             if not animal.is_alive:  continue
             if animal.animal_id not in self.animal_states: 
-                self.animal_states[animal.animal_id] = AnimalStatus()
-            # update vital stats
-            animal.add_age(dt)
-            animal.add_hunger(dt)
-            animal.add_thirst(dt)
-            # update reproduction cooldown
+                self.animal_states[animal.animal_id] = AnimalStatus(rng=self.rng)
             state = self.animal_states[animal.animal_id]
-            state.reproduction_cooldown = max(state.reproduction_cooldown - REPRODUCTION_COOLDOWN_RATE*dt, 0)
-            state.migration_cooldown    = max(state.migration_cooldown - MIGRATION_COOLDOWN_RATE*dt, 0)
-            # memory cleanup
-            collections = {
-                "water": self.board.ponds,
-                "food" : self.board.plants if isinstance(animal, Herbivore) else [a for a in self.board.animals if isinstance(a, Herbivore)],
-                "same_species": [a for a in self.board.animals if a.species == animal.species and a.animal_id != animal.animal_id]
-            }
-            for category, col in collections.items():
-                state.memory[category] = [(e, t) for e,t in state.memory[category] if e in col and current_time-t <= MEMORY_TIMEOUT]
+            if self.arrays is None:
+                # update vital stats
+                animal.add_age(dt)
+                animal.add_hunger(dt)
+                animal.add_thirst(dt)
+                # update reproduction cooldown
+                state.reproduction_cooldown = max(state.reproduction_cooldown - REPRODUCTION_COOLDOWN_RATE*dt, 0)
+                state.migration_cooldown    = max(state.migration_cooldown - MIGRATION_COOLDOWN_RATE*dt, 0)
+            if deciding is not None and animal.animal_id not in deciding:
+                continue
+            # memory cleanup (despawned entities were noted as they left the board)
+            departed = self._departed.pop(animal.animal_id, None)
+            if departed:
+                self._purge_memory(state, departed)
+            heap = state.expiry
+            while heap and current_time - heap[0][0] > MEMORY_TIMEOUT:
+                _, _, category, entity = heapq.heappop(heap)
+                self._drop_memory(animal.animal_id, state, entity, category)
+
+    def move_animals(self, dt: float) -> None:
+        """Advance every animal towards its target (Animal.update)."""
+        if self.arrays is not None:
+            self.arrays.step_movement(dt, self.board)
+            return
+        for a in self.board.animals:
+            a.update(dt, self.board)
 
     def _process_collisions(self) -> None:
         # collision cleanup
@@ -158,26 +221,17 @@ class AnimalAI:
             for animal_id in self.collision_shapes
         }
 
-        # entities to detect
-        entity_types = [
-            ('pond', self.board.ponds),
-            ('plant', self.board.plants),
-            ('jeep', self.board.jeeps),
-            ('ranger', self.board.rangers),
-            ('poacher', self.board.poachers),
-            ('tourist', self.board.tourists),
-        ]
+        # entities to detect, bucketed once per tick
+        self._build_spatial_index()
         
         # process area detection/collision
         for animal_id, shape in self.collision_shapes.items():
             animal = shape["animal"]
             status = self.animal_states[animal_id]
             # process all entity types
-            for entity_type, entities in entity_types + [
-                ('animal', [a for a in self.board.animals 
-                if a.animal_id != animal_id and a.is_alive])
-            ]:
-                for entity in entities:
+            for entity_type, grid in self.spatial.items():
+                for entity in grid.query(shape["position"], shape["detection_radius"]):
+                    if entity_type == "animal" and entity.animal_id == animal_id: continue
                     delta = entity.position - shape["position"]
                     sq_dist = delta.length_squared()
                     # detection check
@@ -191,7 +245,7 @@ class AnimalAI:
                         # update memory
                         def remember(entity, memory_type):
                             if not any(e is entity for e, _ in status.memory[memory_type]):
-                                status.memory[memory_type].append((entity, self.simulation_time))
+                                self._remember(animal_id, status, entity, memory_type)
                         if entity_type == "pond": 
                             remember(entity, "water")
                         elif entity_type == "plant" and isinstance(animal, Herbivore):
@@ -213,6 +267,7 @@ class AnimalAI:
                             min_dist = shape["collision_radius"] + COLLISION_RADIUS
                             separation = delta * ((min_dist - distance) / distance)
                             animal.position = shape["position"] - separation
+                            self.spatial["animal"].move(animal, animal.position)
                             if status.state not in [AnimalState.SEEKING_WATER, AnimalState.SEEKING_FOOD, AnimalState.SEEKING_MATE, AnimalState.MIGRATING]:
                                 animal.target = None
                             shape["in_collision"] = True
@@ -242,9 +297,66 @@ class AnimalAI:
             # sort detections by distance
             self.detected_entities[animal_id]["detected"].sort(key=lambda e: e["distance"])
             self.detected_entities[animal_id]["collided"].sort(key=lambda e: e["distance"])
-    
-    def _process_behaviours(self, dt: float) -> None:
+
+    def _remember(self, animal_id: int, status: AnimalStatus, entity: Any, category: str) -> None:
+        now = self.simulation_time
+        status.memory[category].append((entity, now))
+        heapq.heappush(status.expiry, (now, next(self._memory_seq), category, entity))
+        self._rememberers.setdefault(entity, set()).add(animal_id)
+
+    def _drop_memory(self, animal_id: int, status: AnimalStatus, entity: Any, category: str) -> None:
+        entries = status.memory[category]
+        for i, (e, _) in enumerate(entries):
+            if e is entity:
+                del entries[i]
+                break
+        if not any(e is entity for entries in status.memory.values() for e, _ in entries):
+            ids = self._rememberers.get(entity)
+            if ids is not None:
+                ids.discard(animal_id)
+                if not ids:
+                    del self._rememberers[entity]
+
+    def _forget_entity(self, entity: Any) -> None:
+        """
+        An entity left the board: the animals that remember it forget it at
+        their next memory cleanup in _process_stats, as a rescan of the board
+        would, not in the middle of the tick that removed it.
+        """
+        for animal_id in self._rememberers.pop(entity, ()):
+            self._departed.setdefault(animal_id, []).append(entity)
+        # a departing animal no longer remembers anything either
+        animal_id = getattr(entity, "animal_id", None)
+        self._departed.pop(animal_id, None)
+        status = self.animal_states.get(animal_id)
+        if status is not None and status.expiry:
+            for _, _, _, remembered in status.expiry:
+                ids = self._rememberers.get(remembered)
+                if ids is not None:
+                    ids.discard(entity.animal_id)
+                    if not ids:
+                        del self._rememberers[remembered]
+
+    @staticmethod
+    def _purge_memory(status: AnimalStatus, departed: List[Any]) -> None:
+        for entity in departed:
+            for category, entries in status.memory.items():
+                if any(e is entity for e, _ in entries):
+                    status.memory[category] = [(e, t) for e, t in entries if e is not entity]
+        status.expiry = [item for item in status.expiry if not any(item[3] is e for e in departed)]
+        heapq.heapify(status.expiry)
+
+    def _build_spatial_index(self) -> None:
+        """Re-bucket every detectable entity (the board's shared index, see spatial_index.py)."""
+        self.board.spatial.refresh()
+
+    def _process_behaviours(self, dt: float, deciding: Dict[int, float] | None = None) -> None:
         for animal_id, shape in self.collision_shapes.items():
+            if deciding is not None:
+                if animal_id not in deciding: continue
+                dt_animal = deciding[animal_id]     # game time since this animal last decided
+            else:
+                dt_animal = dt
             animal = shape["animal"]
             status = self.animal_states[animal_id]
 
@@ -252,7 +364,7 @@ class AnimalAI:
 
             # Handle active timers
             if status.timer > 0:
-                status.timer = max(0, status.timer - dt)
+                status.timer = max(0, status.timer - dt_animal)
                 # for migration, update target position if we have a target entity
                 if status.state == AnimalState.MIGRATING and status.target_entity and any(status.target_entity is e for e,_ in status.memory["same_species"]):
                     status.target = animal.target = status.target_entity.position
@@ -266,13 +378,14 @@ class AnimalAI:
                             self.board.ponds.remove(status.target_entity)
                     case AnimalState.EATING:
                         if animal.consume(status.target_entity):
+                            self.board.events.emit(Eaten(status.target_entity, animal))
                             print(f"{animal_id} ate {status.target_entity.__class__.__name__} #{getattr(status.target_entity, 'animal_id', getattr(status.target_entity, 'plant_id', 'Unknown'))}")
                         elif status.target_entity in self.board.animals:
                             self.board.animals.remove(status.target_entity)
                         elif status.target_entity in self.board.plants:
                             self.board.plants.remove(status.target_entity)
                     case AnimalState.REPRODUCING:
-                        offspring = animal.reproduce(status.target_entity, len(self.board.animals)+1)
+                        offspring = animal.reproduce(status.target_entity, self.board.population.next_id())
                         if offspring is not None:
                             print(f"{animal_id} reproduced with {status.target_entity.__class__.__name__} #{status.target_entity.animal_id}")
                             # animal cooldown
@@ -281,7 +394,7 @@ class AnimalAI:
                             mate_status = self.animal_states[status.target_entity.animal_id]
                             mate_status.reproduction_cooldown = REPRODUCTION_COOLDOWN
                             self.board.animals.append(offspring)
-                            self.animal_states[offspring.animal_id] = AnimalStatus()
+                            self.animal_states[offspring.animal_id] = AnimalStatus(rng=self.rng)
                 self._next_state(animal_id)
                 continue
 
@@ -364,7 +477,7 @@ class AnimalAI:
             case AnimalState.SEEKING_MATE:
                 potential_mates = [
                     e for e, _ in status.memory["same_species"]
-                    if e.is_adult() and self.animal_states.get(e.animal_id, AnimalStatus()).reproduction_cooldown <= 0
+                    if e.is_adult() and (mate := self.animal_states.get(e.animal_id)) is not None and mate.reproduction_cooldown <= 0
                 ]
                 closest = min(
                     potential_mates,
@@ -378,7 +491,7 @@ class AnimalAI:
                     leader = max(status.memory["same_species"], key=lambda e: e[0].age)[0]
                     direction = leader.position - animal.position
                     if direction.length_squared() > 0:
-                        migration_distance = min(direction.length(), random.uniform(5.0, 10.0))
+                        migration_distance = min(direction.length(), self.rng.uniform(5.0, 10.0))
                         direction = direction.normalize() * migration_distance
                     board_margin = 2.0
                     target_pos = Vector2(
@@ -391,18 +504,20 @@ class AnimalAI:
             case AnimalState.WANDER:
                 if status.memory["same_species"]:
                     leader = max(status.memory["same_species"], key=lambda e: e[0].age)[0]
-                    offset = Vector2(random.uniform(-3, 3), random.uniform(-3, 3))  # stay near leader
+                    offset = Vector2(self.rng.uniform(-3, 3), self.rng.uniform(-3, 3))  # stay near leader
                     status.target = leader.position + offset
                 else:
-                    distance = random.uniform(MIN_WANDER_DISTANCE, MAX_WANDER_DISTANCE)
-                    angle = random.uniform(0, 2 * math.pi)
+                    distance = self.rng.uniform(MIN_WANDER_DISTANCE, MAX_WANDER_DISTANCE)
+                    angle = self.rng.uniform(0, 2 * math.pi)
                     status.target = Vector2(
                         animal.position.x + distance * math.cos(angle),
                         animal.position.y + distance * math.sin(angle)
                     )
         animal.speed = status.state.speed
-        status.timer = status.state.time
+        status.timer = status.state.duration(self.rng)
         if status.target: animal.target = status.target
+        if self.scheduler is not None:
+            self.scheduler.state_changed(animal_id)
 
     def render(
             self, 
@@ -411,16 +526,22 @@ class AnimalAI:
             offset_y: float, 
             tile_size: int, 
             min_x: int, 
-            min_y: int
+            min_y: int,
+            texts: TextCache | None = None
         ) -> None:
+        if self.label is None:
+            self.label = font.SysFont(None, LABEL_FONT_SIZE, bold=True)
+            self.state_label = font.SysFont(None, int(LABEL_FONT_SIZE*2/3), bold=True)
+        if texts is None:
+            if self.texts is None:
+                from my_safari_project.view.text_cache import TextCache
+                self.texts = TextCache()
+            texts = self.texts
         half_tile = tile_size // 2
-        # rendering text with outline
-        def render_text(text, font, color, center_pos):
-            text_surf = font.render(text, True, color)
-            text_rect = text_surf.get_rect(center=center_pos)
-            for dx, dy in [(-1,0), (1,0), (0,-1), (0,1)]:
-                surface.blit(font.render(text, True, (0, 0, 0)), text_rect.move(dx, dy))
-            surface.blit(text_surf, text_rect)
+        # rendering text with outline (composed once per string by the cache)
+        def render_text(text, label_font, color, center_pos):
+            text_surf = texts.get(label_font, text, color, outline=(0, 0, 0))
+            surface.blit(text_surf, text_surf.get_rect(center=center_pos))
         # FIRST PASS: draw detection circles
         for animal_id, shape in self.collision_shapes.items():
             pos = shape["position"]
@@ -4,8 +4,10 @@ import random
 from enum import Enum
 import json
 import os
+from collections import Counter
+from typing import Callable
 
-from my_safari_project.audio import play_jeep_start
+from my_safari_project.audio import AudioManager, play_jeep_start, play_jeep_crash
 from my_safari_project.model.jeep import Jeep
 from pygame.math import Vector2
 
@@ -21,10 +23,15 @@ from my_safari_project.model.tourist import Tourist
 from my_safari_project.model.road import Road, RoadType
 from my_safari_project.model.plant import Plant
 from my_safari_project.model.pond import Pond
+from my_safari_project.model.events import EVENT_TYPES, JeepCrashed
 
 
 # Control
 from my_safari_project.control.wildlife_ai import WildlifeAI
+from my_safari_project.control.replay import ReplayLog
+from my_safari_project.control.profiler import profiler
+from my_safari_project.control.agent_pipeline import AgentPipeline
+from my_safari_project.control.ai_scheduler import AIScheduler
 
 # -----------------------------------------------------------
 # Enums / Simple Classes to Mimic UML or Basic Features
@@ -80,11 +87,22 @@ ZEBRA_COST    = 130
 CHIP_COST = 50
 
 
+# Fixed simulation step (game seconds) and the most substeps one rendered
+# frame may run before the remaining backlog is dropped.
+SIM_STEP = 0.02
+MAX_SUBSTEPS = 64
+
 # -----------------------------------------------------------
 # Main GameController
 # -----------------------------------------------------------
 class GameController:
-    def __init__(self, difficulty: DifficultyLevel):
+    def __init__(self, difficulty: DifficultyLevel, headless: bool = False,
+                 feedback_sink: Callable[[str], None] | None = None,
+                 vectorized: bool = False, seed: int | None = None, lod: bool = False):
+        # ─── randomness: one seeded stream per simulation, so any run can be replayed
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+
         # ─── bookkeeping for difficulty ───────────────────────────
         self.difficulty = difficulty
         init_balance, self._poacher_ivl, self._max_poachers = [
@@ -102,22 +120,51 @@ class GameController:
         self.won = self.lost = False
 
         # ─── MODEL ────────────────────────────────────────────────
-        self.board: Board = Board(100, 100, n_roads=5, n_jeeps=10)
+        self.board: Board = Board(100, 100, n_roads=5, n_jeeps=10, rng=self.rng)
         self.capital: Capital = Capital(init_balance)
         self.timer: Timer = Timer()
         self.running = True
+        self.tick = 0           # fixed simulation steps taken so far
+        self.replay_log = ReplayLog(self.seed, difficulty.name)
 
         # ─── VIEW ────────────────────────────────────────────────
-        # Note: all camera/zoom setup now lives in GameGUI, not here
-        from my_safari_project.view.gamegui import GameGUI
-        self.game_gui = GameGUI(self)
+        # Note: all camera/zoom setup now lives in GameGUI, not here.
+        # Headless runs (servers, CI, balancing) skip the display, fonts and audio
+        # and hand player feedback to <feedback_sink> instead.
+        self.headless = headless
+        self.game_gui = None
+        if headless:
+            AudioManager().music_enabled = False
+            AudioManager().sfx_enabled = False
+            self._feedback_sink = feedback_sink or (lambda msg: None)
+        else:
+            from my_safari_project.view.gamegui import GameGUI
+            self.game_gui = GameGUI(self)
+            self._feedback_sink = feedback_sink or self.game_gui._feedback
 
         # ─── AI / helpers ────────────────────────────────────────
-        self.wildlife_ai = WildlifeAI(self.board, self.capital, feedback_callback=self.game_gui._feedback)
+        # <lod> staggers animal decisions (control/ai_scheduler.py); in the GUI the
+        # schedule follows the camera, so only headless LOD runs replay exactly
+        self.wildlife_ai = WildlifeAI(self.board, self.capital, feedback_callback=self._feedback,
+                                      vectorized=vectorized, scheduler=AIScheduler() if lod else None)
         self._poacher_timer = 0.0
 
+        # ─── one ordered pass over every agent per tick ──────────
+        self.pipeline = AgentPipeline("sim")
+        self.pipeline.register("jeeps", self._update_jeeps)
+        self.wildlife_ai.register_phases(self.pipeline)
+        self.pipeline.register("poacher_quota", self._spawn_poachers, after="poacher_spawns")
+        self.pipeline.register("animal_moves", self.wildlife_ai.animal_ai.move_animals)
+
+        # ─── game events (dispatched at the end of every step) ───
+        self.event_counts: Counter = Counter()      # event kind -> occurrences
+        for event_type in EVENT_TYPES:
+            self.board.events.subscribe(event_type, self._count_event)
+        self.board.events.subscribe(JeepCrashed, self._on_jeep_crash)
+
         #new timespeed
         self.time_multiplier: float = 1.0 
+        self._sim_acc = 0.0     # game seconds not yet simulated
 
         self.visible_animals_night = set()
         self.board.visible_animals_night = self.visible_animals_night
@@ -125,24 +172,83 @@ class GameController:
         self.last_month_check = 0
 
 
-    def run(self):
-        """Main loop."""
-        while self.running:
-            dt = self.timer.tick(self.time_multiplier)  # scaled dt from Timer
-            dt = min(dt, 0.02 * max(self.time_multiplier, 1.0))
-            self._update_sim(dt)
-            self.game_gui.update(dt)
+    def run(self, record_to: str | None = None):
+        """
+        Main loop. The model always advances in SIM_STEP increments, so results
+        do not depend on the frame rate; higher speeds just run more substeps
+        per frame, and the view interpolates between the last two states.
+        With <record_to> the session's replay log is written there on exit,
+        including when the window is closed.
+        """
+        try:
+            while self.running:
+                frame_dt = self.timer.frame() * self.time_multiplier
+                alpha = self.advance_frame(frame_dt)
+                self.game_gui.update(frame_dt, alpha=alpha)
+        finally:
+            if record_to:
+                self.replay_log.save(record_to)
         self.game_gui.exit()
 
+    def advance_frame(self, frame_dt: float) -> float:
+        """
+        Run as many fixed SIM_STEP substeps as <frame_dt> game seconds allow
+        (at most MAX_SUBSTEPS) and return the leftover as a fraction of a step.
+        """
+        self._sim_acc += frame_dt
+        steps = int(self._sim_acc / SIM_STEP)
+        if steps > MAX_SUBSTEPS:                   # can't keep up: drop the backlog
+            steps, self._sim_acc = MAX_SUBSTEPS, MAX_SUBSTEPS * SIM_STEP
+        for i in range(steps):
+            if i == steps - 1 and self.game_gui is not None:
+                self.game_gui.board_gui.snapshot_positions()
+            self.step()
+        self._sim_acc -= steps * SIM_STEP
+        return self._sim_acc / SIM_STEP
+
+    def simulate(self, seconds: float, dt: float = 0.1):
+        """Advance the model by <seconds> of game time in fixed <dt> steps, without a view."""
+        end = self.timer.elapsed_seconds + seconds
+        while self.running and self.timer.elapsed_seconds < end:
+            self.step(min(dt, end - self.timer.elapsed_seconds))
+
+    def step(self, dt: float = SIM_STEP):
+        """Advance the model by one simulation step."""
+        self.replay_log.record_step(self.tick, dt)
+        self.timer.advance(dt)
+        with profiler.section("sim"):
+            self._update_sim(dt)
+        with profiler.section("events"):
+            self.board.events.flush()
+        self.tick += 1
+        self.replay_log.end_tick = self.tick
+
+    def _feedback(self, msg: str):
+        self._feedback_sink(msg)
+
+    def _count_event(self, event):
+        self.event_counts[event.kind] += 1
+
+    def _on_jeep_crash(self, event: JeepCrashed):
+        play_jeep_crash()
+        self._feedback("Jeep crash! Passengers are now on foot.")
+
     def handle_chip_click(self, world_pos: Vector2) -> bool:
-        animal_clicked = self.game_gui.board_gui.get_animal_at(world_pos)
+        """Tag the living animal nearest to <world_pos> (within a tile) with a light chip."""
+        self._record("handle_chip_click", world_pos=world_pos)
+        animal_clicked = min(
+            (a for a in self.board.animals
+             if a.is_alive and a.position.distance_to(world_pos) < 1.0),
+            key=lambda a: a.position.distance_to(world_pos),
+            default=None
+        )
         if animal_clicked:
             self.visible_animals_night.add(animal_clicked.animal_id)
             self.chip_placement_mode = False
-            self.game_gui._feedback(f"Animal #{animal_clicked.animal_id} tagged!")
+            self._feedback(f"Animal #{animal_clicked.animal_id} tagged!")
             return True
         else:
-            self.game_gui._feedback("No animal at clicked location.")
+            self._feedback("No animal at clicked location.")
             return False
 
 
@@ -156,35 +262,69 @@ class GameController:
             self.last_month_check = current_month
             self._check_win_conditions()
 
-        # 1) advance jeeps (and their yield logic) + Wildlife AI
-        self.board.update(dt, now)
-        self.wildlife_ai.update(dt)
+        # jeeps, poachers, rangers, animals, tourists: each stepped once, in order
+        self.pipeline.step(dt)
+
+    def _update_jeeps(self, dt: float):
+        # jeeps (and their yield logic) live on the board
+        self.board.update(dt, self.timer.elapsed_seconds)
 
-        # 2) spawn & move poachers, animals
+    def _spawn_poachers(self, dt: float):
+        # difficulty-dependent poacher pressure, capped at _max_poachers
         if len(self.board.poachers) < self._max_poachers:
             self._poacher_timer += dt
             if self._poacher_timer >= self._poacher_ivl:
                 self._poacher_timer = 0.0
                 self.spawn_poacher()
 
-        for p in self.board.poachers:
-            p.update(dt, self.board)
-        for a in self.board.animals:
-            a.update(dt, self.board)
 
-        # 3) rangers
-        for r in self.board.rangers:
-            result = r.update(dt, self.board)
-            if result == "poacher_eliminated":
-                self.capital.addFunds(50)
-                self.game_gui._feedback("Poacher eliminated! +$50")
+    # ───────────────────────── Player Commands ───────────────────────────
+    # Everything the player can change goes through these so it ends up in
+    # the replay log (see control/replay.py).
+    def _record(self, cmd: str, **args):
+        self.replay_log.record(self.tick, self.timer.elapsed_seconds, cmd, **args)
+
+    def set_speed(self, multiplier: float):
+        self._record("set_speed", multiplier=multiplier)
+        self.time_multiplier = multiplier
 
+    def buy_item(self, name: str, cost: float, tile: Vector2 | None = None) -> bool:
+        """Pay for a shop item and place it (on <tile> or a random one)."""
+        self._record("buy_item", name=name, cost=cost, tile=tile)
+        if not self.capital.deductFunds(cost):
+            return False
+        match name:
+            case "Ranger":     self.spawn_ranger(tile)
+            case "Plant":      self.spawn_plant(tile)
+            case "Pond":       self.spawn_pond(tile)
+            case "Light Chip": self.enter_chip_mode()
+            case _:            self.spawn_animal(name.upper(), tile)
+        return True
+
+    def send_ranger(self, poacher_index: int) -> Ranger | None:
+        """Send the ranger nearest to board.poachers[<poacher_index>] after it."""
+        self._record("send_ranger", poacher_index=poacher_index)
+        if not 0 <= poacher_index < len(self.board.poachers) or not self.board.rangers:
+            return None
+        poacher = self.board.poachers[poacher_index]
+        nearest = min(self.board.rangers, key=lambda r: r.position.distance_to(poacher.position))
+        nearest.set_target(poacher.position)
+        nearest.assigned_poacher = poacher
+        return nearest
+
+    def place_road(self, x: int, y: int, road_type: str) -> bool:
+        """Lay a road segment starting at (x, y) for $10."""
+        self._record("place_road", x=x, y=y, road_type=road_type)
+        if self.capital.getBalance() < 10 or not self.board.add_road_segment(x, y, road_type):
+            return False
+        self.capital.deductFunds(10)
+        return True
 
     # ───────────────────────── Spawning Helpers ──────────────────────────
     def _random_tile(self):
         return Vector2(
-            random.randint(0, self.board.width - 1),
-            random.randint(0, self.board.height - 1)
+            self.rng.randint(0, self.board.width - 1),
+            self.rng.randint(0, self.board.height - 1)
         )
 
     def spawn_ranger(self, position: Vector2 | None = None):
@@ -219,20 +359,19 @@ class GameController:
 
 
     def spawn_animal(self, species_name: str, position: Vector2 | None = None):
-        import random
         from my_safari_project.model.animal    import AnimalSpecies
         from my_safari_project.model.carnivore import Carnivore
         from my_safari_project.model.herbivore import Herbivore
 
         props = {
-            AnimalSpecies.HYENA:    (Carnivore, 1.5,  60, random.randint(5,  8)),
-            AnimalSpecies.LION:     (Carnivore, 1.8, 150, random.randint(10, 15)),
-            AnimalSpecies.TIGER:    (Carnivore, 2.0, 180, random.randint(8, 12)),
-            AnimalSpecies.BUFFALO:  (Herbivore, 1.2, 100, random.randint(7, 10)),
-            AnimalSpecies.ELEPHANT: (Herbivore, 0.8, 300, random.randint(18,25)),
-            AnimalSpecies.GIRAFFE:  (Herbivore, 1.4, 150, random.randint(13,18)),
-            AnimalSpecies.HIPPO:    (Herbivore, 0.9, 175, random.randint(15,22)),
-            AnimalSpecies.ZEBRA:    (Herbivore, 1.7, 130, random.randint(6, 9))
+            AnimalSpecies.HYENA:    (Carnivore, 1.5,  60, self.rng.randint(5,  8)),
+            AnimalSpecies.LION:     (Carnivore, 1.8, 150, self.rng.randint(10, 15)),
+            AnimalSpecies.TIGER:    (Carnivore, 2.0, 180, self.rng.randint(8, 12)),
+            AnimalSpecies.BUFFALO:  (Herbivore, 1.2, 100, self.rng.randint(7, 10)),
+            AnimalSpecies.ELEPHANT: (Herbivore, 0.8, 300, self.rng.randint(18,25)),
+            AnimalSpecies.GIRAFFE:  (Herbivore, 1.4, 150, self.rng.randint(13,18)),
+            AnimalSpecies.HIPPO:    (Herbivore, 0.9, 175, self.rng.randint(15,22)),
+            AnimalSpecies.ZEBRA:    (Herbivore, 1.7, 130, self.rng.randint(6, 9))
         }
         try:
             species = getattr(AnimalSpecies, species_name.upper())
@@ -241,7 +380,7 @@ class GameController:
             tx, ty = int(pos.x), int(pos.y)
 
             animal = cls(
-            animal_id = len(self.board.animals)+1,
+            animal_id = self.board.population.next_id(),
             species   = species,
             position  = pos,
             speed     = spd,
@@ -257,7 +396,7 @@ class GameController:
     def spawn_poacher(self):
         pid = len(self.board.poachers) + 1
         p   = Poacher(pid, f"P{pid}", position=self._random_tile())
-        p.choose_random_target(self.board.width, self.board.height)
+        p.choose_random_target(self.board.width, self.board.height, self.rng)
         self.board.poachers.append(p)
         # tx, ty = int(p.position.x), int(p.position.y)
         # self.board.fields[ty][tx].add_object(p)
@@ -286,14 +425,8 @@ class GameController:
             j for j in self.board.jeeps
             if not j.is_available and j.current_passengers == 0
         ])
-        herbivores = len([
-            a for a in self.board.animals
-            if a.__class__.__name__ == "Herbivore" and a.is_alive
-        ])
-        carnivores = len([
-            a for a in self.board.animals
-            if a.__class__.__name__ == "Carnivore" and a.is_alive
-        ])
+        herbivores = self.board.population.herbivores
+        carnivores = self.board.population.carnivores
         capital    = self.capital.getBalance()
 
         if (visitors   >= self.visits_req and
@@ -314,15 +447,15 @@ class GameController:
     def _check_win_conditions(self):
         """Check monthly win conditions"""
         visitors = len(self.board.tourists) + len(self.board.waiting_tourists)
-        herbivores = len([a for a in self.board.animals if a.__class__.__name__ == "Herbivore" and a.is_alive])
-        carnivores = len([a for a in self.board.animals if a.__class__.__name__ == "Carnivore" and a.is_alive])
+        herbivores = self.board.population.herbivores
+        carnivores = self.board.population.carnivores
         capital = self.capital.getBalance()
         if (visitors >= self.visits_req and herbivores >= self.herb_req and 
             carnivores >= self.carn_req and capital >= self.cap_req):
             self.consec_success += 1
             if self.consec_success >= self.months_needed:
                 self.won = True
-                self.game_gui._feedback(f"VICTORY! Completed {self.months_needed} consecutive months!")
+                self._feedback(f"VICTORY! Completed {self.months_needed} consecutive months!")
                 self.pause_game()
         else:
             self.consec_success = 0
@@ -338,17 +471,17 @@ class GameController:
     
     def enter_chip_mode(self):
         self.chip_placement_mode = True
-        self.game_gui._feedback("Click an animal to tag with chip")
+        self._feedback("Click an animal to tag with chip")
 
     # ────────────────────────── jeep shop helper ─────────────────────────
     def try_spawn_jeep(self, world_click: Vector2) -> bool:
+        self._record("try_spawn_jeep", world_click=world_click)
         if not self.capital.deductFunds(50):
             return False                                  # not enough money
 
         click_tile = Vector2(int(world_click.x), int(world_click.y))
         # find exact road tile at that integer position
-        roads_here = [r for r in self.board.roads if r.pos == click_tile]
-        if not roads_here:
+        if not self.board.has_road(click_tile.x, click_tile.y):
             self.capital.addFunds(50)                     # refund
             return False                                  # not on a road
 
@@ -439,7 +572,11 @@ class GameController:
 
     def load_game(self, file_path: str):
         with open(file_path, "r") as f:
-            data = json.load(f)
+            self.restore_save(json.load(f))
+
+    def restore_save(self, data: dict):
+        """Replace the game state with a save_game() dict (recorded, so replays start from it too)."""
+        self._record("restore_save", data=data)
 
          # Load difficulty
         self.difficulty = DifficultyLevel[data.get("difficulty", "NORMAL")]
@@ -450,7 +587,8 @@ class GameController:
         self.months_needed = self.difficulty.required_months
         
         self.timer.elapsed_seconds = data["time"]
-        self.capital = Capital(data["capital"])
+        # set in place: WildlifeAI and TouristAI pay bounties and rewards into this object
+        self.capital.setBalance(data["capital"])
 
         self.board.animals.clear()
         for ad in data["animals"]:
@@ -0,0 +1,139 @@
+# my_safari_project/control/profiler.py
+"""
+Per-subsystem tick profiler.
+
+Code under measurement either wraps a block in `profiler.section(name)` or,
+for a sequence of steps such as render layers, takes `t = profiler.mark()`
+and then `t = profiler.lap(name, t)` after each step. Every section keeps
+a rolling window of its last timings plus a total call count.
+
+The profiler is off by default; while off, `section` hands back a shared
+no-op context and `mark`/`lap` return immediately, so instrumented code
+pays one attribute check per call.
+"""
+
+from __future__ import annotations
+import csv
+import json
+import os
+from collections import deque
+from time import perf_counter
+from typing import Deque, Dict, List
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullSection()
+
+
+class SectionStats:
+    __slots__ = ("name", "calls", "samples")
+
+    def __init__(self, name: str, window: int):
+        self.name = name
+        self.calls = 0
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        self.calls += 1
+        self.samples.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        s = self.samples
+        n = len(s)
+        return {
+            "section": self.name,
+            "calls":   self.calls,
+            "last_ms": s[-1] * 1000 if n else 0.0,
+            "mean_ms": sum(s) / n * 1000 if n else 0.0,
+            "max_ms":  max(s) * 1000 if n else 0.0,
+        }
+
+
+class _Section:
+    __slots__ = ("stats", "start")
+
+    def __init__(self, stats: SectionStats):
+        self.stats = stats
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats.add(perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    FIELDS = ("section", "calls", "last_ms", "mean_ms", "max_ms")
+
+    def __init__(self, window: int = 120):
+        self.window = window            # samples kept per section
+        self.enabled = False
+        self._stats: Dict[str, SectionStats] = {}
+
+    def _get(self, name: str) -> SectionStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = SectionStats(name, self.window)
+        return stats
+
+    # ── switching ─────────────────────────────────────────────────────
+    def toggle(self) -> bool:
+        self.enabled = not self.enabled
+        return self.enabled
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+    # ── measuring ─────────────────────────────────────────────────────
+    def section(self, name: str):
+        """Context manager timing the enclosed block as <name>."""
+        if not self.enabled:
+            return _NULL
+        return _Section(self._get(name))
+
+    def mark(self) -> float:
+        """Start a sequence of laps; pass the result to the first lap()."""
+        return perf_counter() if self.enabled else 0.0
+
+    def lap(self, name: str, since: float) -> float:
+        """Record the time from <since> until now as <name>; returns now."""
+        if not self.enabled:
+            return 0.0
+        now = perf_counter()
+        if since:
+            self._get(name).add(now - since)
+        return now
+
+    # ── reporting ─────────────────────────────────────────────────────
+    def summary(self) -> List[Dict[str, float]]:
+        """One row per section, in the order sections were first seen."""
+        return [stats.summary() for stats in self._stats.values()]
+
+    def export(self, file_path: str) -> None:
+        """Write the summary as JSON (for .json paths) or CSV (anything else)."""
+        folder = os.path.dirname(file_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        rows = self.summary()
+        with open(file_path, "w", newline="") as f:
+            if file_path.endswith(".json"):
+                json.dump({"window": self.window, "sections": rows}, f, indent=1)
+            else:
+                writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+                writer.writeheader()
+                writer.writerows(rows)
+
+
+# Shared by the controller, the AIs and the views
+profiler = Profiler()
@@ -0,0 +1,99 @@
+# my_safari_project/control/replay.py
+"""
+Record/replay of player commands.
+
+A session is fully determined by its RNG seed, its difficulty and the
+player commands issued between simulation steps. GameController records
+every command into a ReplayLog stamped with the step count (`tick`) it was
+issued at; `replay()` rebuilds the controller headlessly and re-issues the
+commands at the same ticks, reproducing the session bit-for-bit. Loading
+a save is a command too (`restore_save`, carrying the save's contents), so
+sessions that start from a save replay from it. Ticks
+count simulation steps; the log also keeps how long each step was, since
+GameController.run() takes SIM_STEP steps but simulate() takes its own.
+"""
+
+from __future__ import annotations
+import json
+from typing import Any, Dict, List, TYPE_CHECKING
+from pygame.math import Vector2
+
+if TYPE_CHECKING:
+    from my_safari_project.control.game_controller import GameController
+
+
+class ReplayLog:
+    def __init__(self, seed: int, difficulty: str):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.commands: List[Dict[str, Any]] = []
+        self.steps: List[List[float]] = []      # [tick, dt]: from <tick> on, steps last dt
+        self.end_tick = 0
+
+    def record(self, tick: int, time: float, cmd: str, **args) -> None:
+        args = {k: [v.x, v.y] if isinstance(v, Vector2) else v for k, v in args.items()}
+        self.commands.append({"tick": tick, "time": time, "cmd": cmd, "args": args})
+
+    def record_step(self, tick: int, dt: float) -> None:
+        """Step <tick> lasted <dt> game seconds (stored only when the length changes)."""
+        if not self.steps or self.steps[-1][1] != dt:
+            self.steps.append([tick, dt])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"seed": self.seed, "difficulty": self.difficulty,
+                "end_tick": self.end_tick, "steps": self.steps, "commands": self.commands}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReplayLog":
+        log = cls(data["seed"], data["difficulty"])
+        log.commands = list(data.get("commands", []))
+        log.steps = [list(step) for step in data.get("steps", [])]
+        log.end_tick = data.get("end_tick", 0)
+        return log
+
+    def save(self, file_path: str) -> None:
+        with open(file_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+    @classmethod
+    def load(cls, file_path: str) -> "ReplayLog":
+        with open(file_path, "r") as f:
+            return cls.from_dict(json.load(f))
+
+
+# commands whose arguments carry a board position
+_POSITION_ARGS = ("tile", "world_click", "world_pos")
+
+
+def apply_command(controller: "GameController", command: Dict[str, Any]) -> Any:
+    args = dict(command["args"])
+    for key in _POSITION_ARGS:
+        if args.get(key) is not None:
+            args[key] = Vector2(args[key])
+    return getattr(controller, command["cmd"])(**args)
+
+
+def replay(log: ReplayLog, until_tick: int | None = None, **controller_kwargs) -> "GameController":
+    """Re-run <log> headlessly up to <until_tick> (default: where recording stopped)."""
+    from my_safari_project.control.game_controller import DifficultyLevel, GameController, SIM_STEP
+
+    controller = GameController(DifficultyLevel[log.difficulty], headless=True,
+                                seed=log.seed, **controller_kwargs)
+    steps = log.steps or [[0, SIM_STEP]]    # logs without step lengths came from run()
+    current = 0
+
+    def advance_to(tick: int) -> None:
+        nonlocal current
+        while controller.tick < tick:
+            while current + 1 < len(steps) and steps[current + 1][0] <= controller.tick:
+                current += 1
+            controller.step(steps[current][1])
+
+    end = log.end_tick if until_tick is None else until_tick
+    for command in log.commands:
+        if command["tick"] > end:
+            break
+        advance_to(command["tick"])
+        apply_command(controller, command)
+    advance_to(end)
+    return controller
@@ -0,0 +1,62 @@
+# my_safari_project/control/sighting.py
+"""
+Batched animal sightings for tourists.
+
+Instead of every tourist scanning every animal (Tourist.detect_animals),
+TouristAI registers each observing tourist with `watch()` right after
+updating it, and `resolve()` then answers all of them with one query of
+the board's spatial index per distinct observer position: passengers of a jeep share the
+jeep's position, so a jeep costs one query however full it is, and each
+walking tourist costs one. The ids seen from a position are added to the
+`seen_animals` set of every tourist standing there.
+
+The result is the same as calling detect_animals for each tourist at the
+moment it was watched, since animals do not move while tourists update.
+The index is the one AnimalAI refreshes each tick (board.spatial); the
+animals phase keeps it current for the moves it makes after the refresh.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Tuple, TYPE_CHECKING
+from pygame.math import Vector2
+
+if TYPE_CHECKING:
+    from my_safari_project.model.board import Board
+    from my_safari_project.model.tourist import Tourist
+
+SIGHTING_RADIUS = 5.0   # tiles a tourist can spot an animal from
+
+
+class SightingEngine:
+    def __init__(self, radius: float = SIGHTING_RADIUS):
+        self.radius = radius
+        # (x, y) -> (observer position, tourists standing there)
+        self._observers: Dict[Tuple[float, float], Tuple[Vector2, List["Tourist"]]] = {}
+
+    def watch(self, tourist: "Tourist") -> None:
+        """Have <tourist> look around from where it stands now (not while exiting)."""
+        if tourist.movement_state == "exiting":
+            return
+        pos = tourist.position
+        entry = self._observers.get((pos.x, pos.y))
+        if entry is None:
+            self._observers[(pos.x, pos.y)] = (Vector2(pos), [tourist])
+        else:
+            entry[1].append(tourist)
+
+    def resolve(self, board: "Board") -> int:
+        """Record what every watching tourist sees; returns the number of queries run."""
+        observers = self._observers
+        if not observers:
+            return 0
+        spatial, radius = board.spatial, self.radius
+        for pos, tourists in observers.values():
+            # the index drops animals that died since its last refresh only then
+            seen = {a.animal_id for a in spatial.query("animal", pos, radius)
+                    if a.is_alive and pos.distance_to(a.position) <= radius}
+            if seen:
+                for tourist in tourists:
+                    tourist.seen_animals |= seen
+        queries = len(observers)
+        observers.clear()
+        return queries
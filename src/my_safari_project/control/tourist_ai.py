@@ -2,7 +2,8 @@
 from typing import Optional
 from pygame.math import Vector2
 from my_safari_project.model.tourist import Tourist
-import random
+from my_safari_project.model.events import TouristDone
+from my_safari_project.control.sighting import SightingEngine
 
 
 class TouristAI:
@@ -14,6 +15,8 @@ class TouristAI:
         self._min_tourist_interval = 3.0    # Minimum interval with many animals
         self._next_tourist_id = 1
         self._feedback = feedback_callback
+        self.sightings = SightingEngine()
+        board.events.subscribe(TouristDone, self._on_tourist_done)
 
     def update(self, dt: float):
         # Calculate dynamic spawn interval based on animals
@@ -29,7 +32,7 @@ class TouristAI:
 
         for tourist in self.board.tourists[:]:
             tourist.update(dt, self.board)
-            tourist.detect_animals(self.board.animals, 5.0)
+            self.sightings.watch(tourist)
 
             if tourist.in_jeep and tourist.in_jeep.at_path_end():
                 tourist.exit_jeep()
@@ -40,24 +43,23 @@ class TouristAI:
                 self.board.tourists.remove(tourist)
                 if tourist in self.board.waiting_tourists:
                     self.board.waiting_tourists.remove(tourist)
-                if self._feedback:
-                    self._feedback(f"Tourist#{tourist.id} saw {len(tourist.seen_animals)} animals → ${reward}")
+                self.board.events.emit(TouristDone(tourist, reward))
+
+        # one spatial query per jeep / walking tourist instead of a scan per tourist
+        self.sightings.resolve(self.board)
+
+    def _on_tourist_done(self, event: TouristDone):
+        if self._feedback:
+            self._feedback(f"Tourist#{event.tourist.id} saw {len(event.tourist.seen_animals)} animals → ${event.reward}")
 
     def _calculate_spawn_interval(self) -> float:
         if not self.board.animals:
             return self._base_tourist_interval
         
-        # Count animals by type
-        carnivore_count = 0
-        herbivore_count = 0
-        
-        for animal in self.board.animals:
-            if animal.is_alive:
-                # Assuming species enum values: 0-2 are carnivores, 3-7 are herbivores
-                if animal.species.value <= 2:  # hyena, lion, tiger
-                    carnivore_count += 1
-                else:  # buffalo, elephant, giraffe, hippo, zebra
-                    herbivore_count += 1
+        # Count animals by type (species enum values 0-2 are carnivores, 3-7 herbivores)
+        counts = self.board.population.species
+        carnivore_count = sum(n for sp, n in counts.items() if sp.value <= 2)   # hyena, lion, tiger
+        herbivore_count = sum(counts.values()) - carnivore_count               # buffalo, elephant, giraffe, hippo, zebra
         
         # Calculate attraction score
         attraction_score = carnivore_count * 2 + herbivore_count * 1
@@ -76,12 +78,7 @@ class TouristAI:
             return 1
         
         # Count unique species
-        unique_species = set()
-        for animal in self.board.animals:
-            if animal.is_alive:
-                unique_species.add(animal.species.value)
-        
-        species_count = len(unique_species)
+        species_count = self.board.population.species_present()
         
         # More species diversity = larger batches
         if species_count >= 6:
@@ -101,7 +98,7 @@ class TouristAI:
         # Spawn multiple tourists per batch
         for _ in range(batch_size):
             # Pick a random entrance for each tourist
-            entrance = random.choice(self.board.entrances)
+            entrance = self.board.rng.choice(self.board.entrances)
             tourist = Tourist(self._next_tourist_id, Vector2(entrance), board=self.board)
             self._next_tourist_id += 1
 
@@ -114,7 +111,7 @@ class TouristAI:
 
     def _try_assign_tourist_to_jeep(self, tourist: Tourist) -> bool:
         available_jeeps = self.board.jeeps[:]
-        random.shuffle(available_jeeps)
+        self.board.rng.shuffle(available_jeeps)
         
         for jeep in available_jeeps:
             # Check if jeep has space and is not at path end
@@ -1,15 +1,17 @@
 from __future__ import annotations
 from pygame.math import Vector2
 from typing import TYPE_CHECKING
-import random
 from my_safari_project.model.tourist import Tourist
 from my_safari_project.model.jeep import Jeep
 from my_safari_project.control.animal_ai import DETECTION_RADIUS
 
 
-from my_safari_project.model.poacher import Poacher
+from my_safari_project.model.poacher import Poacher, poacher_watchers
 from my_safari_project.control.animal_ai import AnimalAI
+from my_safari_project.control.ai_scheduler import AIScheduler
 from my_safari_project.control.tourist_ai import TouristAI
+from my_safari_project.control.agent_pipeline import AgentPipeline
+from my_safari_project.model.events import Captured, Died
 
 if TYPE_CHECKING:
     from my_safari_project.model.board import Board
@@ -24,12 +26,13 @@ THIRST_THRESHOLD = 7    # when animal seeks wate
 class WildlifeAI:
     """Keeps Rangers & Poachers moving + interactions."""
 
-    def __init__(self, board: Board, capital: Capital, feedback_callback=None):
+    def __init__(self, board: Board, capital: Capital, feedback_callback=None, vectorized: bool = False,
+                 scheduler: AIScheduler | None = None):
         self.board = board
         self.capital = capital
         self._poacher_timer = 0.0
 
-        self.animal_ai = AnimalAI(board)
+        self.animal_ai = AnimalAI(board, vectorized=vectorized, scheduler=scheduler)
         self.board.wildlife_ai = self
 
         self._feedback = feedback_callback
@@ -39,33 +42,58 @@ class WildlifeAI:
 
         self.tourist_ai = TouristAI(board, capital, feedback_callback)
 
+        board.events.subscribe(Died, self._on_died)
+        board.events.subscribe(Captured, self._on_captured)
 
+        # standalone use; GameController registers the same phases into its own pipeline
+        self.pipeline = AgentPipeline("wildlife")
+        self.register_phases(self.pipeline)
+
+    def register_phases(self, pipeline: AgentPipeline) -> None:
+        pipeline.register("poacher_spawns", self._spawn_poachers)
+        pipeline.register("poachers", self._update_poachers)
+        pipeline.register("rangers", self._update_rangers)
+        pipeline.register("animals", self.animal_ai.update)
+        pipeline.register("tourists", self.tourist_ai.update)
 
     # -------------------------------------------------
     def update(self, dt: float):
+        self.pipeline.step(dt)
+        self.board.events.flush()
+
+    def _spawn_poachers(self, dt: float):
         self._poacher_timer += dt
         if self._poacher_timer > POACHER_INTERVAL:
             self._spawn_poacher()
             self._poacher_timer = 0.0
 
-        # ---- Update Poachers ----
-        for p in self.board.poachers:
-            result = p.update(dt, self.board)
-            if result:
-                parts = result.split(":")
-                species, aid = parts[1], parts[2]
-                self._feedback(f"{species} #{aid} was killed by a poacher!")
-
-
-        # ---- Update Rangers ----
+    def _update_poachers(self, dt: float):
+        if not self.board.poachers:
+            return
+        # rangers and animals stay put while poachers move, so one field serves them all
+        self.board.poacher_watchers = poacher_watchers(self.board)
+        try:
+            for p in self.board.poachers:
+                p.update(dt, self.board)
+        finally:
+            self.board.poacher_watchers = None
+
+    def _update_rangers(self, dt: float):
+        # Ranger.update already chases the nearest poacher in sight and catches it
         for r in self.board.rangers:
             r.update(dt, self.board)
-            self._ranger_vision(r)
 
-        # ---- Update animals ----
-        self.animal_ai.update(dt)
+    # -------------------------------------------------
+    #                event handlers
+    # -------------------------------------------------
+    def _on_died(self, event: Died):
+        if event.cause == "poached" and self._feedback:
+            self._feedback(f"{event.animal.species.name} #{event.animal.animal_id} was killed by a poacher!")
 
-        self.tourist_ai.update(dt)
+    def _on_captured(self, event: Captured):
+        self.capital.addFunds(50)   # bounty
+        if self._feedback:
+            self._feedback("Poacher eliminated! +$50")
 
 
     # -------------------------------------------------
@@ -84,22 +112,7 @@ class WildlifeAI:
         pid = len(self.board.poachers) + 1
         self.board.poachers.append(Poacher(pid, 
                                            "Poacher" + str(pid), 
-                                           Vector2(random.randint(0, self.board.width - 1), 0)
+                                           Vector2(self.board.rng.randint(0, self.board.width - 1), 0)
                                            ))
 
-    def _ranger_vision(self, ranger):
-        """If a poacher within vision → chase / catch."""
-        for p in self.board.poachers[:]:
-            dist = ranger.position.distance_to(p.position)
-            if dist <= ranger.vision:
-                p.visible = True
-                # simple chase: ranger sets target to poacher
-                ranger.target = p.position
-                if dist < 0.6:           # caught!
-                    self.board.poachers.remove(p)
-                    ranger.poachers_caught += 1
-                    self.capital.addFunds(50)   # bounty
-            else:
-                p.visible = False
-
                 
\ No newline at end of file
@@ -0,0 +1,79 @@
+# my_safari_project/headless.py
+"""
+Run the safari simulation without a window or audio device.
+
+    python -m my_safari_project.headless --difficulty HARD --months 2 --dt 0.5 --seed 7
+    python -m my_safari_project.headless --months 1 --seed 7 --record session.json
+    python -m my_safari_project.headless --replay session.json
+    python -m my_safari_project.headless --months 1 --profile profile.csv
+"""
+
+import argparse
+import os
+
+# must be set before pygame initialises its video/audio subsystems
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from my_safari_project.control.game_controller import DifficultyLevel, GameController
+from my_safari_project.control.replay import ReplayLog, replay
+from my_safari_project.control.profiler import profiler
+from my_safari_project.model.timer import TIME_SCALE
+
+
+def run_headless(difficulty: DifficultyLevel, seconds: float, dt: float = 0.1,
+                 verbose: bool = False, vectorized: bool = False, seed: int | None = None,
+                 lod: bool = False) -> GameController:
+    sink = print if verbose else None
+    controller = GameController(difficulty, headless=True, feedback_sink=sink,
+                                vectorized=vectorized, seed=seed, lod=lod)
+    controller.simulate(seconds, dt)
+    return controller
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the safari simulation headlessly.")
+    parser.add_argument("--difficulty", choices=[d.name for d in DifficultyLevel], default="NORMAL")
+    parser.add_argument("--months", type=float, default=1.0, help="game months to simulate")
+    parser.add_argument("--dt", type=float, default=0.1, help="fixed simulation step in game seconds")
+    parser.add_argument("--verbose", action="store_true", help="print in-game feedback messages")
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy animal engine")
+    parser.add_argument("--lod", action="store_true", help="stagger animal decisions under a per-tick budget")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed (random if omitted)")
+    parser.add_argument("--record", metavar="FILE", help="write the session's replay log here")
+    parser.add_argument("--replay", metavar="FILE", help="replay a recorded session instead")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="profile the run and export the timings (.csv or .json)")
+    args = parser.parse_args(argv)
+
+    profiler.enabled = bool(args.profile)
+
+    if args.replay:
+        controller = replay(ReplayLog.load(args.replay), vectorized=args.vectorized, lod=args.lod,
+                            feedback_sink=print if args.verbose else None)
+    else:
+        controller = run_headless(DifficultyLevel[args.difficulty], args.months * TIME_SCALE["month"],
+                                  args.dt, args.verbose, args.vectorized, args.seed, args.lod)
+    if args.record:
+        controller.replay_log.save(args.record)
+    board = controller.board
+    herbivores = board.population.herbivores
+    carnivores = board.population.carnivores
+    print(f"seed:       {controller.seed}")
+    print(f"time:       {controller.timer.elapsed_seconds:.1f}s")
+    print(f"capital:    {controller.capital.getBalance():.2f}")
+    print(f"herbivores: {herbivores}")
+    print(f"carnivores: {carnivores}")
+    print(f"tourists:   {len(board.tourists) + len(board.waiting_tourists)}")
+    print(f"won:        {controller.won}")
+    events = ", ".join(f"{kind}={n}" for kind, n in sorted(controller.event_counts.items()))
+    print(f"events:     {events or '-'}")
+    if args.profile:
+        profiler.export(args.profile)
+        print(f"profile:    {args.profile}")
+    if args.record:
+        print(f"recorded:   {args.record}")
+
+
+if __name__ == "__main__":
+    main()
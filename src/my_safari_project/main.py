@@ -1,8 +1,17 @@
+import argparse
+
 from my_safari_project.view.main_menu_gui import main_menu
 from my_safari_project.view.gamegui import GameGUI
 
-def run_game():
-    main_menu()
+def run_game(argv=None):
+    parser = argparse.ArgumentParser(description="Play the safari game.")
+    parser.add_argument("--record", metavar="FILE",
+                        help="write the session's replay log here on exit "
+                             "(replay it with my_safari_project.headless --replay)")
+    parser.add_argument("--lod", action="store_true",
+                        help="let animals off screen decide less often (large parks)")
+    args = parser.parse_args(argv)
+    main_menu(record_to=args.record, lod=args.lod)
 
 if __name__ == "__main__":
     run_game()
@@ -1,10 +1,10 @@
-import random
 
 from pygame.math import Vector2
 from abc import ABC, abstractmethod
 from typing import TypeVar, Generic, Union, Optional, TYPE_CHECKING
 from enum import Enum
 from pygame import Color
+from my_safari_project.model.animal_arrays import ArrayField
 
 if TYPE_CHECKING:
     from my_safari_project.model.plant import Plant
@@ -49,6 +49,21 @@ AGE_RATE = 0.03
 
 class Animal(ABC, Generic[T]):
     """Generic class for Animal that consumes T"""
+    _population = None      # set while the animal is on a board (model/population.py)
+    death_cause: str | None = None  # "old_age", "starvation", "eaten", "poached", ...
+    # while the vectorised engine has the animal bound to a row, it is switched to
+    # a subclass whose stats live in the row (see animal_arrays.backed_class)
+    _soa = None
+    _soa_row = -1
+    _plain_class = None
+    _array_fields = {
+        "speed":    ArrayField("speed"),
+        "age":      ArrayField("age"),
+        "hunger":   ArrayField("hunger"),
+        "thirst":   ArrayField("thirst"),
+        "is_alive": ArrayField("is_alive", bool),
+    }
+
     def __init__(
         self, 
         animal_id: int,
@@ -72,17 +87,25 @@ class Animal(ABC, Generic[T]):
         self.target: Vector2 | None = None
     
     def update(self, dt: float, board: "Board") -> None:
-        self.is_alive = self.is_alive and self.age < self.lifespan and (self.hunger < 10.0 or self.thirst < 10.0)
+        if self.is_alive and not (self.age < self.lifespan and (self.hunger < 10.0 or self.thirst < 10.0)):
+            self.set_alive(False)
         if self.is_alive:
             if not self.target or self.position.distance_to(self.target) < 0.2:
                 self.target = Vector2(
-                    random.uniform(0, board.width - 1),
-                    random.uniform(0, board.height - 1)
+                    board.rng.uniform(0, board.width - 1),
+                    board.rng.uniform(0, board.height - 1)
                 )
             self.move(self.target, dt)
         elif self in board.animals:
             board.animals.remove(self)
 
+    def set_alive(self, alive: bool) -> None:
+        """Set is_alive, reporting the change to the board's Population."""
+        if alive != self.is_alive:
+            self.is_alive = alive
+            if self._population is not None:
+                self._population.alive_changed(self, alive)
+
     def move(self, target: Vector2, dt: float):
         direction = target - self.position
         dist = direction.length()
@@ -111,10 +134,11 @@ class Animal(ABC, Generic[T]):
         pass
     
     def reproduce(self, target: "Animal", animal_id: int) -> Optional["Animal"]:
-        if isinstance(target, self.__class__) and self.is_adult() and target.is_adult():
+        cls = self._plain_class or self.__class__
+        if isinstance(target, cls) and self.is_adult() and target.is_adult():
             offspring_pos = (self.position + target.position)/2
             offspring_lifespan = (self.lifespan + target.lifespan)//2
-            return self.__class__(
+            return cls(
                 animal_id,
                 self.species,
                 offspring_pos,
@@ -128,7 +152,16 @@ class Animal(ABC, Generic[T]):
         return self.age >= (self.lifespan/3.0)
     
 
-    def kill(self):
-        self.is_alive = False
+    def cause_of_death(self) -> str:
+        """Why a dead animal died: the cause it was killed with, else what its stats say."""
+        if self.death_cause is not None:
+            return self.death_cause
+        if self.age >= self.lifespan:
+            return "old_age"
+        return "starvation"
+
+    def kill(self, cause: str = "killed"):
+        self.death_cause = cause
+        self.set_alive(False)
         self.speed = 0
         self.target = None
\ No newline at end of file
@@ -0,0 +1,217 @@
+from __future__ import annotations
+from typing import Any, Dict, List, TYPE_CHECKING
+from pygame.math import Vector2
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:          # the struct-of-arrays engine is optional
+    np = None
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from my_safari_project.model.animal import Animal
+    from my_safari_project.model.board import Board
+
+
+class ArrayField:
+    """An attribute of a bound object, read from and written to its AnimalArrays column."""
+
+    def __init__(self, column: str, kind: type = float):
+        self.column = column
+        self.kind = kind
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return self.kind(obj._soa.columns[self.column][obj._soa_row])
+
+    def __set__(self, obj, value):
+        obj._soa.columns[self.column][obj._soa_row] = value
+
+
+_backed_classes: Dict[type, type] = {}
+
+
+def backed_class(cls: type) -> type:
+    """
+    <cls> with the attributes in its `_array_fields` kept in an AnimalArrays
+    row. Bound objects are switched to it and unbound ones back to `cls`, so
+    objects outside the arrays keep plain, fast instance attributes.
+    """
+    backed = _backed_classes.get(cls)
+    if backed is None:
+        namespace = dict(cls._array_fields, _plain_class=cls,
+                         __module__=cls.__module__, __qualname__=cls.__qualname__)
+        backed = _backed_classes[cls] = type(cls.__name__, (cls,), namespace)
+    return backed
+
+
+class AnimalArrays:
+    """
+    Struct-of-arrays storage for animal vitals.
+
+    Bound animals (and their AnimalStatus) are switched to their
+    `backed_class`, whose scalar stats read and write contiguous NumPy
+    columns, so a whole population is aged, starved and dehydrated in a
+    handful of vectorised operations. Unbinding copies the row back into
+    plain attributes.
+    """
+
+    FLOAT_COLUMNS = ("speed", "age", "lifespan", "hunger", "thirst",
+                     "reproduction_cooldown", "migration_cooldown")
+    BOOL_COLUMNS = ("is_alive",)
+    ANIMAL_FIELDS = ("speed", "age", "hunger", "thirst", "is_alive")
+    STATUS_FIELDS = ("reproduction_cooldown", "migration_cooldown")
+
+    def __init__(self, capacity: int = 64):
+        if not HAS_NUMPY:
+            raise ImportError("AnimalArrays requires numpy")
+        self.size = 0
+        self.capacity = 0
+        self.columns: Dict[str, "np.ndarray"] = {}
+        self.animals: List["Animal"] = []
+        self.statuses: List[Any] = []
+        self._grow(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self.size
+
+    # ── row management ────────────────────────────────────────────────
+    def _grow(self, capacity: int) -> None:
+        old = self.columns
+        self.columns = {}
+        for name in self.FLOAT_COLUMNS:
+            self.columns[name] = np.zeros(capacity, dtype=np.float64)
+        for name in self.BOOL_COLUMNS:
+            self.columns[name] = np.zeros(capacity, dtype=bool)
+        for name, col in old.items():
+            self.columns[name][:self.size] = col[:self.size]
+        self.capacity = capacity
+
+    def bind(self, animal: "Animal", status: Any = None) -> None:
+        if animal._soa is self:
+            self.bind_status(animal, status)
+            return
+        if self.size == self.capacity:
+            self._grow(self.capacity * 2)
+        row = self.size
+        self._attach(animal, row, self.ANIMAL_FIELDS)
+        self.columns["lifespan"][row] = animal.lifespan
+        self.columns["reproduction_cooldown"][row] = 0.0
+        self.columns["migration_cooldown"][row] = 0.0
+        self.animals.append(animal)
+        self.statuses.append(None)
+        self.size += 1
+        self.bind_status(animal, status)
+
+    def bind_status(self, animal: "Animal", status: Any) -> None:
+        row = animal._soa_row
+        current = self.statuses[row]
+        if status is current:
+            return
+        if current is not None:
+            self._detach(current, self.STATUS_FIELDS)
+        if status is not None:
+            if status._soa is not None:
+                status._soa.unbind_status(status)
+            self._attach(status, row, self.STATUS_FIELDS)
+        self.statuses[row] = status
+
+    def unbind_status(self, status: Any) -> None:
+        row = status._soa_row
+        self._detach(status, self.STATUS_FIELDS)
+        self.statuses[row] = None
+
+    def unbind(self, animal: "Animal") -> None:
+        """Copy the row back onto <animal> and swap-remove it."""
+        if animal._soa is not self:
+            return
+        row = animal._soa_row
+        status = self.statuses[row]
+        if status is not None:
+            self._detach(status, self.STATUS_FIELDS)
+        self._detach(animal, self.ANIMAL_FIELDS)
+        last = self.size - 1
+        if row != last:
+            for col in self.columns.values():
+                col[row] = col[last]
+            moved, moved_status = self.animals[last], self.statuses[last]
+            self.animals[row], self.statuses[row] = moved, moved_status
+            moved._soa_row = row
+            if moved_status is not None:
+                moved_status._soa_row = row
+        self.animals.pop()
+        self.statuses.pop()
+        self.size = last
+
+    def _attach(self, obj: Any, row: int, fields) -> None:
+        for name in fields:
+            self.columns[name][row] = getattr(obj, name)
+        obj._soa, obj._soa_row = self, row
+        obj.__class__ = backed_class(type(obj))
+
+    @staticmethod
+    def _detach(obj: Any, fields) -> None:
+        values = {name: getattr(obj, name) for name in fields}
+        obj.__class__ = obj._plain_class
+        obj._soa, obj._soa_row = None, -1
+        obj.__dict__.update(values)
+
+    def sync(self, animals: List["Animal"], statuses: Dict[int, Any]) -> None:
+        """Bind every animal on the board and release the ones that left it."""
+        present = {id(a) for a in animals}
+        for animal in [a for a in self.animals if id(a) not in present]:
+            self.unbind(animal)
+        for animal in animals:
+            self.bind(animal, statuses.get(animal.animal_id))
+
+    # ── vectorised updates ───────────────────────────────────────────
+    def step_vitals(self, dt: float, reproduction_rate: float, migration_rate: float) -> None:
+        """Vectorised Animal.add_age/add_hunger/add_thirst plus status cooldowns."""
+        from my_safari_project.model.animal import AGE_RATE, HUNGER_RATE, THIRST_RATE
+
+        n, c = self.size, self.columns
+        alive = c["is_alive"][:n]
+        for name, rate, cap in (("age", AGE_RATE, c["lifespan"][:n]),
+                                ("hunger", HUNGER_RATE, 10.0),
+                                ("thirst", THIRST_RATE, 10.0)):
+            col = c[name][:n]
+            col[alive] = np.minimum(col + rate * dt, cap)[alive]
+        for name, rate in (("reproduction_cooldown", reproduction_rate),
+                           ("migration_cooldown", migration_rate)):
+            col = c[name][:n]
+            col[alive] = np.maximum(col - rate * dt, 0)[alive]
+
+    def step_movement(self, dt: float, board: "Board") -> None:
+        """
+        Animal.update for every animal on <board>, in the same order. Only the
+        liveness test is vectorised: positions and targets are Vector2 objects
+        that other entities hold on to, so each animal still moves on its own,
+        with its speed read from a plain list instead of through its row.
+        """
+        for animal in board.animals:
+            if animal._soa is not self:
+                self.bind(animal)
+        n, c = self.size, self.columns
+        alive = (c["is_alive"][:n]
+                 & (c["age"][:n] < c["lifespan"][:n])
+                 & ((c["hunger"][:n] < 10.0) | (c["thirst"][:n] < 10.0))).tolist()
+        speeds = c["speed"][:n].tolist()
+        rng, width, height = board.rng, board.width, board.height
+        for animal in board.animals:        # removals skip the next animal, as in the object path
+            row = animal._soa_row
+            if not alive[row]:
+                # deaths go through Animal.set_alive, so the board's Population hears of them
+                animal.set_alive(False)
+                if animal in board.animals:
+                    board.animals.remove(animal)
+                continue
+            target = animal.target
+            if not target or animal.position.distance_to(target) < 0.2:
+                target = animal.target = Vector2(rng.uniform(0, width - 1), rng.uniform(0, height - 1))
+            direction = target - animal.position
+            dist = direction.length()
+            if dist == 0:
+                continue
+            animal.position += direction.normalize() * min(dist, speeds[row] * dt)
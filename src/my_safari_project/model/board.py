@@ -1,19 +1,29 @@
 # ─── Board ──────────────────────────────────────────────────────────────────
 from __future__ import annotations
 import random, time
-from collections import deque
 from typing import List
 from pygame.math import Vector2
 
 
 from my_safari_project.model.animal import Animal
-from my_safari_project.model.field import Field, TerrainType
+from my_safari_project.model.field import TerrainType
+from my_safari_project.model.terrain_grid import TerrainGrid, FieldRows
 from my_safari_project.model.road  import Road, RoadType
+from my_safari_project.model.road_graph import RoadGraph
+from my_safari_project.model.entity_list import EntityList
+from my_safari_project.model.population import Population
+from my_safari_project.model.traffic import TrafficManager
+from my_safari_project.model.spatial_index import SpatialIndex
+from my_safari_project.model.visibility import VisibilityField
+from my_safari_project.model.events import EventBus, Spawned, Died
 from my_safari_project.model.jeep  import Jeep
 from my_safari_project.model.tourist  import Tourist
 
 
 
+SPATIAL_CELL = 5.0      # tiles per spatial index cell (the animals' detection radius)
+
+
 class Board:
     """
     Large world that can host many roads & jeeps.
@@ -22,13 +32,15 @@ class Board:
 
     # ----------------------------------------------------------------------
     def __init__(self, width: int = 100, height: int = 100,
-                 n_roads: int = 3, n_jeeps: int = 10):
+                 n_roads: int = 3, n_jeeps: int = 10,
+                 rng: random.Random | None = None):
         self.width, self.height = width, height
+        # every random decision of this simulation draws from this stream
+        self.rng: random.Random = rng if rng is not None else random.Random()
 
-        self.fields: list[list[Field]] = [
-            [Field(Vector2(x, y)) for x in range(width)]
-            for y in range(height)
-        ]
+        # tile state lives in flat arrays; fields[y][x] yields a Field view onto them
+        self.terrain = TerrainGrid(width, height)
+        self.fields: FieldRows = FieldRows(self.terrain)
         #added to Make sure the freshly-created grid is coherent
         # for row in self.fields:
         #     for field in row:
@@ -39,15 +51,37 @@ class Board:
         self.exits     : list[Vector2] = []
 
         # entity containers
-        self.roads = []  # you probably already have this
-        self.jeeps = []
-        self.poachers = []
-        self.rangers = []
-        self.plants = []
-        self.ponds = []
-        self.animals = []
-        self.tourists:List[Tourist] = []
-        self.waiting_tourists = []
+        self.roads = EntityList()
+        self.road_graph = RoadGraph(self)
+        # tile -> [(order, road)], latest last; kept in step by the roads list's hooks
+        self._road_index: dict[tuple[float, float], list[tuple[int, Road]]] = {}
+        self._road_order = 0    # stamp of the next road added, so sorting follows self.roads
+        self.roads.watch(on_add=self._road_added, on_remove=self._road_removed)
+        # these report additions/removals to subscribers (see entity_list.py)
+        self.rangers = EntityList()
+        self.jeeps = EntityList()
+        self.traffic = TrafficManager(self.jeeps)     # road tile of every jeep
+        self.poachers = EntityList()
+        self.plants = EntityList()
+        self.ponds = EntityList()
+        self.animals = EntityList()
+        self.population = Population(self.animals)    # live per-species / per-diet counts
+        # game events, dispatched once per tick by the controller (see events.py)
+        self.events = EventBus()
+        for entities in (self.poachers, self.plants, self.ponds):
+            entities.watch(on_add=self._spawned)
+        self.animals.watch(on_add=self._spawned, on_remove=self._animal_left)
+        self.tourists: List[Tourist] = EntityList()
+        self.waiting_tourists = []      # the tourists still waiting for a jeep
+        # where everything is, refreshed by the sim each tick and read by the renderer
+        self.spatial = SpatialIndex(SPATIAL_CELL)
+        for kind, entities in (("pond", self.ponds), ("plant", self.plants), ("jeep", self.jeeps),
+                               ("ranger", self.rangers), ("poacher", self.poachers),
+                               ("tourist", self.tourists)):
+            self.spatial.track(kind, entities)
+        self.spatial.track("animal", self.animals, keep=lambda a: a.is_alive)
+        # who can spot a poacher, stamped once per poacher phase (see poacher.py)
+        self.poacher_watchers: VisibilityField | None = None
         self._generate_terrain()
 
 
@@ -71,10 +105,10 @@ class Board:
             pts: list[Vector2] = [start]
             x = 0
             while x < self.width - 1:
-                x += random.randint(15, 25)
+                x += self.rng.randint(15, 25)
                 if x >= self.width - 1: break
                 bend_y = max(1, min(self.height - 2,
-                                    y + random.choice([-3, -2, -1, 1, 2, 3])))
+                                    y + self.rng.choice([-3, -2, -1, 1, 2, 3])))
                 pts.append(Vector2(x, bend_y))
             pts.append(end)
 
@@ -112,9 +146,9 @@ class Board:
 
     def _add_road_tile(self, cur: Vector2, nxt: Vector2):
         def get_or_create(pos: Vector2) -> Road:
-            for r in self.roads:
-                if r.pos == pos:
-                    return r
+            road = self.road_at(pos.x, pos.y)
+            if road is not None:
+                return road
             rt = (RoadType.STRAIGHT_H if pos.y == nxt.y
                   else RoadType.STRAIGHT_V)
             road = Road(pos, rt)
@@ -124,6 +158,7 @@ class Board:
         t1, t2 = get_or_create(cur), get_or_create(nxt)
         t1.add_neighbor(t2.pos)
         t2.add_neighbor(t1.pos)
+        self.road_graph.invalidate()
 
         # Make road tiles walkable
         fx, fy = int(cur.x), int(cur.y)
@@ -134,14 +169,16 @@ class Board:
     
     def _determine_road_type(self, pos: Vector2):
         x, y = int(pos.x), int(pos.y)
-        h_neighbors = sum(1 for dx in [-1,1] if any(r.pos == Vector2(x+dx, y) for r in self.roads))
-        v_neighbors = sum(1 for dy in [-1,1] if any(r.pos == Vector2(x, y+dy) for r in self.roads))
+        h_neighbors = sum(1 for dx in [-1,1] if self.has_road(x+dx, y))
+        v_neighbors = sum(1 for dy in [-1,1] if self.has_road(x, y+dy))
         return RoadType.STRAIGHT_H if h_neighbors >= v_neighbors else RoadType.STRAIGHT_V
 
     def _update_road_types(self):
         from my_safari_project.model.road import RoadType
         for road in self.roads:
             road.type = self._determine_road_type(road.pos)
+            self.terrain.mark_dirty(road.pos.x, road.pos.y)
+        self.road_graph.invalidate()
 
     def add_road(self, x: int, y: int, road_type: str) -> bool:
         """Add a road from the shop at the specified position."""
@@ -160,9 +197,8 @@ class Board:
             return False
 
         # Check if position is already occupied
-        for road in self.roads:
-            if road.pos == Vector2(x, y):
-                return False
+        if self.has_road(x, y):
+            return False
 
         # Create and add new road
         if road_type in road_type_map:
@@ -188,7 +224,7 @@ class Board:
             for i in range(max_cells):
                 cur_x = x + i
                 # Stop if we hit another road
-                if any(r.pos == Vector2(cur_x, y) for r in self.roads):
+                if self.has_road(cur_x, y):
                     break
                 cells_to_check.append((cur_x, y))
         else:  # v_road
@@ -196,7 +232,7 @@ class Board:
             for i in range(max_cells):
                 cur_y = y + i
                 # Stop if we hit another road
-                if any(r.pos == Vector2(x, cur_y) for r in self.roads):
+                if self.has_road(x, cur_y):
                     break
                 cells_to_check.append((x, cur_y))
 
@@ -214,45 +250,49 @@ class Board:
                 new_road.add_neighbor(prev_road.pos)
             prev_road = new_road
 
+        self.road_graph.invalidate()
         return True
 
         return True
 
+    # ── road lookup ───────────────────────────────────────────────────────
+    def _road_added(self, road: Road):
+        self._road_index.setdefault((road.pos.x, road.pos.y), []).append((self._road_order, road))
+        self._road_order += 1
+        self.terrain.mark_dirty(road.pos.x, road.pos.y)
+        self.road_graph.invalidate()
+
+    def _road_removed(self, road: Road):
+        tile = (road.pos.x, road.pos.y)
+        entries = self._road_index.get(tile, [])
+        entries[:] = [e for e in entries if e[1] is not road]
+        if not entries:
+            self._road_index.pop(tile, None)
+        self.terrain.mark_dirty(road.pos.x, road.pos.y)
+        self.road_graph.invalidate()
+
+    def _road_entry(self, tile: tuple[float, float]) -> tuple[int, Road] | None:
+        # a tile holding several roads answers with the one added last
+        entries = self._road_index.get(tile)
+        return entries[-1] if entries else None
+
+    def road_at(self, x: float, y: float) -> Road | None:
+        """The road on tile (x, y), or None."""
+        entry = self._road_entry((x, y))
+        return entry[1] if entry else None
+
+    def has_road(self, x: float, y: float) -> bool:
+        return self.road_at(x, y) is not None
+
     # ── path helper ───────────────────────────────────────────────────────
     def _longest_path(self, start: Vector2) -> list[Vector2]:
         """
         Return the longest simple (no repeated tiles) path that starts at the
         *road tile nearest `start`* and finishes on **any road end-point**
-        (a tile that has exactly one neighbour).
+        (a tile that has exactly one neighbour). Routes are cached by the
+        road graph until the network changes.
         """
-        if not self.roads:
-                return [start]
-
-        road_map = {tuple(r.pos): r for r in self.roads}
-
-        # snap ‘start’ to the nearest road-tile centre
-        snap = min(road_map.keys(),
-                        key=lambda p: Vector2(p).distance_to(start))
-        snap_v = Vector2(snap)
-
-        # breadth-first search that stores whole paths so we can compare
-        Q = deque([[snap_v]])
-        longest = [snap_v]
-
-        while Q:
-                path = Q.popleft()
-                head = path[-1]
-                head_road = road_map[tuple(head)]
-
-                # if we’re at an end-point AND longer than what we have, keep it
-                if len(head_road.neighbors) == 1 and len(path) > len(longest):
-                        longest = path
-
-                for nbr in head_road.neighbors:
-                        if nbr not in path:                        # no cycles / repeats
-                                Q.append(path + [Vector2(nbr)])
-
-        return longest
+        return self.road_graph.longest_path(start)
 
 
     def _spawn_jeeps(self, n_jeeps: int = 5):
@@ -277,21 +317,29 @@ class Board:
     # ── update (called from GameController) ───────────────────────────────
     def update(self, dt: float, now: float):
         for jeep in self.jeeps:
-            other_jeeps = [j for j in self.jeeps if j != jeep]
-            jeep.update(dt, now, other_jeeps)
+            jeep.update(dt, now)
+            self.traffic.moved(jeep)
+
+    # ── lifecycle events ──────────────────────────────────────────────────
+    def _spawned(self, entity):
+        self.events.emit(Spawned(entity))
+
+    def _animal_left(self, animal: Animal):
+        # living animals only leave when the board is reset (load_game)
+        if not animal.is_alive:
+            self.events.emit(Died(animal, animal.cause_of_death()))
 
     # ------------------------------------------------------------------
     def _stitch_into_network(self, road: Road):
         """Link <road> to any existing road that touches it orthogonally."""
-        for other in self.roads:
-            if other is road:                # ignore self
-                continue
-            dx = int(other.pos.x - road.pos.x)
-            dy = int(other.pos.y - road.pos.y)
-            touching = (abs(dx) == 1 and dy == 0) or (abs(dy) == 1 and dx == 0)
-            if touching:
-                road.add_neighbor(other.pos)
-                other.add_neighbor(road.pos)
+        x, y = road.pos.x, road.pos.y
+        touching = [self._road_entry(tile)
+                    for tile in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))]
+        # link in self.roads order, as a scan over the list would
+        for _, other in sorted(t for t in touching if t is not None):
+            road.add_neighbor(other.pos)
+            other.add_neighbor(road.pos)
+        self.road_graph.invalidate()
 
 
     # ---------------------------------------------------------------------
@@ -328,10 +376,10 @@ class Board:
     def _generate_terrain(self):
         # Generate hills in clusters
         for _ in range(int(self.width * self.height * 0.05)):
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
+            x = self.rng.randint(0, self.width - 1)
+            y = self.rng.randint(0, self.height - 1)
             if self.fields[y][x].terrain_type == TerrainType.GRASS:
-                self._create_hill_cluster(x, y, random.randint(1, 3))
+                self._create_hill_cluster(x, y, self.rng.randint(1, 3))
 
         # Generate winding rivers
         for _ in range(2):
@@ -339,8 +387,8 @@ class Board:
 
         # Add dense grass patches
         for _ in range(int(self.width * self.height * 0.1)):
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
+            x = self.rng.randint(0, self.width - 1)
+            y = self.rng.randint(0, self.height - 1)
             if self.fields[y][x].terrain_type == TerrainType.GRASS:
                 self.fields[y][x].set_terrain(TerrainType.DENSE_GRASS)
 
@@ -357,29 +405,29 @@ class Board:
 
         if height > 1:
             for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                if random.random() < 0.6:
+                if self.rng.random() < 0.6:
                     self._create_hill_cluster(x + dx, y + dy, height - 1)
 
     def _create_river(self):
         """Create a winding river across the map"""
         # Start from a random edge
-        edge = random.choice(['top', 'bottom', 'left', 'right'])
+        edge = self.rng.choice(['top', 'bottom', 'left', 'right'])
         match edge:
             case 'top':
-                start_x = random.randint(0, self.width - 1)
+                start_x = self.rng.randint(0, self.width - 1)
                 start_y = 0
                 direction = Vector2(0, 1)
             case 'bottom':
-                start_x = random.randint(0, self.width - 1)
+                start_x = self.rng.randint(0, self.width - 1)
                 start_y = self.height - 1
                 direction = Vector2(0, -1)
             case 'left':
                 start_x = 0
-                start_y = random.randint(0, self.height - 1)
+                start_y = self.rng.randint(0, self.height - 1)
                 direction = Vector2(1, 0)
             case 'right':
                 start_x = self.width - 1
-                start_y = random.randint(0, self.height - 1)
+                start_y = self.rng.randint(0, self.height - 1)
                 direction = Vector2(-1, 0)
 
         current = Vector2(start_x, start_y)
@@ -395,12 +443,12 @@ class Board:
                 river_tiles.append((x, y))
 
             # Random direction change
-            if random.random() < 0.2:
+            if self.rng.random() < 0.2:
                 # Change direction slightly
                 if direction.x != 0:  # Moving horizontally
-                    direction.y = random.choice([-0.5, 0, 0.5])
+                    direction.y = self.rng.choice([-0.5, 0, 0.5])
                 else:  # Moving vertically
-                    direction.x = random.choice([-0.5, 0, 0.5])
+                    direction.x = self.rng.choice([-0.5, 0, 0.5])
 
                 # Normalize direction
                 if direction.length() > 0:
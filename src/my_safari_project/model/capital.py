@@ -26,6 +26,10 @@ class Capital:
     
     def getBalance(self) -> float:
         return self.currentBalance
+
+    def setBalance(self, balance: float):
+        self.currentBalance = balance
+        self.checkBankruptcy()
     
     def setIncome(self, income: float):
         if income >= 0:
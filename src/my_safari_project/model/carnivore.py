@@ -21,7 +21,8 @@ class Carnivore(Animal["Herbivore"]):
     
     def consume(self, food: "Herbivore") -> bool:
         if food.is_alive:
-            food.is_alive = False
+            food.death_cause = "eaten"
+            food.set_alive(False)
             fullness = 10.0 - food.hunger
             nutrition_level = min(food.age + fullness, 10.0)
             self.hunger = max(self.hunger - nutrition_level, 0.0)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, List, Tuple
+
+Listener = Callable[[Any], None]
+
+
+class EntityList(list):
+    """
+    A list of board entities that reports additions and removals.
+
+    Board keeps its roads, animals, plants, ponds, poachers and jeeps in these, so code that caches
+    facts about entities (AI memories, population counts) can subscribe with
+    `watch()` instead of rescanning the lists every tick. It is still a plain
+    list for everything else; slices and copies are ordinary lists.
+    """
+
+    def __init__(self, items: Iterable[Any] = ()):
+        super().__init__(items)
+        self._listeners: List[Tuple[Listener | None, Listener | None]] = []
+
+    def watch(self, on_add: Listener | None = None, on_remove: Listener | None = None) -> None:
+        self._listeners.append((on_add, on_remove))
+
+    def _added(self, items: Iterable[Any]) -> None:
+        for on_add, _ in self._listeners:
+            if on_add is not None:
+                for item in items:
+                    on_add(item)
+
+    def _removed(self, items: Iterable[Any]) -> None:
+        for _, on_remove in self._listeners:
+            if on_remove is not None:
+                for item in items:
+                    on_remove(item)
+
+    # ── adding ────────────────────────────────────────────────────────
+    def append(self, item: Any) -> None:
+        super().append(item)
+        if self._listeners:
+            self._added((item,))
+
+    def insert(self, index: int, item: Any) -> None:
+        super().insert(index, item)
+        if self._listeners:
+            self._added((item,))
+
+    def extend(self, items: Iterable[Any]) -> None:
+        items = list(items)
+        super().extend(items)
+        if self._listeners:
+            self._added(items)
+
+    def __iadd__(self, items: Iterable[Any]) -> "EntityList":
+        self.extend(items)
+        return self
+
+    # ── removing ──────────────────────────────────────────────────────
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        if self._listeners:
+            self._removed((item,))
+
+    def pop(self, index: int = -1) -> Any:
+        item = super().pop(index)
+        if self._listeners:
+            self._removed((item,))
+        return item
+
+    def clear(self) -> None:
+        items = list(self)
+        super().clear()
+        if self._listeners:
+            self._removed(items)
+
+    def __delitem__(self, index) -> None:
+        items = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        if self._listeners:
+            self._removed(items)
+
+    def __setitem__(self, index, value) -> None:
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        new = list(value) if isinstance(index, slice) else [value]
+        super().__setitem__(index, new if isinstance(index, slice) else value)
+        if self._listeners:
+            self._removed(old)
+            self._added(new)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+
+# ── events ────────────────────────────────────────────────────────────
+@dataclass(frozen=True, slots=True)
+class Spawned:
+    """An animal, plant, pond or poacher was put on the board."""
+    entity: Any
+    kind = "spawned"
+
+
+@dataclass(frozen=True, slots=True)
+class Died:
+    """A dead animal left the board; <cause> is its Animal.death_cause."""
+    animal: Any
+    cause: str
+    kind = "died"
+
+
+@dataclass(frozen=True, slots=True)
+class Eaten:
+    """<food> (a plant or a herbivore) was eaten by <eater>."""
+    food: Any
+    eater: Any
+    kind = "eaten"
+
+
+@dataclass(frozen=True, slots=True)
+class Captured:
+    """<ranger> caught <poacher>."""
+    poacher: Any
+    ranger: Any
+    kind = "captured"
+
+
+@dataclass(frozen=True, slots=True)
+class TouristDone:
+    """A tourist finished the tour and paid <reward>."""
+    tourist: Any
+    reward: float
+    kind = "tourist_done"
+
+
+@dataclass(frozen=True, slots=True)
+class JeepCrashed:
+    """Two jeeps collided and were taken off the road."""
+    jeeps: Tuple[Any, ...]
+    kind = "jeep_crashed"
+
+
+EVENT_TYPES = (Spawned, Died, Eaten, Captured, TouristDone, JeepCrashed)
+
+
+# ── bus ───────────────────────────────────────────────────────────────
+class EventBus:
+    """
+    Typed publish/subscribe queue for game events.
+
+    The simulation `emit`s events as things happen (a list append), and the
+    controller calls `flush()` once at the end of each tick to hand them to
+    the subscribers of their type, in emission order. Events emitted by a
+    subscriber during a flush are delivered in the same flush.
+    """
+
+    def __init__(self):
+        self._queue: List[Any] = []
+        self._handlers: Dict[Type, List[Callable[[Any], None]]] = {}
+
+    def subscribe(self, event_type: Type, handler: Callable[[Any], None]) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def emit(self, event: Any) -> None:
+        self._queue.append(event)
+
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def flush(self) -> None:
+        handlers = self._handlers
+        while self._queue:
+            queue, self._queue = self._queue, []
+            for event in queue:
+                for handler in handlers.get(type(event), ()):
+                    handler(event)
@@ -13,6 +13,14 @@ class TerrainType(Enum):
     ROAD = "ROAD"
 
 class Field:
+    color_map = {
+        TerrainType.GRASS: (124, 252, 0),
+        TerrainType.DENSE_GRASS: (34, 139, 34),
+        TerrainType.HILL: (160, 126, 84),
+        TerrainType.RIVER: (65, 105, 225),
+        TerrainType.ROAD: (169, 169, 169)
+    }
+
     def __init__(
             self,
             position: Vector2,
@@ -33,14 +41,6 @@ class Field:
         self.walkable = not is_obstacle
         self.movement_cost: float = 1.0
 
-        self.color_map = {
-            TerrainType.GRASS: (124, 252, 0),
-            TerrainType.DENSE_GRASS: (34, 139, 34),
-            TerrainType.HILL: (160, 126, 84),
-            TerrainType.RIVER: (65, 105, 225),
-            TerrainType.ROAD: (169, 169, 169)
-        }
-
         self.terrain_type = (
             TerrainType(terrain_type.upper())
             if isinstance(terrain_type, str)
@@ -100,19 +100,21 @@ class Field:
 
         pygame.draw.rect(surface, base_color, rect)
 
+        # Overlays are blended in place with fill flags rather than blitting
+        # a new tile-sized alpha surface per call
+
         # Add elevation shading for hills
         if self.terrain_type == TerrainType.HILL:
-            shade = max(0, min(100, self.elevation * 30))
-            overlay = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, shade))  # Darker with height
-            surface.blit(overlay, rect.topleft)
+            shade = int(max(0, min(100, self.elevation * 30)))
+            # black at alpha <shade>: darker with height
+            surface.fill((255 - shade,) * 3, rect, special_flags=pygame.BLEND_RGB_MULT)
 
         # Add water effect for rivers
         elif self.terrain_type == TerrainType.RIVER:
-            wave_height = abs(math.sin(time.time() * 2)) * 20
-            overlay = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, int(wave_height)))  # Shimmering effect
-            surface.blit(overlay, rect.topleft)
+            wave_height = int(abs(math.sin(time.time() * 2)) * 20)
+            # white at alpha <wave_height>: dst*(1-a) + 255*a, a shimmering effect
+            surface.fill((255 - wave_height,) * 3, rect, special_flags=pygame.BLEND_RGB_MULT)
+            surface.fill((wave_height,) * 3, rect, special_flags=pygame.BLEND_RGB_ADD)
 
     def get_color(self, terrain_value: str | TerrainType) -> tuple:
         if isinstance(terrain_value, str):
@@ -3,7 +3,7 @@ from __future__ import annotations
 import math, time
 from typing import List, Optional
 from pygame.math import Vector2
-import random
+from my_safari_project.model.events import JeepCrashed
 
 
 
@@ -33,42 +33,34 @@ class Jeep:
             direction = self._path[1] - self._path[0]
             self.heading = math.degrees(math.atan2(direction.y, direction.x))
 
-    def update(self, dt: float, now: float, other_jeeps: List["Jeep"]):
-        if self not in self.board.jeeps:
+    def update(self, dt: float, now: float):
+        traffic = self.board.traffic
+        if self not in traffic:
             return
-
-        for other in other_jeeps:
-            if other != self and other in self.board.jeeps:
-                separation = self.position.distance_to(other.position)
-                if separation < 0.8:  # crash threshold
-                    # Remove both jeeps
-                    if self in self.board.jeeps:
-                        for t in self.tourists[:]:
-                            t.exit_jeep()
-                        self.board.jeeps.remove(self)
-                    if other in self.board.jeeps:
-                        for t in other.tourists[:]:
-                            t.exit_jeep()
-                        self.board.jeeps.remove(other)
-                    from my_safari_project.audio import play_jeep_crash
-                    play_jeep_crash()
-                    if hasattr(self.board, "game_gui"):
-                        self.board.game_gui._feedback("Jeep crash! Passengers are now on foot.")
-                    return  # Stop further processing for this jeep
+        traffic.moved(self)     # in case the position was set from outside
+
+        # only jeeps on the surrounding road tiles can be close enough to hit
+        too_close = traffic.nearby(self, SAFE_RADIUS)
+        if too_close:
+            # crash: remove both jeeps
+            other = too_close[0]
+            for jeep in (self, other):
+                for t in jeep.tourists[:]:
+                    t.exit_jeep()
+                self.board.jeeps.remove(jeep)
+            # sound and feedback are subscribers of the event
+            self.board.events.emit(JeepCrashed((self, other)))
+            return  # Stop further processing for this jeep
 
         # Path continuation
         if not self._path or self._path_index >= len(self._path) - 1:
             if self.board:
                 current_pos = self.position
-                end_points = []
-                for road in self.board.roads:
-                    if len(road.neighbors) == 1:
-                        road_pos = Vector2(road.pos)
-                        if road_pos.distance_to(current_pos) > 5:
-                            end_points.append(road_pos)
+                end_points = [p for p in self.board.road_graph.dead_ends()
+                              if p.distance_to(current_pos) > 5]
 
                 if end_points:
-                    new_end = random.choice(end_points)
+                    new_end = self.board.rng.choice(end_points)
                     new_path = self.board._longest_path(current_pos)
                     if new_path and len(new_path) > 1:
                         self.set_path(new_path)
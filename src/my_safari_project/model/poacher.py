@@ -2,12 +2,25 @@ from __future__ import annotations
 from pygame.math import Vector2
 import random
 from typing import TYPE_CHECKING
+from my_safari_project.model.visibility import VisibilityField
 
 if TYPE_CHECKING:
     from my_safari_project.model.ranger import Ranger
     from my_safari_project.model.animal import Animal
     from my_safari_project.model.animal import Board
 
+WITNESS_RANGE = 10      # tiles from a living animal within which a poacher is spotted
+
+
+def poacher_watchers(board: "Board") -> VisibilityField:
+    """Everything that gives poachers away: rangers (their vision) and living animals."""
+    field = VisibilityField(WITNESS_RANGE)
+    for ranger in board.rangers:
+        field.stamp(ranger, ranger.vision)
+    for animal in board.animals:
+        field.stamp(animal, WITNESS_RANGE, while_alive=True)
+    return field
+
 class Poacher:
     """
     A poacher that wanders randomly, hunts animals, and tries to evade rangers.
@@ -35,18 +48,18 @@ class Poacher:
         self._timer = 0.0  # counts up to 1s before picking new target
         self._target = Vector2(position)  # current move‐toward point
 
-    def choose_random_target(self, width: int, height: int):
+    def choose_random_target(self, width: int, height: int, rng=random):
         self._target = Vector2(
-            random.randint(0, width - 1),
-            random.randint(0, height - 1)
+            rng.randint(0, width - 1),
+            rng.randint(0, height - 1)
         )
 
-    def update(self, dt: float, board: "Board")-> str|None:
+    def update(self, dt: float, board: "Board") -> None:
         # Every 1s pick a new random tile
         self._timer += dt
         if self._timer >= 1.0:
             self._timer = 0.0
-            self.choose_random_target(board.width, board.height)
+            self.choose_random_target(board.width, board.height, board.rng)
 
         # Move toward _target
         direction = self._target - self.position
@@ -58,22 +71,20 @@ class Poacher:
                 self.position += direction.normalize() * step
 
         # ---- 🔍 Visibility Check ----
-        self.visible = any(
-            self.position.distance_to(r.position) <= r.vision for r in board.rangers
-        ) or any(
-            self.position.distance_to(a.position) <= 10 and a.is_alive for a in board.animals
-        )
+        # the poacher phase shares one field between all poachers (see WildlifeAI)
+        watchers = board.poacher_watchers
+        if watchers is None:
+            watchers = poacher_watchers(board)
+        self.visible = watchers.covers(self.position)
 
         # ---- 💥 Hunt Animal ----
         # --- Hunt and kill nearby animals ---
         for animal in board.animals[:]:  # safe copy
             if animal.is_alive and self.position.distance_to(animal.position) < 2:
-                animal.kill()
-                board.animals.remove(animal)
+                animal.kill("poached")
+                board.animals.remove(animal)    # the board reports it as Died(cause="poached")
                 self.animals_caught += 1
-                return f"animal_killed:{animal.species.name}:{animal.animal_id}"
-
-        return None
+                break
 
     def hunt_animal(self, animal: Animal) -> bool:
         """
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from collections import Counter
+from typing import Dict, TYPE_CHECKING
+
+from my_safari_project.model.animal import AnimalSpecies
+from my_safari_project.model.carnivore import Carnivore
+from my_safari_project.model.herbivore import Herbivore
+
+if TYPE_CHECKING:
+    from my_safari_project.model.animal import Animal
+    from my_safari_project.model.entity_list import EntityList
+
+
+class Population:
+    """
+    Live animal counts per species and per diet, kept in step with a board.
+
+    It follows `board.animals` (spawns, offspring, removals) through the
+    EntityList hooks and deaths through `Animal.set_alive`, so the counts
+    always equal what filtering the list for living animals would give,
+    without the filtering. It also hands out animal ids that were never
+    used on this board.
+    """
+
+    def __init__(self, animals: "EntityList"):
+        self.species: Counter = Counter()     # AnimalSpecies -> living animals
+        self.herbivores = 0
+        self.carnivores = 0
+        self._alive: Dict["Animal", bool] = {}   # every animal on the board -> counted as alive
+        self._max_id = 0
+        animals.watch(on_add=self._added, on_remove=self._removed)
+        for animal in animals:
+            self._added(animal)
+
+    @property
+    def total(self) -> int:
+        return sum(self.species.values())
+
+    def count(self, species: AnimalSpecies) -> int:
+        return self.species[species]
+
+    def next_id(self) -> int:
+        """A fresh animal_id, higher than any animal this board has held."""
+        return self._max_id + 1
+
+    def species_present(self) -> int:
+        """Number of species with at least one living animal."""
+        return sum(1 for n in self.species.values() if n > 0)
+
+    # ── bookkeeping ───────────────────────────────────────────────────
+    def _tally(self, animal: "Animal", step: int) -> None:
+        self.species[animal.species] += step
+        if isinstance(animal, Herbivore):
+            self.herbivores += step
+        elif isinstance(animal, Carnivore):
+            self.carnivores += step
+
+    def _added(self, animal: "Animal") -> None:
+        if animal in self._alive:
+            return
+        alive = bool(animal.is_alive)
+        self._alive[animal] = alive
+        self._max_id = max(self._max_id, animal.animal_id)
+        animal._population = self
+        if alive:
+            self._tally(animal, 1)
+
+    def _removed(self, animal: "Animal") -> None:
+        alive = self._alive.pop(animal, None)
+        if alive is None:
+            return
+        if animal._population is self:
+            animal._population = None
+        if alive:
+            self._tally(animal, -1)
+
+    def alive_changed(self, animal: "Animal", alive: bool) -> None:
+        """Called by Animal.set_alive when an animal on the board dies (or revives)."""
+        was = self._alive.get(animal)
+        if was is None or was == alive:
+            return
+        self._alive[animal] = alive
+        self._tally(animal, 1 if alive else -1)
@@ -2,6 +2,7 @@ from __future__ import annotations
 import random
 from typing import Optional
 from pygame.math import Vector2
+from my_safari_project.model.events import Captured
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -39,7 +40,7 @@ class Ranger:
         """Directly assign a world‐space target to move toward."""
         self._target = Vector2(tgt)
 
-    def patrol(self, board_width: int, board_height: int) -> None:
+    def patrol(self, board_width: int, board_height: int, rng=random) -> None:
         """
         If not currently chasing, pick a random patrol waypoint
         (uniform over the whole board) and move toward it.
@@ -47,8 +48,8 @@ class Ranger:
         # if we’ve reached (or never had) a patrol point, pick a new one
         if self._target is None or self.position.distance_to(self._target) < 0.1:
             self._target = Vector2(
-                random.uniform(0, board_width),
-                random.uniform(0, board_height)
+                rng.uniform(0, board_width),
+                rng.uniform(0, board_height)
             )
 
     def chase_poacher(self, poacher: object) -> None:
@@ -58,7 +59,7 @@ class Ranger:
         """
         self._target = poacher.position.copy()
 
-    def update(self, dt: float, board: "Board"):
+    def update(self, dt: float, board: "Board") -> None:
         """
         Called once per frame from GameGUI; handles patrol, chase & capture.
         """
@@ -80,8 +81,8 @@ class Ranger:
                 # --- Patrol if no target ---
                 if self._target is None or self.position.distance_to(self._target) < 0.2:
                     self._target = Vector2(
-                        random.uniform(0, board.width),
-                        random.uniform(0, board.height)
+                        board.rng.uniform(0, board.width),
+                        board.rng.uniform(0, board.height)
                     )
 
         # --- Move toward target ---
@@ -95,17 +96,18 @@ class Ranger:
         if self.assigned_poacher and self.assigned_poacher in board.poachers:
             if self.position.distance_to(self.assigned_poacher.position) < 0.5:
                 board.poachers.remove(self.assigned_poacher)
+                board.events.emit(Captured(self.assigned_poacher, self))   # bounty and feedback
                 self.poachers_caught += 1
                 self.assigned_poacher = None
-                # Call to GameController externally for bounty and feedback
-                return "poacher_eliminated"
+                return
 
         # Auto-detected
         for p in board.poachers[:]:
             if self.position.distance_to(p.position) < 0.5:
                 board.poachers.remove(p)
+                board.events.emit(Captured(p, self))
                 self.poachers_caught += 1
-                return "poacher_eliminated"
+                return
 
 
 
@@ -0,0 +1,154 @@
+from __future__ import annotations
+from collections import deque
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from pygame.math import Vector2
+
+if TYPE_CHECKING:
+    from my_safari_project.model.board import Board
+
+Tile = Tuple[float, float]
+
+# Most path extensions the loop search may try before settling for the best
+# route found so far.
+SEARCH_BUDGET = 20_000
+
+
+class RoadGraph:
+    """
+    Adjacency view of a board's road network with cached jeep routes.
+
+    The adjacency lists mirror Road.neighbors and are rebuilt lazily after
+    the network changes; routes are memoised per start tile until then, and
+    so are the tables of dead ends and exits built alongside them.
+    """
+
+    def __init__(self, board: "Board"):
+        self.board = board
+        self.adj: Dict[Tile, List[Tile]] = {}
+        self._routes: Dict[Tile, List[Tile]] = {}
+        self._dead_ends: List[Vector2] = []     # tiles with one neighbour, in board.roads order
+        self._exits: List[Vector2] = []
+        self._dirty = True
+        self._revision = 0
+
+    def invalidate(self) -> None:
+        """Call after roads were re-linked (Board calls it when roads come and go)."""
+        self._dirty = True
+        self._routes.clear()
+
+    def _ensure(self) -> None:
+        roads = self.board.roads
+        if not self._dirty:
+            return
+        self.adj = {tuple(r.pos): [tuple(n) for n in r.neighbors] for r in roads}
+        self._dead_ends = [Vector2(r.pos) for r in roads if len(r.neighbors) == 1]
+        self._exits = [Vector2(e) for e in self.board.exits]
+        self._routes.clear()
+        self._dirty = False
+        self._revision += 1
+
+    def revision(self) -> int:
+        """A number that changes whenever the network was rebuilt; for callers' own caches."""
+        self._ensure()
+        return self._revision
+
+    # ── tables ────────────────────────────────────────────────────────
+    def dead_ends(self) -> List[Vector2]:
+        """Road end-points (tiles with exactly one neighbour). Shared list: do not modify."""
+        self._ensure()
+        return self._dead_ends
+
+    def nearest_exit(self, pos: Vector2) -> Optional[Vector2]:
+        """The board exit closest to <pos> (None without exits)."""
+        self._ensure()
+        if not self._exits:
+            return None
+        return Vector2(min(self._exits, key=pos.distance_to))
+
+    def snap(self, pos: Vector2) -> Optional[Tile]:
+        """The road tile nearest <pos> (None without roads)."""
+        self._ensure()
+        if not self.adj:
+            return None
+        key = (pos.x, pos.y)
+        if key in self.adj:
+            return key
+        return min(self.adj, key=lambda p: Vector2(p).distance_to(pos))
+
+    # ── routes ────────────────────────────────────────────────────────
+    def longest_path(self, start: Vector2) -> List[Vector2]:
+        """
+        Longest simple path from the road tile nearest <start> to any road
+        end-point (a tile with exactly one neighbour).
+        """
+        snap = self.snap(start)
+        if snap is None:
+            return [start]
+        route = self._routes.get(snap)
+        if route is None:
+            route = self._solve(snap)
+            self._routes[snap] = route
+        return [Vector2(p) for p in route]
+
+    def _solve(self, start: Tile) -> List[Tile]:
+        best, has_loop = self._bfs_tree(start)
+        if has_loop:
+            best = self._search(start, best)
+        return best
+
+    def _bfs_tree(self, start: Tile) -> Tuple[List[Tile], bool]:
+        """
+        Farthest end-point along the BFS tree from <start>. On a loop-free
+        network this is the unique longest path; also reports whether the
+        component contains a loop.
+        """
+        adj = self.adj
+        parent: Dict[Tile, Optional[Tile]] = {start: None}
+        depth = {start: 1}
+        far, far_depth = start, 1
+        degree_sum = 0
+        queue = deque([start])
+        while queue:
+            head = queue.popleft()
+            nbrs = adj.get(head, ())
+            degree_sum += len(nbrs)
+            if len(nbrs) == 1 and depth[head] > far_depth:
+                far, far_depth = head, depth[head]
+            for nbr in nbrs:
+                if nbr not in parent and nbr in adj:
+                    parent[nbr] = head
+                    depth[nbr] = depth[head] + 1
+                    queue.append(nbr)
+
+        path: List[Tile] = []
+        node: Optional[Tile] = far
+        while node is not None:
+            path.append(node)
+            node = parent[node]
+        path.reverse()
+        has_loop = degree_sum // 2 > len(parent) - 1
+        return path, has_loop
+
+    def _search(self, start: Tile, best: List[Tile]) -> List[Tile]:
+        """Depth-first search over simple paths, stopped after SEARCH_BUDGET steps."""
+        adj = self.adj
+        path = [start]
+        on_path = {start}
+        stack = [iter(adj.get(start, ()))]
+        budget = SEARCH_BUDGET
+        while stack and budget > 0:
+            nbr = next(stack[-1], None)
+            if nbr is None:
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+            if nbr in on_path or nbr not in adj:
+                continue
+            budget -= 1
+            path.append(nbr)
+            on_path.add(nbr)
+            nbrs = adj[nbr]
+            if len(nbrs) == 1 and len(path) > len(best):
+                best = list(path)
+            stack.append(iter(nbrs))
+        return best
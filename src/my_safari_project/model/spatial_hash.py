@@ -0,0 +1,115 @@
+from __future__ import annotations
+import math
+from typing import Any, Dict, Iterable, List, Tuple
+from pygame.math import Vector2
+
+Cell = Tuple[int, int]
+
+
+class SpatialHash:
+    """
+    Uniform grid that buckets entities by position.
+
+    Queries return the candidates of every cell overlapping the search
+    circle, in the order they were inserted, so callers that iterate the
+    result behave exactly like a scan over the original entity list.
+    Candidates still need an exact distance check.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Cell, List[Tuple[int, Any]]] = {}
+        self._where: Dict[int, Tuple[Cell, int]] = {}   # id(entity) -> (cell, order)
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, entity: Any) -> bool:
+        return id(entity) in self._where
+
+    def cell_of(self, pos: Vector2) -> Cell:
+        return (math.floor(pos.x / self.cell_size), math.floor(pos.y / self.cell_size))
+
+    # ── mutation ──────────────────────────────────────────────────────
+    def clear(self) -> None:
+        self._cells.clear()
+        self._where.clear()
+        self._next_order = 0
+
+    def rebuild(self, entities: Iterable[Any]) -> None:
+        """Drop everything and re-insert <entities> in iteration order."""
+        self.clear()
+        for entity in entities:
+            self.insert(entity, entity.position)
+
+    def insert(self, entity: Any, pos: Vector2) -> None:
+        if id(entity) in self._where:
+            self.move(entity, pos)
+            return
+        cell = self.cell_of(pos)
+        order = self._next_order
+        self._next_order += 1
+        self._cells.setdefault(cell, []).append((order, entity))
+        self._where[id(entity)] = (cell, order)
+
+    def remove(self, entity: Any) -> None:
+        where = self._where.pop(id(entity), None)
+        if where is None:
+            return
+        cell, order = where
+        bucket = self._cells[cell]
+        bucket.remove((order, entity))
+        if not bucket:
+            del self._cells[cell]
+
+    def move(self, entity: Any, pos: Vector2) -> None:
+        """Re-bucket <entity> after it moved, keeping its insertion order."""
+        where = self._where.get(id(entity))
+        if where is None:
+            self.insert(entity, pos)
+            return
+        old_cell, order = where
+        new_cell = self.cell_of(pos)
+        if new_cell == old_cell:
+            return
+        bucket = self._cells[old_cell]
+        bucket.remove((order, entity))
+        if not bucket:
+            del self._cells[old_cell]
+        self._cells.setdefault(new_cell, []).append((order, entity))
+        self._where[id(entity)] = (new_cell, order)
+
+    # ── queries ───────────────────────────────────────────────────────
+    def query(self, pos: Vector2, radius: float) -> List[Any]:
+        """Entities in every cell touched by the circle (pos, radius)."""
+        cs = self.cell_size
+        return self._collect(
+            math.floor((pos.x - radius) / cs), math.floor((pos.x + radius) / cs),
+            math.floor((pos.y - radius) / cs), math.floor((pos.y + radius) / cs),
+        )
+
+    def query_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Any]:
+        """Entities in every cell touched by [min_x,max_x]×[min_y,max_y]."""
+        cs = self.cell_size
+        return self._collect(
+            math.floor(min_x / cs), math.floor(max_x / cs),
+            math.floor(min_y / cs), math.floor(max_y / cs),
+        )
+
+    def _collect(self, cx0: int, cx1: int, cy0: int, cy1: int) -> List[Any]:
+        cells = self._cells
+        found: List[Tuple[int, Any]] = []
+        # a sparse grid can have far fewer buckets than the query window
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+            for (cx, cy), bucket in cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    found.extend(bucket)
+        else:
+            for cy in range(cy0, cy1 + 1):
+                for cx in range(cx0, cx1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        found.extend(bucket)
+        found.sort(key=lambda item: item[0])
+        return [entity for _, entity in found]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING
+
+from pygame.math import Vector2
+
+from my_safari_project.model.spatial_hash import SpatialHash
+
+if TYPE_CHECKING:
+    from my_safari_project.model.entity_list import EntityList
+
+Keep = Callable[[Any], bool]
+
+
+class SpatialIndex:
+    """
+    A board's entities bucketed by position, one SpatialHash per kind.
+
+    The simulation calls `refresh()` once per tick (AnimalAI needs fresh
+    buckets for detection anyway) and the EntityList hooks insert and drop
+    entities in between, so the renderer can ask what lies in the camera
+    window without walking the full lists. Positions may be up to a tick
+    old between refreshes; callers that need exact bounds re-check the
+    candidates they get back.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.grids: Dict[str, SpatialHash] = {}
+        self._sources: Dict[str, Tuple["EntityList", Keep | None]] = {}
+
+    def track(self, kind: str, entities: "EntityList", keep: Keep | None = None) -> None:
+        """Index <entities> under <kind>; with <keep>, only those it accepts."""
+        grid = self.grids[kind] = SpatialHash(self.cell_size)
+        self._sources[kind] = (entities, keep)
+
+        def added(entity):
+            if keep is None or keep(entity):
+                grid.insert(entity, entity.position)
+
+        entities.watch(on_add=added, on_remove=grid.remove)
+        for entity in entities:
+            added(entity)
+
+    def refresh(self) -> None:
+        """Re-bucket every kind from its list, in list order."""
+        for kind, (entities, keep) in self._sources.items():
+            self.grids[kind].rebuild(entities if keep is None else [e for e in entities if keep(e)])
+
+    def entities(self, kind: str) -> "EntityList":
+        """The list <kind> is indexed from (including entities <keep> rejects)."""
+        return self._sources[kind][0]
+
+    def query(self, kind: str, pos: Vector2, radius: float) -> List[Any]:
+        """<kind> entities in the cells touched by the circle (pos, radius), in list order."""
+        return self.grids[kind].query(pos, radius)
+
+    def query_rect(self, kind: str, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Any]:
+        """<kind> entities in the cells touched by the rectangle, in list order."""
+        return self.grids[kind].query_rect(min_x, min_y, max_x, max_y)
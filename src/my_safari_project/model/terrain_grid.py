@@ -0,0 +1,168 @@
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, Iterator, List, Set, Tuple
+from pygame.math import Vector2
+
+from my_safari_project.model.field import Field, TerrainType
+
+TERRAIN_TYPES = tuple(TerrainType)
+TERRAIN_CODE = {t: i for i, t in enumerate(TERRAIN_TYPES)}
+GRASS = TERRAIN_CODE[TerrainType.GRASS]
+
+CHUNK = 16      # tiles per side of a change-tracking (and render) chunk
+
+
+class TerrainGrid:
+    """
+    Flat, array-backed storage for a board's tiles.
+
+    Each per-tile property lives in its own row-major `array` column, and
+    objects standing on a tile are kept in a sparse dict, so a board costs a
+    few bytes per tile instead of a full Field object. `board.fields[y][x]`
+    hands out GridField views onto these columns on demand.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width, self.height = width, height
+        n = width * height
+        self.terrain       = array("B", [GRASS]) * n
+        self.elevation     = array("f", [0.0]) * n
+        self.movement_cost = array("f", [1.0]) * n
+        self.water_level   = array("f", [0.0]) * n
+        self.walkable      = array("B", [1]) * n
+        self.obstacle      = array("B", [0]) * n
+        self.occupancy     = array("H", [0]) * n
+        self.objects: Dict[int, List[Any]] = {}
+        self.dirty: Set[Tuple[int, int]] = set()     # chunks whose look changed
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def field(self, x: int, y: int) -> "GridField":
+        return GridField(self, x, y)
+
+    def terrain_at(self, x: int, y: int) -> TerrainType:
+        return TERRAIN_TYPES[self.terrain[y * self.width + x]]
+
+    # ── change tracking ───────────────────────────────────────────────
+    def mark_dirty(self, x: int, y: int) -> None:
+        """Record that tile (x, y) looks different (terrain or road changed)."""
+        self.dirty.add((int(x) // CHUNK, int(y) // CHUNK))
+
+    def take_dirty(self) -> Set[Tuple[int, int]]:
+        dirty, self.dirty = self.dirty, set()
+        return dirty
+
+    # ── occupancy ─────────────────────────────────────────────────────
+    def add_object(self, i: int, obj: Any) -> None:
+        self.objects.setdefault(i, []).append(obj)
+        self.occupancy[i] += 1
+
+    def remove_object(self, i: int, obj: Any) -> None:
+        objs = self.objects.get(i)
+        if objs and obj in objs:
+            objs.remove(obj)
+            self.occupancy[i] -= 1
+            if not objs:
+                del self.objects[i]
+
+
+class GridField(Field):
+    """A Field whose state lives in a TerrainGrid; cheap to create and discard."""
+
+    def __init__(self, grid: TerrainGrid, x: int, y: int):
+        # Field.__init__ is skipped on purpose: every attribute maps onto the grid
+        self._grid = grid
+        self._i = y * grid.width + x
+        self.x, self.y = x, y
+
+    def _column(name: str, cast=float):
+        def get(self):
+            return cast(getattr(self._grid, name)[self._i])
+
+        def set(self, value):
+            getattr(self._grid, name)[self._i] = value
+        return property(get, set)
+
+    elevation     = _column("elevation")
+    movement_cost = _column("movement_cost")
+    water_level   = _column("water_level")
+    walkable      = _column("walkable", bool)
+    is_obstacle   = _column("obstacle", bool)
+    del _column
+
+    @property
+    def terrain_type(self) -> TerrainType:
+        return TERRAIN_TYPES[self._grid.terrain[self._i]]
+
+    @terrain_type.setter
+    def terrain_type(self, value: str | TerrainType):
+        if isinstance(value, str):
+            value = TerrainType(value.upper())
+        self._grid.terrain[self._i] = TERRAIN_CODE[value]
+        self._grid.mark_dirty(self.x, self.y)
+
+    @property
+    def field_id(self) -> int:
+        return self._i
+
+    @property
+    def position(self) -> Vector2:
+        return Vector2(self.x, self.y)
+
+    @property
+    def objects_on_field(self) -> List[Any]:
+        """Read-only snapshot; use add_object/remove_object to change it."""
+        return list(self._grid.objects.get(self._i, ()))
+
+    def add_object(self, obj: Any) -> None:
+        self._grid.add_object(self._i, obj)
+
+    def remove_object(self, obj: Any) -> None:
+        self._grid.remove_object(self._i, obj)
+
+    def is_occupied(self) -> bool:
+        return self._grid.occupancy[self._i] > 0
+
+
+class FieldRows:
+    """`board.fields` stand-in: fields[y][x] yields a GridField."""
+
+    def __init__(self, grid: TerrainGrid):
+        self._grid = grid
+
+    def __len__(self) -> int:
+        return self._grid.height
+
+    def __getitem__(self, y: int) -> "FieldRow":
+        if y < 0:
+            y += self._grid.height
+        if not 0 <= y < self._grid.height:
+            raise IndexError("board row out of range")
+        return FieldRow(self._grid, y)
+
+    def __iter__(self) -> Iterator["FieldRow"]:
+        for y in range(self._grid.height):
+            yield FieldRow(self._grid, y)
+
+
+class FieldRow:
+    def __init__(self, grid: TerrainGrid, y: int):
+        self._grid, self._y = grid, y
+
+    def __len__(self) -> int:
+        return self._grid.width
+
+    def __getitem__(self, x: int) -> GridField:
+        if x < 0:
+            x += self._grid.width
+        if not 0 <= x < self._grid.width:
+            raise IndexError("board column out of range")
+        return GridField(self._grid, x, self._y)
+
+    def __iter__(self) -> Iterator[GridField]:
+        for x in range(self._grid.width):
+            yield GridField(self._grid, x, self._y)
@@ -27,6 +27,18 @@ class Timer:
         self.elapsed_seconds += dt
         return dt
     
+    def frame(self, fps: int = 60) -> float:
+        """
+        Wait for the next frame (capped at <fps>) and return the real seconds
+        since the previous one, without advancing the in-game clock.
+        """
+        return self.clock.tick(fps) / 1000.0
+
+    def advance(self, dt: float) -> float:
+        """Advance the in-game clock by <dt> game seconds without waiting on the wall clock."""
+        self.elapsed_seconds += dt
+        return dt
+
     def get_game_time(self):
         years, r    = divmod(self.elapsed_seconds, TIME_SCALE["year"])
         months, r   = divmod(r, TIME_SCALE["month"])
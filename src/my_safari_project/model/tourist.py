@@ -17,8 +17,9 @@ class Tourist:
         self.target: Vector2 | None = None
         self.speed = 0.6
         self.board = board
+        self.rng = getattr(board, "rng", random)
         self.wander_timer = 0.0
-        self.wander_duration = random.uniform(15, 30)  # Wander for 15-30 seconds
+        self.wander_duration = self.rng.uniform(15, 30)  # Wander for 15-30 seconds
         self.movement_state = "waiting"  # "waiting", "in_jeep", "wandering", "exiting"
 
     def enter_jeep(self, jeep: Jeep):
@@ -32,8 +33,8 @@ class Tourist:
     def exit_jeep(self):
         if self.in_jeep:
             # Position slightly offset from jeep to avoid overlap
-            offset_angle = random.uniform(0, 2 * math.pi)
-            offset_distance = random.uniform(1, 2)
+            offset_angle = self.rng.uniform(0, 2 * math.pi)
+            offset_distance = self.rng.uniform(1, 2)
             offset_x = offset_distance * math.cos(offset_angle)
             offset_y = offset_distance * math.sin(offset_angle)
             
@@ -45,14 +46,14 @@ class Tourist:
             self.movement_state = "wandering"
             self.roaming = True
             self.wander_timer = 0.0
-            self.wander_duration = random.uniform(15, 30)  # Wander for 15-30 seconds
+            self.wander_duration = self.rng.uniform(15, 30)  # Wander for 15-30 seconds
             self.target = self._get_wander_target()
 
     def _get_wander_target(self):
         """Get a random nearby target for wandering."""
         # Wander in a small area around current position
-        angle = random.uniform(0, 2 * math.pi)
-        distance = random.uniform(1, 4)  # Stay relatively close
+        angle = self.rng.uniform(0, 2 * math.pi)
+        distance = self.rng.uniform(1, 4)  # Stay relatively close
         dx = distance * math.cos(angle)
         dy = distance * math.sin(angle)
         
@@ -67,12 +68,8 @@ class Tourist:
 
     def _get_exit_target(self):
         """Get the nearest exit for leaving the safari."""
-        if not self.board.exits:
-            return self.position
-        
-        # Find nearest exit
-        nearest_exit = min(self.board.exits, key=lambda exit: self.position.distance_to(Vector2(exit)))
-        return Vector2(nearest_exit)
+        nearest_exit = self.board.road_graph.nearest_exit(self.position)
+        return nearest_exit if nearest_exit is not None else self.position
 
     def update(self, dt: float, board):
         if self.movement_state == "in_jeep":
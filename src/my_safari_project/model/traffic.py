@@ -0,0 +1,98 @@
+from __future__ import annotations
+import math
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from my_safari_project.model.jeep import Jeep
+    from my_safari_project.model.entity_list import EntityList
+
+Tile = Tuple[int, int]
+
+
+class TrafficManager:
+    """
+    Road-tile occupancy of a board's jeeps.
+
+    Follows `board.jeeps` through the EntityList hooks and is told by
+    Board.update when a jeep has moved, so it always knows which tile every
+    jeep is on. Crash checks then only look at the jeeps on the tiles
+    around a jeep instead of at the whole fleet. Jeeps are reported in the
+    order they joined the board, i.e. the order of `board.jeeps`.
+
+    Occupancy is by tile only: there is no ordering of jeeps along a road
+    segment and no yield rule. Jeeps do not yield to each other in this
+    game (two jeeps within SAFE_RADIUS crash), so `nearby` only serves the
+    crash check, and it only sees jeeps on the 3x3 tiles around a jeep,
+    i.e. radii up to one tile.
+    """
+
+    def __init__(self, jeeps: "EntityList"):
+        self._tile: Dict["Jeep", Tile] = {}
+        self._order: Dict["Jeep", int] = {}
+        self._occupants: Dict[Tile, List["Jeep"]] = {}
+        self._next_order = 0
+        jeeps.watch(on_add=self.enter, on_remove=self.leave)
+        for jeep in jeeps:
+            self.enter(jeep)
+
+    def __len__(self) -> int:
+        return len(self._tile)
+
+    def __contains__(self, jeep: "Jeep") -> bool:
+        return jeep in self._tile
+
+    @staticmethod
+    def tile_of(jeep: "Jeep") -> Tile:
+        return (math.floor(jeep.position.x), math.floor(jeep.position.y))
+
+    # ── bookkeeping ───────────────────────────────────────────────────
+    def enter(self, jeep: "Jeep") -> None:
+        if jeep in self._tile:
+            return
+        tile = self.tile_of(jeep)
+        self._tile[jeep] = tile
+        self._order[jeep] = self._next_order
+        self._next_order += 1
+        self._occupants.setdefault(tile, []).append(jeep)
+
+    def leave(self, jeep: "Jeep") -> None:
+        tile = self._tile.pop(jeep, None)
+        if tile is None:
+            return
+        del self._order[jeep]
+        self._vacate(jeep, tile)
+
+    def moved(self, jeep: "Jeep") -> None:
+        """Re-file <jeep> after its position changed."""
+        old = self._tile.get(jeep)
+        if old is None:
+            return
+        tile = self.tile_of(jeep)
+        if tile != old:
+            self._vacate(jeep, old)
+            self._tile[jeep] = tile
+            self._occupants.setdefault(tile, []).append(jeep)
+
+    def _vacate(self, jeep: "Jeep", tile: Tile) -> None:
+        occupants = self._occupants[tile]
+        occupants.remove(jeep)
+        if not occupants:
+            del self._occupants[tile]
+
+    # ── queries ───────────────────────────────────────────────────────
+    def occupants(self, tile: Tile) -> List["Jeep"]:
+        return list(self._occupants.get(tile, ()))
+
+    def nearby(self, jeep: "Jeep", radius: float) -> List["Jeep"]:
+        """Other jeeps closer than <radius> (at most one tile) to <jeep>, in board order."""
+        x, y = self.tile_of(jeep)
+        pos = jeep.position
+        found = []
+        for ty in (y - 1, y, y + 1):
+            for tx in (x - 1, x, x + 1):
+                for other in self._occupants.get((tx, ty), ()):
+                    if other is not jeep and pos.distance_to(other.position) < radius:
+                        found.append(other)
+        if len(found) > 1:
+            found.sort(key=self._order.__getitem__)
+        return found
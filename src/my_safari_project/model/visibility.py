@@ -0,0 +1,46 @@
+from __future__ import annotations
+import math
+from typing import Any, Dict, List, Tuple
+from pygame.math import Vector2
+
+Cell = Tuple[int, int]
+
+
+class VisibilityField:
+    """
+    Coverage of the board by a set of observers, each seeing a fixed radius.
+
+    Observers are stamped into a coarse grid once (per frame or per tick),
+    after which `covers(pos)` only checks the observers in the cells around
+    <pos> instead of all of them. Distances are exact, so the answer is the
+    same as testing every observer. Observers are read live: stamp them
+    only for as long as they stay where they were stamped.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Cell, List[Tuple[Any, float, bool]]] = {}
+        self._reach = 0             # cells to search around a point
+
+    def __len__(self) -> int:
+        return sum(len(stamps) for stamps in self._cells.values())
+
+    def stamp(self, observer: Any, radius: float, while_alive: bool = False) -> None:
+        """<observer> sees <radius> tiles around itself (only while is_alive, if asked)."""
+        cs = self.cell_size
+        pos = observer.position
+        cell = (math.floor(pos.x / cs), math.floor(pos.y / cs))
+        self._cells.setdefault(cell, []).append((observer, radius, while_alive))
+        self._reach = max(self._reach, math.ceil(radius / cs))
+
+    def covers(self, pos: Vector2) -> bool:
+        """Is <pos> within sight of any stamped observer?"""
+        cs, reach, cells = self.cell_size, self._reach, self._cells
+        cx, cy = math.floor(pos.x / cs), math.floor(pos.y / cs)
+        for y in range(cy - reach, cy + reach + 1):
+            for x in range(cx - reach, cx + reach + 1):
+                for observer, radius, while_alive in cells.get((x, y), ()):
+                    if (pos.distance_to(observer.position) <= radius
+                            and (not while_alive or observer.is_alive)):
+                        return True
+        return False
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 import pygame
-from my_safari_project.model.field import TerrainType
 from pygame import Surface, Rect
 from pygame.math import Vector2
 from typing import Tuple
@@ -11,8 +10,18 @@ from my_safari_project.model.board import Board
 from my_safari_project.model.road  import Road, RoadType
 from my_safari_project.model.animal import Animal
 from my_safari_project.model.timer import TIME_SCALE
+from my_safari_project.model.visibility import VisibilityField
+from my_safari_project.view.sprite_cache import SpriteCache
+from my_safari_project.view.text_cache import TextCache
+from my_safari_project.view.surface_pool import SurfacePool
+from my_safari_project.view.terrain_chunks import TerrainChunks
+from my_safari_project.control.profiler import profiler
 
-
+# Tiles added around the camera window when asking the spatial index what to draw.
+# Its buckets are at most one sim tick old, and nothing moves that far in a tick
+# (tourists stepping out of a jeep land at most two tiles away).
+CULL_MARGIN = 3
+NIGHT_SIGHT = 5     # tiles a ranger or tourist can see in the dark
 
 
 class BoardGUI:
@@ -49,8 +58,19 @@ class BoardGUI:
         self._dn_period = 8 * 60
         self.dn_opacity = 0.0
 
+        # Interpolation between the last two fixed simulation steps
+        self.alpha = 1.0
+        self._prev_pos: dict[int, tuple] = {}
+
         # --- load all images --------------------------------------------
         self._load_assets()
+        self.sprites = SpriteCache()    # scaled/rotated copies for the current zoom
+        self.texts = TextCache()        # rendered labels, shared with GameGUI and AnimalAI
+        self.overlays = SurfacePool()   # per-frame overlay surfaces, reused while the size holds
+        self._night_layers: tuple = ()  # (tint, shade, glow) last filled into the night layers
+        self.terrain_layer = TerrainChunks(board)
+        self._doors: list[tuple] = []
+        self._doors_revision = -1
     
 
     # ─── asset loading ────────────────────────────────────────────────
@@ -123,6 +143,7 @@ class BoardGUI:
         self.tile = max(self.MIN_TILE,   min(self.tile + direction * 4, self.MAX_TILE))
         if self.tile == old_tile:
             return
+        self.sprites.clear()
 
         mx, my = mouse_pos
 
@@ -176,6 +197,24 @@ class BoardGUI:
 
 
     # ─── rendering ─────────────────────────────────────────────────────
+    def snapshot_positions(self):
+        """Remember where every moving entity is before the next simulation step."""
+        b = self.board
+        self._prev_pos = {
+            id(e): (e, e.position.x, e.position.y)
+            for group in (b.animals, b.jeeps, b.rangers, b.poachers, b.tourists, b.waiting_tourists)
+            for e in group
+        }
+
+    def _interp(self, entity) -> Vector2:
+        """<entity>'s position blended between the previous and current step."""
+        pos = entity.position
+        prev = self._prev_pos.get(id(entity))
+        if prev is None or prev[0] is not entity or self.alpha >= 1.0:
+            return pos
+        a = self.alpha
+        return Vector2(prev[1] + (pos.x - prev[1]) * a, prev[2] + (pos.y - prev[2]) * a)
+
     @staticmethod
     def _lerp(c1: Tuple[int,int,int,int],
               c2: Tuple[int,int,int,int], t: float) -> Tuple[int,int,int,int]:
@@ -187,6 +226,38 @@ class BoardGUI:
     def _smoothstep(t: float) -> float:
         return t * t * (3 - 2 * t)
 
+    def _in_view(self, kind: str, view: tuple, extra: float = 0) -> list:
+        """
+        Candidates of <kind> for the window <view> = (min_x, min_y, max_x, max_y),
+        from the board's spatial index. The index is refreshed once per sim tick,
+        so the window is padded by CULL_MARGIN; callers still check the exact bounds.
+        """
+        pad = CULL_MARGIN + extra
+        min_x, min_y, max_x, max_y = view
+        # always through the index, even at full zoom-out, so what is drawn
+        # (e.g. dead animals awaiting pruning) does not depend on the zoom level
+        return self.board.spatial.query_rect(kind, min_x - pad, min_y - pad, max_x + pad, max_y + pad)
+
+    def _door_tiles(self) -> list[tuple]:
+        """(entrance/exit tile, door x, door y, is_entrance), recomputed only when the roads change."""
+        revision = self.board.road_graph.revision()
+        if revision != self._doors_revision:
+            self._doors_revision = revision
+            self._doors = []
+            for doors, is_entrance in [(self.board.entrances, True), (self.board.exits, False)]:
+                for e in doors:
+                    door_x, door_y = e.x, e.y
+                    road = self.board.road_at(e.x, e.y)
+                    if road:
+                        # the gate stands two tiles beyond the open end of the road
+                        match road.type:
+                            case RoadType.STRAIGHT_H:
+                                door_x, door_y = (e.x + 2, e.y) if self.board.has_road(e.x - 1, e.y) else (e.x - 2, e.y)
+                            case RoadType.STRAIGHT_V:
+                                door_x, door_y = (e.x, e.y - 2) if self.board.has_road(e.x, e.y + 1) else (e.x, e.y + 2)
+                    self._doors.append((Vector2(e), door_x, door_y, is_entrance))
+        return self._doors
+
     def render(self,screen: Surface,rect: Rect,*,hover_tile: Vector2 | None = None, hover_valid: bool = False ) -> None:
         if self.board.width == 0 or self.board.height == 0:
             return
@@ -208,147 +279,122 @@ class BoardGUI:
         vis_w = int(max_x - min_x)
         vis_h = int(max_y - min_y)
 
-        visible_map = None
-        world_x = world_y = 0
+        # at night animals show only when tagged or near a ranger or tourist;
+        # who sees where is stamped once per frame, not checked per animal
+        night_sight = None
         if self._night_active:
-            radius = 5
-            mx, my = self._cursor_pos
-            world_x = self.cam.x + (mx - rect.centerx) / side
-            world_y = self.cam.y + (my - rect.centery) / side
-            visible_map = lambda x, y: (x - world_x) ** 2 + (y - world_y) ** 2 <= radius ** 2
+            night_sight = VisibilityField(NIGHT_SIGHT)
+            for watcher in (*self.board.rangers, *self.board.tourists):
+                night_sight.stamp(watcher, NIGHT_SIGHT)
 
         # LAYER 1: Background
-        bg = pygame.transform.scale(self.desert, ((max_x - min_x) * side, (max_y - min_y) * side))
+        t = profiler.mark()
+        bg = self.sprites.get("ground", self.desert, ((max_x - min_x) * side, (max_y - min_y) * side))
         screen.blit(bg, (ox, oy))
+        t = profiler.lap("render.background", t)
 
-        # LAYER 2: Terrain
-        for y in range(min_y, max_y):
-            for x in range(min_x, max_x):
-                if 0 <= x < self.board.width and 0 <= y < self.board.height:
-                    field = self.board.fields[y][x]
-                    px = ox + int((x - min_x) * side)
-                    py = oy + int((y - min_y) * side)
-
-                    terrain_value = (field.terrain_type.value
-                                     if hasattr(field.terrain_type, 'value')
-                                     else field.terrain_type)
-
-                    # Draw terrain based on type
-                    if terrain_value != TerrainType.GRASS.value:
-                        pygame.draw.rect(screen, field.get_color(terrain_value), (px, py, side, side))
-
-        # Roads
-        def draw_single_road(rd):
-            px, py = int(ox + (rd.pos.x - min_x) * side), int(oy + (rd.pos.y - min_y) * side)
-            margin = int(side // 2.5)
-            yellow, lw = (200, 200, 0), max(1, int(side // 30))  # Darker yellow
-            pygame.draw.rect(screen, (0, 0, 0), (px, py, int(side), int(side))) # Black road surface
-            match rd.type:
-                case RoadType.STRAIGHT_H:
-                    pygame.draw.line(screen, yellow, (px + margin, py + int(side)//2), (px + int(side) - margin, py + int(side)//2), lw)
-                case RoadType.STRAIGHT_V:
-                    pygame.draw.line(screen, yellow, (px + int(side)//2, py + margin), (px + int(side)//2, py + int(side) - margin), lw)
-        for rd in self.board.roads:
-            if min_x <= rd.pos.x < max_x and min_y <= rd.pos.y < max_y:
-                draw_single_road(rd)
+        # LAYER 2-3: Terrain and roads, pre-rendered per chunk
+        self.terrain_layer.render(screen, side, ox, oy, min_x, min_y, max_x, max_y)
+        t = profiler.lap("render.terrain", t)
 
         # LAYER 4: Entrances and Exits
-        for doors, is_entrance in [(self.board.entrances, True), (self.board.exits, False)]:
-            for e in doors[:]:
-                if min_x <= e.x < max_x and min_y <= e.y < max_y:
-                    road = next((r for r in self.board.roads if r.pos == e), None)
-                    if road:
-                        match road.type:
-                            case RoadType.STRAIGHT_H:
-                                door_x, door_y = (e.x + 2, e.y) if any(r.pos == Vector2(e.x - 1, e.y) for r in self.board.roads) else (e.x - 2, e.y)
-                            case RoadType.STRAIGHT_V:
-                                door_x, door_y = (e.x, e.y - 2) if any(r.pos == Vector2(e.x, e.y + 1) for r in self.board.roads) else (e.x, e.y + 2)
-                    else:
-                        door_x, door_y = e.x, e.y
-                    
-                    if min_x <= door_x < max_x and min_y <= door_y < max_y:
-                        door_size = int(side * 1.5)
-                        px = ox + int((door_x - min_x) * side) - (door_size - side) // 2
-                        py = oy + int((door_y - min_y) * side) - (door_size - side)  # Bottom-aligned
-                        img = self.entrance if is_entrance else self.exit
-                        screen.blit(pygame.transform.scale(img, (door_size, door_size)), (px, py))
+        for e, door_x, door_y, is_entrance in self._door_tiles():
+            if (min_x <= e.x < max_x and min_y <= e.y < max_y
+                    and min_x <= door_x < max_x and min_y <= door_y < max_y):
+                door_size = int(side * 1.5)
+                px = ox + int((door_x - min_x) * side) - (door_size - side) // 2
+                py = oy + int((door_y - min_y) * side) - (door_size - side)  # Bottom-aligned
+                img = (self.sprites.get("entrance", self.entrance, (door_size, door_size)) if is_entrance
+                       else self.sprites.get("exit", self.exit, (door_size, door_size)))
+                screen.blit(img, (px, py))
+        t = profiler.lap("render.doors", t)
 
         # LAYER 5: Static entities (Ponds and Plants)
         # Ponds
-        for p in self.board.ponds:
+        view = (min_x, min_y, max_x, max_y)
+        for p in self._in_view("pond", view):
             x, y = p.position
             if min_x <= x < max_x and min_y <= y < max_y:
                 px = ox + int((x - min_x) * side)
                 py = oy + int((y - min_y) * side)
-                screen.blit(pygame.transform.scale(self.pond, (side, side)), (px, py))
+                screen.blit(self.sprites.get("pond", self.pond, (side, side)), (px, py))
         # Plants
         gw, gh = side, int(side * 1.2)
-        for p in self.board.plants:
+        for p in self._in_view("plant", view):
             x, y = p.position
             if min_x <= x < max_x and min_y <= y < max_y:
                 px = ox + int((x - min_x) * side)
                 py = oy + int((y - min_y) * side - (gh - side) ) 
                 screen.blit(
-                    pygame.transform.scale(self.plant, (gw, gh)),
+                    self.sprites.get("plant", self.plant, (gw, gh)),
                     (px, py)
                 )
+        t = profiler.lap("render.statics", t)
+
+        # animals in this window keep deciding every tick under the LOD scheduler
+        scheduler = getattr(self.board.wildlife_ai.animal_ai, "scheduler", None)
+        if scheduler is not None:
+            scheduler.view = (min_x, min_y, max_x, max_y)
 
         # LAYER 6: Animal debug overlays (if enabled)
         if getattr(self.board.wildlife_ai.animal_ai, "debug_mode"):
-            self.board.wildlife_ai.animal_ai.render(screen, ox, oy, side, min_x, min_y)
+            self.board.wildlife_ai.animal_ai.render(screen, ox, oy, side, min_x, min_y, self.texts)
+            t = profiler.lap("render.debug", t)
 
         # LAYER 7: Moving entities (Animals, Jeeps, Rangers, etc.)
         # Animals
         aw, ah = side, side
-        for animal in self.board.animals:
-            loc = getattr(animal, "position", Vector2(0, 0))
-
-            if self._night_active:
-                is_tagged = animal.animal_id in self.board.visible_animals_night
-                near_ranger = any(r.position.distance_to(loc) <= 5 for r in self.board.rangers)
-                near_tourist = any(t.position.distance_to(loc) <= 5 for t in self.board.tourists)
-                if not (is_tagged or near_ranger or near_tourist):
+        for animal in self._in_view("animal", view):
+            loc = self._interp(animal)
+            if not (min_x <= loc.x < max_x and min_y <= loc.y < max_y):
+                continue
+
+            if night_sight is not None:
+                if not (animal.animal_id in self.board.visible_animals_night or night_sight.covers(loc)):
                     continue
 
             px = ox + int((loc.x - min_x) * side)
             py = oy + int((loc.y - min_y) * side)
-            screen.blit(pygame.transform.scale(self.animals[animal.species.value], (aw, ah)), (px, py))
-        # Jeeps
+            screen.blit(self.sprites.get(("animal", animal.species.value), self.animals[animal.species.value], (aw, ah)), (px, py))
+        # Jeeps (drawn centred, so they may reach in from two tiles outside)
         jw = jh = side * 2
-        for j in self.board.jeeps:
-            cx, cy = j.position
+        for j in self._in_view("jeep", view, extra=2):
+            cx, cy = self._interp(j)
             if (min_x - 2) <= cx < (max_x + 2) and (min_y - 2) <= cy < (max_y + 2):
-                img = pygame.transform.scale(self.jeep, (jw, jh))
-                img = pygame.transform.rotate(img, -j.heading)
+                img = self.sprites.get("jeep", self.jeep, (jw, jh), -j.heading)
                 r = img.get_rect(center=(0, 0))
                 px = ox + int((cx - min_x) * side - r.width / 2)
                 py = oy + int((cy - min_y) * side - r.height / 2)
                 screen.blit(img, (px, py))
         # Rangers
-        for r in self.board.rangers:
-            rx, ry = r.position
+        for r in self._in_view("ranger", view):
+            rx, ry = self._interp(r)
             if min_x <= rx < max_x and min_y <= ry < max_y:
                 px = ox + int((rx - min_x) * side)
                 py = oy + int((ry - min_y) * side)
-                screen.blit(pygame.transform.scale(self.ranger, (side, side)), (px, py))
+                screen.blit(self.sprites.get("ranger", self.ranger, (side, side)), (px, py))
         # Poachers
-        for p in self.board.poachers:        
-            px = ox + int((p.position.x - min_x) * side)
-            py = oy + int((p.position.y - min_y) * side)
-            screen.blit(pygame.transform.scale(self.poacher, (side, side)), (px, py))
-        # Tourists (only if not inside a jeep)
+        for p in self._in_view("poacher", view):
+            loc = self._interp(p)
+            if min_x <= loc.x < max_x and min_y <= loc.y < max_y:
+                px = ox + int((loc.x - min_x) * side)
+                py = oy + int((loc.y - min_y) * side)
+                screen.blit(self.sprites.get("poacher", self.poacher, (side, side)), (px, py))
+        # Tourists (only if not inside a jeep); waiting ones are a subset of board.tourists
         tourist_size = int(side * 1.5)
         radius = max(3, int(side * 0.2))
-        for t in self.board.tourists + self.board.waiting_tourists:
-            if hasattr(t, 'in_jeep') and t.in_jeep is not None: continue
-            tx, ty = t.position
+        waiting = set(self.board.waiting_tourists)
+        for t in self._in_view("tourist", view):
+            if t.in_jeep is not None: continue
+            tx, ty = self._interp(t)
             if min_x <= tx < max_x and min_y <= ty < max_y:
                 px = ox + int((tx - min_x) * side)
                 py = oy + int((ty - min_y) * side)
-                if t in self.board.waiting_tourists:
+                if t in waiting:
                     pygame.draw.circle(screen, (255, 215, 0), (px + side // 2, py + side // 2), radius)
                 else:
-                    screen.blit(pygame.transform.scale(self.tourist, (tourist_size, tourist_size)), (px, py))
+                    screen.blit(self.sprites.get("tourist", self.tourist, (tourist_size, tourist_size)), (px, py))
+        t = profiler.lap("render.entities", t)
 
         # LAYER 8: Hover highlight
         if hover_tile is not None:
@@ -357,8 +403,8 @@ class BoardGUI:
             if min_x <= tx < max_x and min_y <= ty < max_y:
                 px = ox + int((tx - min_x) * side)
                 py = oy + int((ty - min_y) * side)
-                # create a transparent surface
-                overlay = pygame.Surface((side, side), pygame.SRCALPHA)
+                # a transparent tile, reused until the zoom changes
+                overlay = self.overlays.get("hover", (side, side))
                 color = (0,200,0,100) if hover_valid else (200,0,0,100) 
                 overlay.fill(color)
                 screen.blit(overlay, (px, py))
@@ -367,9 +413,19 @@ class BoardGUI:
         if self.dn_opacity > 0:
             smoothed = self._smoothstep(self.dn_opacity)
             tint = self._lerp((255, 255, 255, 0), (0, 0, 70, 160), smoothed)
-            ov = pygame.Surface((vis_w * side, vis_h * side), pygame.SRCALPHA)
-            ov.fill(tint)
-            screen.blit(ov, (ox, oy))
+            # the tint blended over dst, dst*(1-a) + tint*a, is a multiply then an
+            # add; both layers are pooled and refilled only when the tint changes
+            size = (vis_w * side, vis_h * side)
+            shade = self.overlays.get("night.shade", size, 0)
+            glow = self.overlays.get("night.glow", size, 0)
+            if self._night_layers != (tint, shade, glow):
+                r, g, b, a = tint
+                shade.fill((255 - a,) * 3)
+                glow.fill((r * a // 255, g * a // 255, b * a // 255))
+                self._night_layers = (tint, shade, glow)
+            screen.blit(shade, (ox, oy), special_flags=pygame.BLEND_RGB_MULT)
+            screen.blit(glow, (ox, oy), special_flags=pygame.BLEND_RGB_ADD)
+        profiler.lap("render.overlays", t)
 
     def screen_to_board(self, screen_pos, rect):
         rel_x = screen_pos[0] - rect.centerx
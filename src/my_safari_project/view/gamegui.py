@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sys
 from typing import List
 import tkinter as tk
@@ -9,6 +10,8 @@ import pygame
 from pygame.math import Vector2
 
 from my_safari_project.view.boardgui import BoardGUI
+from my_safari_project.view.panel_cache import CachedPanel
+from my_safari_project.control.profiler import profiler
 from my_safari_project.control.game_controller import (
     GameController,
     RANGER_COST, PLANT_COST, POND_COST,
@@ -38,7 +41,14 @@ BOARD_RECT = pygame.Rect(
     SCREEN_H - TOP_BAR_H - BOTTOM_BAR_H - 20    # Height (remaining vertical space)
 )
 
+# screen areas outside the board scene, each pre-rendered by a CachedPanel
+TOP_BAR_RECT    = pygame.Rect(0, 0, SCREEN_W, TOP_BAR_H)
+BOTTOM_BAR_RECT = pygame.Rect(0, SCREEN_H - BOTTOM_BAR_H, SCREEN_W - SIDE_PANEL_W, BOTTOM_BAR_H)
+SIDE_PANEL_RECT = pygame.Rect(SCREEN_W - SIDE_PANEL_W, TOP_BAR_H, SIDE_PANEL_W, SCREEN_H - TOP_BAR_H)
+SCENE_RECT      = pygame.Rect(0, TOP_BAR_H, SCREEN_W - SIDE_PANEL_W, SCREEN_H - TOP_BAR_H - BOTTOM_BAR_H)
+
 ZOOM_BTN_SZ = 32        # size of the + / – buttons
+PROFILE_DIR = "profiles"  # where the tick profiler exports (O key)
 SPEED_LEVELS = [1, 4, 8] #index 0 for 1x, index 1 for 4x, index 2 for 8x speed levels => logical speeds for buttons 1x,2x,3x
 # ────────────────────────────────── GameGUI ───────────────────────────────────
 class GameGUI:
@@ -96,6 +106,7 @@ class GameGUI:
         self.control: GameController = controller
         tile_w = BOARD_RECT.width // self.control.board.width  
         self.board_gui = BoardGUI(self.control.board, default_tile=tile_w)
+        self.texts = self.board_gui.texts     # rendered labels, see text_cache.py
         self.feedback_queue = []
 
         # Set initial zoom to show full board
@@ -152,9 +163,22 @@ class GameGUI:
         self.hover_tile    = None
         self.hover_valid   = False
 
+        # cached panels and what the last frame showed (see _draw)
+        self.top_bar    = CachedPanel(TOP_BAR_RECT)
+        self.bottom_bar = CachedPanel(BOTTOM_BAR_RECT)
+        self.side_panel = CachedPanel(SIDE_PANEL_RECT)
+        self._scene_key = None
+        self._input_seen = False       # any events handled this frame
+        self._overlay_rects: List[pygame.Rect] = []
+        self._full_redraw = True       # push the whole screen next frame
+
     # ───────────────────────────── public API ────────────────────────────────
-    def update(self, dt: float):
-        """Called every frame by your main loop."""
+    def update(self, dt: float, alpha: float = 1.0):
+        """
+        Called every frame by your main loop; <alpha> is how far the frame lies
+        between the previous and the current simulation step.
+        """
+        self.board_gui.alpha = alpha
         self._update_ui(dt)
         self._handle_events()
         self.board_gui.update_day_night(dt, self.control.timer.elapsed_seconds, pygame.mouse.get_pos())
@@ -210,7 +234,12 @@ class GameGUI:
     def _handle_events(self):
         mouse_pos = pygame.mouse.get_pos()
 
-        for ev in pygame.event.get():
+        events = pygame.event.get()
+        self._input_seen = bool(events)
+        if any(ev.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE) for ev in events):
+            self._full_redraw = True
+
+        for ev in events:
 
             if ev.type == pygame.QUIT:
                 self.control.pause_game()
@@ -222,6 +251,16 @@ class GameGUI:
                 debug_status = "ON" if self.control.wildlife_ai.animal_ai.debug_mode else "OFF"
                 self._feedback(f"Insider mode: {debug_status}")
 
+            elif ev.type == pygame.KEYDOWN and ev.key == pygame.K_p:
+                status = "ON" if profiler.toggle() else "OFF"
+                self._feedback(f"Profiler: {status}")
+
+            elif ev.type == pygame.KEYDOWN and ev.key == pygame.K_o and profiler.summary():
+                base = os.path.join(PROFILE_DIR, f"profile_{self.control.tick}")
+                profiler.export(base + ".csv")
+                profiler.export(base + ".json")
+                self._feedback(f"Profile saved to {base}.csv/.json")
+
             # -----------------------------------------------------------------
             #  LEFT-CLICK  (button 1)
             # -----------------------------------------------------------------
@@ -248,14 +287,11 @@ class GameGUI:
                 
                 # Check if clicking the attack button
                 if self.attack_button_rect and self.attack_button_rect.collidepoint(ev.pos):
-                    if self.selected_poacher and self.control.board.rangers:
-                        nearest = min(
-                            self.control.board.rangers,
-                            key=lambda r: r.position.distance_to(self.selected_poacher.position)
-                        )
-                        nearest.set_target(self.selected_poacher.position)
-                        nearest.assigned_poacher = self.selected_poacher
-                        self._feedback(f"Ranger {nearest.name} is attacking {self.selected_poacher.name}!")
+                    if self.selected_poacher in self.control.board.poachers:
+                        # through the controller, so the order ends up in the replay log
+                        nearest = self.control.send_ranger(self.control.board.poachers.index(self.selected_poacher))
+                        if nearest:
+                            self._feedback(f"Ranger {nearest.name} is attacking {self.selected_poacher.name}!")
                     self.attack_button_rect = None
                     self.selected_poacher = None
                     return
@@ -295,10 +331,10 @@ class GameGUI:
                     # speed buttons
                     if self.btn_pause.collidepoint(ev.pos):
                         # toggle pause
-                        self.control.time_multiplier = 0.0 if self.control.time_multiplier else 1.0
+                        self.control.set_speed(0.0 if self.control.time_multiplier else 1.0)
                     for i, r in enumerate(self.btn_speed):
                         if r.collidepoint(ev.pos):
-                            self.control.time_multiplier = float(SPEED_LEVELS[i])
+                            self.control.set_speed(float(SPEED_LEVELS[i]))
                             break
 
                 # --- place a road segment (drag-and-drop) --------------------
@@ -307,9 +343,7 @@ class GameGUI:
                     x, y = int(board_pos.x), int(board_pos.y)
 
                     if self.control.capital.getBalance() >= 10:
-                        if self.control.board.add_road_segment(x, y,
-                                                               self.dragging_road["type"]):
-                            self.control.capital.deductFunds(10)
+                        if self.control.place_road(x, y, self.dragging_road["type"]):
                             play_place_item()
                             self._feedback("Road placed for $10")
                         else:
@@ -381,17 +415,12 @@ class GameGUI:
                         i    = self.drag_item_idx
                         item = self.shop_items[i]
                         cost = item["cost"]
-                        if self.control.deduct_funds(cost):
-                            name = item["name"]
+                        name = item["name"]
+                        if self.control.buy_item(name, cost, self.hover_tile):
                             # play placement sound first after the successfull drop
                             play_place_item()
-                            match name:
-                                case "Ranger": self.control.spawn_ranger(self.hover_tile)
-                                case "Plant":  self.control.spawn_plant(self.hover_tile)
-                                case "Pond":   self.control.spawn_pond(self.hover_tile)
-                                case _:         
-                                    self.control.spawn_animal(name.upper(), self.hover_tile)
-                                    play_animal_sound(name.lower())
+                            if name not in ("Ranger", "Plant", "Pond"):
+                                play_animal_sound(name.lower())
                             play_purchase_success()
                             self._feedback(f"Placed {name} for ${cost}")
                         else:
@@ -461,23 +490,12 @@ class GameGUI:
         if "type" in item:
             return
 
-        if self.control.capital.deductFunds(item["cost"]):
-            name = item["name"]
-            if name == "Ranger":
-                self.control.spawn_ranger()
-                play_place_item()
-            elif name == "Plant":
-                self.control.spawn_plant()
-                play_place_item()
-            elif name == "Pond":
-                self.control.spawn_pond()
-                play_place_item()
-            elif name == "Light Chip":
-                self.control.enter_chip_mode()
+        name = item["name"]
+        if self.control.buy_item(name, item["cost"]):
+            if name == "Light Chip":
                 return
-            else:
-                self.control.spawn_animal(name.upper())
-                play_place_item()
+            play_place_item()
+            if name not in ("Ranger", "Plant", "Pond"):
                 play_animal_sound(name.lower())
 
             play_purchase_success()
@@ -493,15 +511,35 @@ class GameGUI:
 
 
     # ───────────────────────────── drawing ───────────────────────────────────
-    def _draw(self):
+    def _draw(self) -> List[pygame.Rect]:
+        """
+        Draw the frame and push only the areas that changed to the display.
+
+        The panels come from their caches and are repainted only when their
+        values change. The board scene is redrawn when the model, the camera
+        or the input moved on; a paused game nobody touches draws nothing.
+        Returns the rectangles pushed to the display.
+        """
+        changed = [panel.rect for panel, key, paint in (
+            (self.top_bar,    self._top_bar_key(),    self._paint_top_bar),
+            (self.bottom_bar, self._bottom_bar_key(), self._paint_bottom_bar),
+            (self.side_panel, self._side_panel_key(), self._paint_side_panel),
+        ) if panel.refresh(key, paint)]
+        scene_key = self._scene_state()
+        if not (self._full_redraw or self._input_seen or changed
+                or scene_key != self._scene_key):
+            return []
+        self._scene_key = scene_key
+
         # 1) clear & render board + UI panels
-        self.screen.fill((40, 45, 50))
-        self.board_gui.render(
-            self.screen,
-            BOARD_RECT,
-            hover_tile  = self.hover_tile if self.drag_item_idx >= 0 else None,
-            hover_valid = self.hover_valid
-        )
+        self.screen.fill((40, 45, 50), SCENE_RECT)
+        with profiler.section("render"):
+            self.board_gui.render(
+                self.screen,
+                BOARD_RECT,
+                hover_tile  = self.hover_tile if self.drag_item_idx >= 0 else None,
+                hover_valid = self.hover_valid
+            )
 
         if self.dragging_road and BOARD_RECT.collidepoint(pygame.mouse.get_pos()):
             mouse_pos = pygame.mouse.get_pos()
@@ -516,7 +554,7 @@ class GameGUI:
                     for i in range(max_cells):
                         cur_x = start_x + i
                         if 0 <= cur_x < self.control.board.width:
-                            if any(r.pos == Vector2(cur_x, y) for r in self.control.board.roads):
+                            if self.control.board.has_road(cur_x, y):
                                 break
                             cells_to_preview.append((cur_x, y))
             else:  # v_road
@@ -526,7 +564,7 @@ class GameGUI:
                     for i in range(max_cells):
                         cur_y = start_y + i
                         if 0 <= cur_y < self.control.board.height:
-                            if any(r.pos == Vector2(x, cur_y) for r in self.control.board.roads):
+                            if self.control.board.has_road(x, cur_y):
                                 break
                             cells_to_preview.append((x, cur_y))
 
@@ -541,20 +579,22 @@ class GameGUI:
                 )
                 pygame.draw.rect(self.screen, (105, 105, 105, 128), preview_rect)
                 pygame.draw.rect(self.screen, (255, 255, 255), preview_rect, 1)
-        
-        self._draw_top_bar()
-        self._draw_bottom_bar()
-        self._draw_side_panel()
-        self._draw_feedback()
+
+        for panel in (self.top_bar, self.bottom_bar, self.side_panel):
+            panel.blit(self.screen)
+        # whatever is drawn from here on may cover the panels as well
+        overlays = [self._draw_feedback()]
         self._draw_zoom_buttons()
+        if profiler.enabled:
+            self._draw_profiler()
 
         # 2) ghost‐sprite follows cursor while dragging
         if self.drag_item_idx >= 0:
 
             name = self.shop_items[self.drag_item_idx]["name"].lower()
             if name not in ["jeep", "straight v road", "straight h road"]:
-                img  = (getattr(self.board_gui, name) 
-                if name in ("plant", "pond", "ranger") 
+                img  = (getattr(self.board_gui, name)
+                if name in ("plant", "pond", "ranger")
                 else self.board_gui.animals[
                     __import__("my_safari_project.model.animal",
                                 fromlist=["AnimalSpecies"]).AnimalSpecies[name.upper()].value
@@ -577,8 +617,8 @@ class GameGUI:
                     mx, my = self.drag_pos
                     px, py = mx - size // 2, my - size // 2
 
-                self.screen.blit(ghost, (px, py))
-        
+                overlays.append(self.screen.blit(ghost, (px, py)))
+
         # 3) draw selected rangers (controllable-rangers)
         if self.selected_poacher and self.selected_poacher in self.control.board.poachers:
             # Convert poacher world position to screen position
@@ -596,83 +636,124 @@ class GameGUI:
 
             pygame.draw.rect(self.screen, (200, 50, 50), self.attack_button_rect, border_radius=5)
             pygame.draw.rect(self.screen, (255, 255, 255), self.attack_button_rect, 2, border_radius=5)
-            label = self.font_small.render("Attack", True, (255, 255, 255))
+            label = self.texts.get(self.font_small, "Attack", (255, 255, 255))
             self.screen.blit(label, label.get_rect(center=self.attack_button_rect.center))
+            overlays.append(self.attack_button_rect)
 
-        # 4) finally update the display
-        pygame.display.flip()
-    
-    def _draw_box(self, text: str, x: int, y: int, color=(60,60,232), radius=4, right=False, width=None):
-        surf = self.font_medium.render(text, True, (255,255,255))
+        # 4) finally push the changed areas, and where last frame's overlays were
+        overlays = [r for r in overlays if r]
+        if self._full_redraw:
+            dirty = [self.screen.get_rect()]
+        else:
+            dirty = [SCENE_RECT, *changed, *overlays, *self._overlay_rects]
+        self._overlay_rects = overlays
+        self._full_redraw = False
+        pygame.display.update(dirty)
+        return dirty
+
+    def _scene_state(self) -> tuple:
+        """What the board scene depends on besides the input handled this frame."""
+        bg = self.board_gui
+        return (self.control.tick, bg.alpha, tuple(bg.cam), bg.tile, bg.dn_opacity,
+                self.feedback, self.feedback_alpha, profiler.enabled)
+
+    def _draw_box(self, text: str, x: int, y: int, color=(60,60,232), radius=4, right=False, width=None,
+                  surface: pygame.Surface | None = None):
+        surface = surface or self.screen
+        surf = self.texts.get(self.font_medium, text, (255,255,255))
         w = width or surf.get_width() + 20
         rx = SCREEN_W - x - w if right else x
         rect = pygame.Rect(rx, y, w, 30)
-        pygame.draw.rect(self.screen, color, rect, border_radius=radius)
-        pygame.draw.rect(self.screen, (255,255,255), rect, 2, border_radius=radius)
-        self.screen.blit(surf, surf.get_rect(center=rect.center))
+        pygame.draw.rect(surface, color, rect, border_radius=radius)
+        pygame.draw.rect(surface, (255,255,255), rect, 2, border_radius=radius)
+        surface.blit(surf, surf.get_rect(center=rect.center))
         return w
 
     # ---------------- top bar -------------------------------------------
-    def _draw_top_bar(self):
+    def _top_bar_key(self) -> tuple:
+        board = self.control.board
+        left = (f"Tourists: {len(board.tourists) + len(board.waiting_tourists)}",
+                f"Rangers: {len(board.rangers)}",
+                f"Poachers: {len(board.poachers)}")
+        right = (f"Capital: ${self.control.capital.getBalance():.0f}",
+                 f"Ponds: {len(board.ponds)}",
+                 f"Plants: {len(board.plants)}",
+                 f"Animals: {len(board.animals)}")
+        return left, right
+
+    def _paint_top_bar(self, surf: pygame.Surface, key: tuple):
+        left, right = key
         start_margin, margin, y = 20, 10, (TOP_BAR_H - 30) // 2
-        pygame.draw.rect(self.screen, (60,70,90), (0,0,SCREEN_W,TOP_BAR_H))
-        
+        pygame.draw.rect(surf, (60,70,90), (0,0,SCREEN_W,TOP_BAR_H))
+
         # Left-aligned boxes
         x = start_margin
-        for txt in [f"Tourists: {len(self.control.board.tourists) + len(self.control.board.waiting_tourists)}",
-                    f"Rangers: {len(self.control.board.rangers)}",
-                    f"Poachers: {len(self.control.board.poachers)}"]:
-            x += self._draw_box(txt, x, y, radius=8) + margin
-        
+        for txt in left:
+            x += self._draw_box(txt, x, y, radius=8, surface=surf) + margin
+
         # Right-aligned boxes
         right_x = start_margin
-        for txt in [f"Capital: ${self.control.capital.getBalance():.0f}",
-                    f"Ponds: {len(self.control.board.ponds)}",
-                    f"Plants: {len(self.control.board.plants)}",
-                    f"Animals: {len(self.control.board.animals)}"]:
+        for txt in right:
             color = (0,100,0) if "Capital" in txt else (180,0,0)
-            right_x += self._draw_box(txt, right_x, y, color=color, radius=8, right=True) + margin
+            right_x += self._draw_box(txt, right_x, y, color=color, radius=8, right=True, surface=surf) + margin
 
     # ---------------- bottom bar -------------------------------------------
-    def _draw_bottom_bar(self):
+    def _bottom_bar_key(self) -> tuple:
+        game_time = self.control.timer.get_game_time()
+        stats = tuple((k, game_time[k]) for k in list(game_time.keys())[:4])
+        # the save button follows the stats boxes; font.size measures without rendering
+        x = 20 + sum(self.font_medium.size(f"{k}: {v}")[0] + 30 for k, v in stats)
+        save = pygame.Rect(x, BOTTOM_BAR_RECT.y + (BOTTOM_BAR_H - 30) // 2, 150, 30)
+        return stats, self.control.timer.get_date_time(), save.collidepoint(pygame.mouse.get_pos())
+
+    def _paint_bottom_bar(self, surf: pygame.Surface, key: tuple):
+        stats, (date, time_s), save_hover = key
         start_margin, margin = 20, 10
-        pygame.draw.rect(self.screen, (60,70,90), (0, SCREEN_H - BOTTOM_BAR_H, SCREEN_W - SIDE_PANEL_W, BOTTOM_BAR_H))
-        
-        date, time_s = self.control.timer.get_date_time()
-        x, y = start_margin, SCREEN_H - BOTTOM_BAR_H + (BOTTOM_BAR_H - 30) // 2
-        
+        oy = BOTTOM_BAR_RECT.y          # the panel's top, in screen coordinates
+        pygame.draw.rect(surf, (60,70,90), (0, 0, SCREEN_W - SIDE_PANEL_W, BOTTOM_BAR_H))
+
+        x, y = start_margin, (BOTTOM_BAR_H - 30) // 2
+
         # Game stats
-        for k in list(self.control.timer.get_game_time().keys())[:4]:
-            x += self._draw_box(f"{k}: {self.control.timer.get_game_time()[k]}", x, y, color=(40,45,60)) + margin
-        
+        for k, v in stats:
+            x += self._draw_box(f"{k}: {v}", x, y, color=(40,45,60), surface=surf) + margin
+
         # Save button with hover
-        hover_color = (0,150,0) if pygame.Rect(x, y, 150, 30).collidepoint(pygame.mouse.get_pos()) else (40,90,140)
-        save_w = self._draw_box("Save Game", x, y, color=hover_color)
-        self.save_btn_rect = pygame.Rect(x, y, save_w, 30)
+        hover_color = (0,150,0) if save_hover else (40,90,140)
+        save_w = self._draw_box("Save Game", x, y, color=hover_color, surface=surf)
+        self.save_btn_rect = pygame.Rect(x, oy + y, save_w, 30)
 
         # Date/time blocks (stacked, right-aligned)
         time_x = SCREEN_W - SIDE_PANEL_W - 120 - start_margin
-        start_y = SCREEN_H - BOTTOM_BAR_H + (BOTTOM_BAR_H - 64) // 2
-        
+        start_y = (BOTTOM_BAR_H - 64) // 2
+
         for i, txt in enumerate((date, time_s)):
             rect = pygame.Rect(time_x, start_y + i * 34, 120, 30)
-            pygame.draw.rect(self.screen, (153,101,21), rect, border_radius=4)
-            pygame.draw.rect(self.screen, (255,255,255), rect, 2, border_radius=4)
-            self.screen.blit(self.font_medium.render(txt, True, (255,255,255)), 
-                            self.font_medium.render(txt, True, (255,255,255)).get_rect(center=rect.center))
+            pygame.draw.rect(surf, (153,101,21), rect, border_radius=4)
+            pygame.draw.rect(surf, (255,255,255), rect, 2, border_radius=4)
+            label = self.texts.get(self.font_medium, txt, (255,255,255))
+            surf.blit(label, label.get_rect(center=rect.center))
 
     # ---------------- side panel -------------------------------------------
-    def _draw_side_panel(self):
-        px, py = SCREEN_W - SIDE_PANEL_W, TOP_BAR_H
-        pygame.draw.rect(self.screen, (70,80,100), (px, py, SIDE_PANEL_W, SCREEN_H - py))
-        self.screen.blit(self.font_medium.render("Shop", True, (255,255,255)), (px + 20, py + 10))
+    def _side_panel_key(self) -> tuple:
+        visible_h = SCREEN_H - BOTTOM_BAR_H - 100
+        scroll_limit = max(0, len(self.shop_items) * 44 - visible_h)
+        self.shop_scroll = max(-scroll_limit, min(0, self.shop_scroll))
+        return self.hover_item, self.shop_scroll, self.control.time_multiplier
+
+    def _paint_side_panel(self, surf: pygame.Surface, key: tuple):
+        # item and button rects are kept in screen coordinates for hit tests;
+        # <surf> starts at the panel's top-left corner (ox, oy)
+        ox, oy = SIDE_PANEL_RECT.topleft
+        px, py = ox, oy
+        pygame.draw.rect(surf, (70,80,100), (0, 0, SIDE_PANEL_W, SCREEN_H - py))
+        surf.blit(self.texts.get(self.font_medium, "Shop", (255,255,255)), (20, 10))
 
-        # Setup and clipping
+        # Setup and clipping (shop_scroll is clamped by _side_panel_key)
         top, visible_h = py + 50, SCREEN_H - BOTTOM_BAR_H - 100
         scroll_limit = max(0, len(self.shop_items) * 44 - visible_h)
-        self.shop_scroll = max(-scroll_limit, min(0, self.shop_scroll))
-        
-        self.screen.set_clip((px, top, SIDE_PANEL_W, visible_h))
+
+        surf.set_clip((0, top - oy, SIDE_PANEL_W, visible_h))
 
         # Draw items
         self.item_rects.clear()
@@ -680,33 +761,58 @@ class GameGUI:
         for i, item in enumerate(self.shop_items):
             rect = pygame.Rect(px + 20, y, SIDE_PANEL_W - 40, 36)
             self.item_rects.append(rect)
-            
+
             color = (80,110,160) if i == self.hover_item else (90,100,120)
-            pygame.draw.rect(self.screen, color, rect, border_radius=4)
-            self.screen.blit(self.font_small.render(f"{item['name']}: ${item['cost']}", True, (255,255,255)), (rect.x + 8, rect.y + 6))
+            local = rect.move(-ox, -oy)
+            pygame.draw.rect(surf, color, local, border_radius=4)
+            surf.blit(self.texts.get(self.font_small, f"{item['name']}: ${item['cost']}", (255,255,255)), (local.x + 8, local.y + 6))
             y += 44
 
-        self.screen.set_clip(None)
+        surf.set_clip(None)
 
         # Scrollbar
         if scroll_limit:
-            rail_x = px + SIDE_PANEL_W - 16
-            pygame.draw.rect(self.screen, (40,40,50), (rail_x, top, 8, visible_h))
+            rail_x = SIDE_PANEL_W - 16
+            pygame.draw.rect(surf, (40,40,50), (rail_x, top - oy, 8, visible_h))
             thumb_h = max(20, visible_h * visible_h // (len(self.shop_items) * 44))
             thumb_y = top + abs(self.shop_scroll) * (visible_h - thumb_h) // scroll_limit
-            pygame.draw.rect(self.screen, (140,140,160), (rail_x, thumb_y, 8, thumb_h), border_radius=3)
+            pygame.draw.rect(surf, (140,140,160), (rail_x, thumb_y - oy, 8, thumb_h), border_radius=3)
 
-        self._draw_speed_buttons()
+        self._draw_speed_buttons(surf, (ox, oy))
 
     # ---------------- feedback --------------------------------------------
-    def _draw_feedback(self):
+    def _draw_feedback(self) -> pygame.Rect | None:
         if self.feedback_alpha <= 0:
-            return
+            return None
+        # not from the text cache: set_alpha would fade the cached surface too
         surf = self.font_medium.render(self.feedback, True, (128,0,0))
         surf.set_alpha(self.feedback_alpha)
         x = (SCREEN_W - surf.get_width()) // 2
         y = SCREEN_H - BOTTOM_BAR_H - surf.get_height() - 20
-        self.screen.blit(surf, (x,y))
+        return self.screen.blit(surf, (x,y))
+
+    # ---------------- profiler overlay ------------------------------------
+    def _draw_profiler(self):
+        rows = profiler.summary()
+        if not rows:
+            return
+        line_h = self.font_small.get_linesize()
+        panel = pygame.Rect(BOARD_RECT.x + 8, BOARD_RECT.y + 8, 390, (len(rows) + 1) * line_h + 8)
+        bg = self.board_gui.overlays.get("profiler", panel.size)
+        bg.fill((0, 0, 0, 170))
+        self.screen.blit(bg, panel.topleft)
+
+        # section name left-aligned, numbers right-aligned at these x offsets
+        columns = (250, 320, 380)
+        lines = [("section", "mean ms", "max ms", "calls")]
+        lines += [(r["section"], f"{r['mean_ms']:.2f}", f"{r['max_ms']:.2f}", str(r["calls"])) for r in rows]
+        for i, cells in enumerate(lines):
+            color = (255, 255, 0) if i == 0 else (255, 255, 255)
+            y = panel.y + 4 + i * line_h
+            self.screen.blit(self.texts.get(self.font_small, cells[0], color), (panel.x + 6, y))
+            for text, right in zip(cells[1:], columns):
+                surf = self.texts.get(self.font_small, text, color)
+                self.screen.blit(surf, (panel.x + right - surf.get_width(), y))
 
     # ---------------- zoom buttons ----------------------------------------
     def _draw_zoom_buttons(self):
@@ -720,15 +826,17 @@ class GameGUI:
             pygame.draw.rect(self.screen, (90,100,120), rect, border_radius=4)
             pygame.draw.rect(self.screen, (255,255,255), rect, 2, border_radius=4)
 
-        plus  = self.font_small.render("+", True, (255,255,255))
-        minus = self.font_small.render("–", True, (255,255,255))
+        plus  = self.texts.get(self.font_small, "+", (255,255,255))
+        minus = self.texts.get(self.font_small, "–", (255,255,255))
         self.screen.blit(plus,  (self.btn_zoom_in.centerx  - plus.get_width()//2,
                                  self.btn_zoom_in.centery  - plus.get_height()//2))
         self.screen.blit(minus, (self.btn_zoom_out.centerx - minus.get_width()//2,
                                  self.btn_zoom_out.centery - minus.get_height()//2))
     
     # ───────────────────────── speed buttons ─────────────────────────────
-    def _draw_speed_buttons(self):
+    def _draw_speed_buttons(self, surf: pygame.Surface, origin: tuple[int, int]):
+        # <surf> is the side panel's cache, its top-left corner at <origin> on screen
+        ox, oy = origin
         panel_x = SCREEN_W - SIDE_PANEL_W
         btn_h, gap = 32, 8
         num_btns = 4 
@@ -758,6 +866,7 @@ class GameGUI:
         white     = (255,255,255)
 
         for i, r in enumerate(rects):
+            r = r.move(-ox, -oy)
             is_active = ((i == 0 and self.control.time_multiplier == 0) or
                         (i > 0 and self.control.time_multiplier == SPEED_LEVELS[i-1]))
 
@@ -770,11 +879,11 @@ class GameGUI:
                 paused = (self.control.time_multiplier == 0)
 
                 #drawing the outline for both play/pause button 
-                pygame.draw.circle(self.screen, white, centre, radius, 2)
+                pygame.draw.circle(surf, white, centre, radius, 2)
 
                 # background
                 if paused:
-                    pygame.draw.circle(self.screen, green_bg, centre, radius-1)
+                    pygame.draw.circle(surf, green_bg, centre, radius-1)
 
                 if paused:
                     # draw resume button ||
@@ -784,7 +893,7 @@ class GameGUI:
                     for dx in (-gap-bw//2, gap+bw//2):
                         bar = pygame.Rect(centre[0]+dx-bw//2,
                                           centre[1]-bh//2, bw, bh)
-                        pygame.draw.rect(self.screen, white, bar, border_radius=2)
+                        pygame.draw.rect(surf, white, bar, border_radius=2)
                 else:
                     # draw pause icon (|>)
                     pts = [
@@ -792,16 +901,16 @@ class GameGUI:
                         (centre[0]-radius//3, centre[1]+radius//2),
                         (centre[0]+radius//2, centre[1])
                     ]
-                    pygame.draw.polygon(self.screen, white, pts)
+                    pygame.draw.polygon(surf, white, pts)
 
             #3 different speed buttons (1×/2×/3×)
             else:
                 bg = green_bg if is_active else grey_bg
-                pygame.draw.rect(self.screen, bg, r, border_radius=4)
-                pygame.draw.rect(self.screen, white, r, 2, border_radius=4)
+                pygame.draw.rect(surf, bg, r, border_radius=4)
+                pygame.draw.rect(surf, white, r, 2, border_radius=4)
                 label = f"{i}×"
-                txt = self.font_small.render(label, True, white)
-                self.screen.blit(txt, (r.centerx - txt.get_width() // 2,
+                txt = self.texts.get(self.font_small, label, white)
+                surf.blit(txt, (r.centerx - txt.get_width() // 2,
                                        r.centery - txt.get_height() // 2))
 
     # ───────────────────────── others ─────────────────────────────
@@ -150,7 +150,11 @@ def toggle_fullscreen():
         screen = pygame.display.set_mode((1080, 720), pygame.RESIZABLE)
     WIDTH, HEIGHT = screen.get_size()
 
-def main_menu():
+def main_menu(record_to: str | None = None, lod: bool = False):
+    """
+    <record_to>: write the replay log of the game started from the menu there.
+    <lod>: schedule animal decisions by level of detail (control/ai_scheduler.py).
+    """
     global WIDTH, HEIGHT
     btn_width, btn_height = 250, 60
     margin_right = 50
@@ -162,8 +166,8 @@ def main_menu():
         width, height = screen.get_size()
         pygame.mixer.music.stop()
         pygame.quit()
-        control: GameController = GameController(difficulty) # changed to control
-        control.run()
+        control: GameController = GameController(difficulty, lod=lod) # changed to control
+        control.run(record_to=record_to)
 
     def load_game():
         root = tk.Tk()
@@ -177,9 +181,9 @@ def main_menu():
             difficulty = difficulty_levels[selected_difficulty]
             pygame.mixer.music.stop()
             pygame.quit()
-            control = GameController(difficulty)
+            control = GameController(difficulty, lod=lod)
             control.load_game(file_path)
-            control.run()
+            control.run(record_to=record_to)
 
     def quit_game():
         pygame.mixer.music.stop()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from typing import Callable, Hashable
+
+from pygame import Rect, Surface
+
+
+class CachedPanel:
+    """
+    A UI panel pre-rendered onto its own surface.
+
+    The panel is keyed by the values it shows (counts, capital, date, hover
+    state ...); `refresh` repaints it only when that key changes, so an
+    unchanged panel costs one blit instead of a round of font renders.
+    Painters draw in panel-local coordinates, (0, 0) being `rect.topleft`.
+    """
+
+    def __init__(self, rect: Rect):
+        self.rect = Rect(rect)
+        self.surface = Surface(self.rect.size)
+        self._key: Hashable = None
+        self._painted = False
+
+    def invalidate(self) -> None:
+        """Force a repaint on the next `refresh`."""
+        self._painted = False
+
+    def refresh(self, key: Hashable, paint: Callable[[Surface, Hashable], None]) -> bool:
+        """Repaint with paint(surface, <key>) if <key> changed; True if it did."""
+        if self._painted and key == self._key:
+            return False
+        paint(self.surface, key)
+        self._key, self._painted = key, True
+        return True
+
+    def blit(self, screen: Surface) -> Rect:
+        return screen.blit(self.surface, self.rect)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Hashable, Tuple
+
+import pygame
+from pygame import Surface
+
+# Rotated sprites are cached per this many degrees of heading
+ROTATION_STEP = 5
+
+
+class SpriteCache:
+    """
+    LRU cache of scaled (and optionally rotated) copies of source images.
+
+    Entries are keyed by (asset, size, rotation bucket); BoardGUI clears the
+    cache when the zoom level changes, since every size is then stale.
+    """
+
+    def __init__(self, max_items: int = 512):
+        self.max_items = max_items
+        self._items: "OrderedDict[Hashable, Surface]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    @staticmethod
+    def bucket(angle: float) -> int:
+        """Snap <angle> (degrees) to the nearest cached rotation."""
+        return int(round(angle / ROTATION_STEP)) * ROTATION_STEP % 360
+
+    def get(self, asset: Hashable, image: Surface, size: Tuple[int, int], angle: float = 0.0) -> Surface:
+        """<image> scaled to <size> and rotated counter-clockwise by <angle> degrees."""
+        rot = self.bucket(angle) if angle else 0
+        key = (asset, size, rot)
+        items = self._items
+        surf = items.get(key)
+        if surf is not None:
+            items.move_to_end(key)
+            return surf
+
+        surf = pygame.transform.scale(image, size)
+        if rot:
+            surf = pygame.transform.rotate(surf, rot)
+        items[key] = surf
+        if len(items) > self.max_items:
+            items.popitem(last=False)
+        return surf
@@ -0,0 +1,33 @@
+from __future__ import annotations
+from typing import Dict, Hashable, Tuple
+
+import pygame
+from pygame import Surface
+
+
+class SurfacePool:
+    """
+    Reusable scratch surfaces for per-frame overlays, one per name.
+
+    `get` hands back the same surface for a name for as long as the size
+    asked for stays the same, i.e. until the zoom or the window changes, so
+    overlays redrawn every frame do not allocate. The contents are whatever
+    the last user left: fill the surface before blitting it.
+    """
+
+    def __init__(self):
+        self._surfaces: Dict[Hashable, Surface] = {}
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def get(self, name: Hashable, size: Tuple[int, int], flags: int = pygame.SRCALPHA) -> Surface:
+        """A <size> surface (with <flags>) reserved for <name>."""
+        size = (int(size[0]), int(size[1]))
+        surf = self._surfaces.get(name)
+        if surf is None or surf.get_size() != size:
+            surf = self._surfaces[name] = Surface(size, flags)
+        return surf
@@ -0,0 +1,111 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import List, Set, Tuple, TYPE_CHECKING
+
+import pygame
+from pygame import Rect, Surface
+
+from my_safari_project.model.field import Field
+from my_safari_project.model.road import RoadType
+from my_safari_project.model.terrain_grid import CHUNK, GRASS, TERRAIN_TYPES
+
+if TYPE_CHECKING:
+    from my_safari_project.model.board import Board
+
+MAX_PIXELS = 16 * 1024 * 1024   # total chunk area kept before old chunks are evicted
+_KEY = (255, 0, 255)            # transparent colour (grass lets the ground show through)
+
+
+class TerrainChunks:
+    """
+    Terrain and road layers pre-rendered into CHUNK×CHUNK tile surfaces.
+
+    Chunks are drawn for one tile size at a time and re-rendered only when
+    the board reports the tiles in them as dirty (terrain changes, new
+    roads) or the zoom changes.
+    """
+
+    def __init__(self, board: "Board"):
+        self.board = board
+        self.side = 0
+        self._chunks: "OrderedDict[Tuple[int, int], Surface]" = OrderedDict()
+
+    def clear(self) -> None:
+        self._chunks.clear()
+
+    def _drop_dirty(self) -> None:
+        for key in self.board.terrain.take_dirty():
+            self._chunks.pop(key, None)
+
+    def _build(self, cx: int, cy: int) -> Surface:
+        side, board, grid = self.side, self.board, self.board.terrain
+        x0, y0 = cx * CHUNK, cy * CHUNK
+        x1, y1 = min(x0 + CHUNK, board.width), min(y0 + CHUNK, board.height)
+        surf = Surface(((x1 - x0) * side, (y1 - y0) * side))
+        surf.fill(_KEY)
+        surf.set_colorkey(_KEY)
+
+        for y in range(y0, y1):
+            row = y * grid.width
+            py = (y - y0) * side
+            for x in range(x0, x1):
+                code = grid.terrain[row + x]
+                if code != GRASS:
+                    pygame.draw.rect(surf, Field.color_map[TERRAIN_TYPES[code]],
+                                     ((x - x0) * side, py, side, side))
+
+        margin = int(side // 2.5)
+        yellow, lw = (200, 200, 0), max(1, int(side // 30))  # Darker yellow
+        for x in range(x0, x1):
+            for y in range(y0, y1):
+                rd = board.road_at(x, y)
+                if rd is None:
+                    continue
+                px, py = (x - x0) * side, (y - y0) * side
+                pygame.draw.rect(surf, (0, 0, 0), (px, py, side, side))  # Black road surface
+                match rd.type:
+                    case RoadType.STRAIGHT_H:
+                        pygame.draw.line(surf, yellow, (px + margin, py + side // 2), (px + side - margin, py + side // 2), lw)
+                    case RoadType.STRAIGHT_V:
+                        pygame.draw.line(surf, yellow, (px + side // 2, py + margin), (px + side // 2, py + side - margin), lw)
+        return surf
+
+    def render(self, screen: Surface, side: int, ox: int, oy: int,
+               min_x: int, min_y: int, max_x: int, max_y: int) -> None:
+        """Blit the part of the layer inside tiles [min_x,max_x)×[min_y,max_y)."""
+        if side != self.side:
+            self.side = side
+            self.clear()
+        self._drop_dirty()
+
+        board = self.board
+        window = Rect(ox, oy, (max_x - min_x) * side, (max_y - min_y) * side)
+        cx0, cy0 = max(min_x, 0) // CHUNK, max(min_y, 0) // CHUNK
+        cx1 = (min(max_x, board.width) - 1) // CHUNK
+        cy1 = (min(max_y, board.height) - 1) // CHUNK
+        visible: List[Tuple[int, int]] = []
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                key = (cx, cy)
+                surf = self._chunks.get(key)
+                if surf is None:
+                    surf = self._chunks[key] = self._build(cx, cy)
+                else:
+                    self._chunks.move_to_end(key)
+                visible.append(key)
+                px = ox + (cx * CHUNK - min_x) * side
+                py = oy + (cy * CHUNK - min_y) * side
+                dest = surf.get_rect(topleft=(px, py)).clip(window)
+                if dest.width and dest.height:
+                    screen.blit(surf, dest.topleft, dest.move(-px, -py))
+        self._evict(set(visible))
+
+    def _evict(self, keep: Set[Tuple[int, int]]) -> None:
+        area = (CHUNK * self.side) ** 2
+        excess = len(self._chunks) - max(len(keep), MAX_PIXELS // max(area, 1))
+        for key in list(self._chunks):
+            if excess <= 0:
+                break
+            if key not in keep:
+                del self._chunks[key]
+                excess -= 1
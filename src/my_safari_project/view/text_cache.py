@@ -0,0 +1,57 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Hashable, Tuple
+
+import pygame
+from pygame import Surface
+from pygame.font import Font
+
+Color = Tuple[int, ...]
+
+# Offsets of the outline passes around outlined text
+OUTLINE_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class TextCache:
+    """
+    LRU cache of rendered (antialiased) text.
+
+    Entries are keyed by (font, text, colour, outline colour). Outlined text
+    is composed once onto a surface one pixel larger on every side, so it
+    costs a single blit instead of five renders; centre it where the plain
+    text would go. BoardGUI owns the cache and shares it with GameGUI and
+    the AnimalAI debug overlay.
+    """
+
+    def __init__(self, max_items: int = 2048):
+        self.max_items = max_items
+        self._items: "OrderedDict[Hashable, Surface]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def get(self, font: Font, text: str, color: Color, outline: Color | None = None) -> Surface:
+        """<text> in <font> and <color>, with a 1px <outline> if given."""
+        key = (font, text, tuple(color), outline and tuple(outline))
+        items = self._items
+        surf = items.get(key)
+        if surf is not None:
+            items.move_to_end(key)
+            return surf
+
+        surf = font.render(text, True, color)
+        if outline is not None:
+            shadow = font.render(text, True, outline)
+            w, h = surf.get_size()
+            composed = Surface((w + 2, h + 2), pygame.SRCALPHA)
+            for dx, dy in OUTLINE_OFFSETS:
+                composed.blit(shadow, (1 + dx, 1 + dy))
+            composed.blit(surf, (1, 1))
+            surf = composed
+        items[key] = surf
+        if len(items) > self.max_items:
+            items.popitem(last=False)
+        return surf
@@ -0,0 +1,74 @@
+"""
+Seeded throughput benchmarks for the simulation hot paths.
+
+They need pytest-benchmark and only run when asked for:
+
+    pytest tests/benchmarks --benchmark-only --benchmark-storage=tests/benchmarks/baseline \
+        --benchmark-compare --benchmark-compare-fail=mean:20%
+
+compares against the reference baseline committed under baseline/ and
+fails when any benchmark's mean got more than 20% slower. Run it on an
+otherwise idle machine; a shared or throttled CPU alone can move the
+means by that much. Baselines are
+stored per platform (e.g. Linux-CPython-3.11-64bit); to re-record the
+reference, run with --benchmark-save=reference instead of the compare
+options and commit the new file. Local experiments can keep using the
+default (untracked) .benchmarks/ with --benchmark-autosave.
+"""
+import random
+from pathlib import Path
+
+import pytest
+from pygame.math import Vector2
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    collect_ignore_glob = ["test_*.py"]
+
+HERE = Path(__file__).parent
+SEED = 1234
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("benchmark_only", False):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with --benchmark-only")
+    for item in items:
+        if HERE in Path(item.fspath).parents:
+            item.add_marker(skip)
+
+
+def populate(board, n_animals: int, seed: int = SEED):
+    """Scatter <n_animals> (4:1 herbivores to carnivores) plus food and water."""
+    from my_safari_project.model.animal import AnimalSpecies
+    from my_safari_project.model.carnivore import Carnivore
+    from my_safari_project.model.herbivore import Herbivore
+    from my_safari_project.model.plant import Plant
+    from my_safari_project.model.pond import Pond
+
+    rng = random.Random(seed)
+
+    def spot():
+        return Vector2(rng.uniform(0, board.width - 1), rng.uniform(0, board.height - 1))
+
+    for i in range(n_animals):
+        if i % 5 == 4:
+            animal = Carnivore(i + 1, AnimalSpecies.LION, spot(), 1.8, 150, 60)
+        else:
+            animal = Herbivore(i + 1, AnimalSpecies.ZEBRA, spot(), 1.7, 130, 60)
+        board.animals.append(animal)
+    for i in range(max(1, n_animals // 10)):
+        board.plants.append(Plant(i + 1, spot()))
+        board.ponds.append(Pond(i + 1, spot()))
+    return board
+
+
+@pytest.fixture
+def make_board():
+    from my_safari_project.model.board import Board
+
+    def make(size: int = 200, n_animals: int = 0, n_roads: int = 5, n_jeeps: int = 5):
+        board = Board(size, size, n_roads=n_roads, n_jeeps=n_jeeps, rng=random.Random(SEED))
+        return populate(board, n_animals)
+    return make
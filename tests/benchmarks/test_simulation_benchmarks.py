@@ -0,0 +1,91 @@
+import gc
+import random
+
+import pytest
+from pygame.math import Vector2
+
+from my_safari_project.model.board import Board
+from my_safari_project.model.capital import Capital
+from my_safari_project.control.animal_ai import AnimalAI
+from my_safari_project.control.tourist_ai import TouristAI
+from my_safari_project.control.wildlife_ai import WildlifeAI
+
+ANIMALS = [50, 500, 5000]
+BOARDS = [100, 300, 1000]
+DT = 0.1
+SEED = 1234                 # conftest.SEED, the seed make_board builds with
+
+
+def rounds_for(scale: int, big: int) -> dict:
+    # every round gets fresh state from its setup, so rounds are independent
+    # samples; the largest scenarios take seconds per call and get fewer of them
+    if scale >= big:
+        return {"rounds": 6, "warmup_rounds": 1, "iterations": 1}
+    return {"rounds": 20, "warmup_rounds": 2, "iterations": 1}
+
+
+def fresh(build):
+    """pedantic setup: hand each round a newly built object as its only argument."""
+    def setup():
+        random.seed(SEED)                   # entities draw from the module rng
+        built = build()
+        gc.collect()                        # don't bill the setup's garbage to the round
+        return (built,), {}
+    return setup
+
+
+@pytest.mark.parametrize("size", BOARDS)
+def test_board_generation(benchmark, size):
+    def setup():
+        gc.collect()
+        return (size, size), {"n_roads": 5, "n_jeeps": 5, "rng": random.Random(SEED)}
+    benchmark.pedantic(Board, setup=setup, **rounds_for(size, 1000))
+
+
+@pytest.mark.parametrize("size", BOARDS)
+def test_longest_path(benchmark, make_board, size):
+    board = make_board(size)
+    start = Vector2(board.entrances[0])
+
+    def solve(board):
+        return board._longest_path(start)
+
+    def uncached():
+        board.road_graph.invalidate()       # time the solver, not the route cache
+        gc.collect()
+        return (board,), {}
+    path = benchmark.pedantic(solve, setup=uncached, **rounds_for(size, 1000))
+    assert len(path) > 1
+
+
+@pytest.mark.parametrize("size", BOARDS)
+def test_board_update(benchmark, make_board, size):
+    benchmark.pedantic(lambda board: board.update(DT, DT),
+                       setup=fresh(lambda: make_board(size, n_jeeps=5)), **rounds_for(size, 1000))
+
+
+def _warm(ai):
+    ai.update(DT)                           # first tick builds the AI's caches
+    return ai
+
+
+@pytest.mark.parametrize("n_animals", ANIMALS)
+def test_animal_ai_update(benchmark, make_board, n_animals):
+    build = lambda: _warm(AnimalAI(make_board(200, n_animals)))
+    benchmark.pedantic(lambda ai: ai.update(DT), setup=fresh(build), **rounds_for(n_animals, 5000))
+
+
+@pytest.mark.parametrize("n_animals", ANIMALS)
+def test_wildlife_ai_update(benchmark, make_board, n_animals):
+    build = lambda: _warm(WildlifeAI(make_board(200, n_animals), Capital(10_000)))
+    benchmark.pedantic(lambda ai: ai.update(DT), setup=fresh(build), **rounds_for(n_animals, 5000))
+
+
+@pytest.mark.parametrize("n_animals", ANIMALS)
+def test_tourist_ai_update(benchmark, make_board, n_animals):
+    def build():
+        ai = TouristAI(make_board(200, n_animals), Capital(10_000))
+        for _ in range(50):
+            ai._spawn_tourist()
+        return ai
+    benchmark.pedantic(lambda ai: ai.update(DT), setup=fresh(build), **rounds_for(n_animals, 5000))
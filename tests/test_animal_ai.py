@@ -60,3 +60,100 @@ def test_food_memory_and_state_change(ai, board, animal):
 
 
 
+
+
+def lod_board(n):
+    b = Board(40, 40)
+    b.animals.clear()
+    for i in range(n):
+        b.animals.append(Herbivore(i + 1, herb_species(), Vector2(1 + (i * 3) % 38, 1 + (i * 7) % 38), 1.0, 100, 50))
+    return b
+
+def test_lod_scheduler_caps_decisions_per_tick():
+    from my_safari_project.control.ai_scheduler import AIScheduler
+    board = lod_board(30)
+    ai = AnimalAI(board, scheduler=AIScheduler(budget=5))
+    decided = []
+    original = ai.scheduler.select
+    ai.scheduler.select = lambda *a: decided.append(original(*a)) or decided[-1]
+    for _ in range(10):
+        ai.update(0.1)
+    assert all(len(d) <= 5 for d in decided)
+    # nobody is starved: after 10 ticks at 5 per tick, every animal decided at least once
+    assert {aid for d in decided for aid in d} == {a.animal_id for a in board.animals}
+
+def test_lod_scheduler_keeps_vitals_and_timers_exact():
+    from my_safari_project.control.ai_scheduler import AIScheduler
+    full, lod = lod_board(1), lod_board(1)
+    ai_full, ai_lod = AnimalAI(full), AnimalAI(lod, scheduler=AIScheduler(idle_interval=2.0))
+    for ai in (ai_full, ai_lod):
+        ai.update(0.1)
+        status = ai.animal_states[1]
+        status.state, status.timer, status.target = AnimalState.RESTING, 3.0, Vector2(1, 1)
+    decided = 0
+    for _ in range(25):
+        ai_full.update(0.1)
+        ai_lod.update(0.1)
+        if 1 not in ai_lod.scheduler._pending:      # decided this tick, with all the time it skipped
+            decided += 1
+            assert ai_lod.animal_states[1].timer == pytest.approx(ai_full.animal_states[1].timer)
+    assert decided == 1
+    a, b = full.animals[0], lod.animals[0]
+    assert (a.hunger, a.thirst, a.age) == (b.hunger, b.thirst, b.age)
+
+def test_lod_scheduler_always_updates_animals_in_view():
+    from my_safari_project.control.ai_scheduler import AIScheduler
+    board = lod_board(20)
+    ai = AnimalAI(board, scheduler=AIScheduler(budget=0))
+    ai.scheduler.view = (0, 0, 40, 40)
+    assert len(ai.scheduler.select(ai, 0.1)) == 20
+
+def test_lod_scheduler_caps_animals_in_view_and_rotates_them():
+    from my_safari_project.control.ai_scheduler import AIScheduler
+    board = lod_board(20)
+    ai = AnimalAI(board, scheduler=AIScheduler(budget=0, view_budget=8))
+    ai.scheduler.view = (0, 0, 40, 40)      # zoomed out over the whole board
+    decided = [set(ai.scheduler.select(ai, 0.1)) for _ in range(3)]
+    assert all(len(d) == 8 for d in decided)
+    assert set().union(*decided) == {a.animal_id for a in board.animals}
+
+def test_lod_state_change_outside_a_decision_restarts_the_timer():
+    from my_safari_project.control.ai_scheduler import AIScheduler
+    board = lod_board(1)
+    ai = AnimalAI(board, scheduler=AIScheduler(far_interval=5.0, idle_interval=5.0))
+    ai.update(0.1)
+    for _ in range(10):
+        ai.update(0.1)
+    assert ai.scheduler._pending[1] == pytest.approx(1.0)
+    ai._change_state(1, AnimalState.DRINKING)   # as a collision with a pond would, mid-tick
+    timer = ai.animal_states[1].timer
+    ai.update(0.1)
+    assert 1 not in ai.scheduler._pending       # due again straight away
+    # charged for the tick it started in and this one, not for the second it waited before
+    assert ai.animal_states[1].timer == pytest.approx(timer - 0.2)
+
+def test_memory_dropped_when_entity_leaves_board(ai, board, animal):
+    pond = Pond(1, Vector2(2, 3))
+    board.ponds.append(pond)
+    ai.update(0.1)
+    status = ai.animal_states[animal.animal_id]
+    assert [e for e, _ in status.memory["water"]] == [pond]
+    board.ponds.remove(pond)
+    # forgotten at the animal's next memory cleanup, as the old per-tick rescan did
+    assert [e for e, _ in status.memory["water"]] == [pond]
+    ai.update(0.1)
+    assert status.memory["water"] == []
+    assert not status.expiry
+
+def test_memory_expires_after_timeout(ai, board, animal):
+    from my_safari_project.control.animal_ai import MEMORY_TIMEOUT
+    board.ponds.append(Pond(1, Vector2(2, 3)))
+    ai.update(0.1)
+    status = ai.animal_states[animal.animal_id]
+    board.ponds[0].position = Vector2(9, 9)      # out of sight, so it is not seen again
+    ai.simulation_time += MEMORY_TIMEOUT - 1
+    ai.update(0.1)
+    assert status.memory["water"]
+    ai.simulation_time += 1
+    ai.update(0.1)
+    assert status.memory["water"] == []
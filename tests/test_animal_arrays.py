@@ -0,0 +1,84 @@
+import pytest
+from pygame.math import Vector2
+from my_safari_project.model.animal import AnimalSpecies
+from my_safari_project.model.herbivore import Herbivore
+from my_safari_project.model.board import Board
+from my_safari_project.control.animal_ai import AnimalAI, AnimalStatus
+
+pytest.importorskip("numpy")
+
+
+def make_board():
+    b = Board(10, 10)
+    b.animals.clear()
+    b.animals.append(Herbivore(1, AnimalSpecies.ZEBRA, Vector2(2, 2), 1.0, 100, 50))
+    b.animals.append(Herbivore(2, AnimalSpecies.HIPPO, Vector2(7, 7), 1.0, 100, 50))
+    return b
+
+
+def test_vectorized_vitals_match_object_path():
+    plain_board, soa_board = make_board(), make_board()
+    plain, soa = AnimalAI(plain_board), AnimalAI(soa_board, vectorized=True)
+    for _ in range(5):
+        plain.update(0.5)
+        soa.update(0.5)
+    for a, b in zip(plain_board.animals, soa_board.animals):
+        assert (a.age, a.hunger, a.thirst) == (b.age, b.hunger, b.thirst)
+        assert plain.animal_states[a.animal_id].reproduction_cooldown == \
+               soa.animal_states[b.animal_id].reproduction_cooldown
+
+
+def test_animal_is_a_view_over_its_row():
+    board = make_board()
+    ai = AnimalAI(board, vectorized=True)
+    ai.update(0.1)
+    animal = board.animals[0]
+    animal.hunger = 7.5
+    assert ai.arrays.columns["hunger"][animal._soa_row] == 7.5
+
+
+def test_removed_animal_keeps_its_stats():
+    board = make_board()
+    ai = AnimalAI(board, vectorized=True)
+    ai.update(1.0)
+    animal = board.animals.pop(0)
+    hunger = animal.hunger
+    ai.update(1.0)
+    assert animal._soa is None
+    assert animal.hunger == hunger
+    assert len(ai.arrays) == 1
+
+
+def test_move_animals_steps_towards_target():
+    board = make_board()
+    ai = AnimalAI(board, vectorized=True)
+    animal = board.animals[0]
+    animal.target = Vector2(5, 2)
+    position = animal.position
+    ai.move_animals(1.0)
+    assert animal.position is position
+    assert animal.position == Vector2(3, 2)
+
+
+def test_only_bound_animals_are_array_backed():
+    board = make_board()
+    ai = AnimalAI(board, vectorized=True)
+    ai.update(0.1)
+    bound, status = board.animals[0], ai.animal_states[1]
+    assert type(bound) is not Herbivore and isinstance(bound, Herbivore)
+    assert type(status) is not AnimalStatus and isinstance(status, AnimalStatus)
+    assert type(bound).__name__ == "Herbivore"
+    board.animals.remove(bound)
+    ai.update(0.1)
+    assert type(bound) is Herbivore and type(status) is AnimalStatus
+    assert "hunger" in vars(bound) and "reproduction_cooldown" in vars(status)
+
+
+def test_bound_animals_breed_plain_offspring():
+    board = make_board()
+    ai = AnimalAI(board, vectorized=True)
+    ai.update(0.1)
+    a, b = board.animals
+    a.age = b.age = 40
+    child = a.reproduce(b, 3)
+    assert type(child) is Herbivore and child._soa is None
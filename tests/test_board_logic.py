@@ -1,3 +1,4 @@
+from pygame.math import Vector2
 
 from my_safari_project.model.board import Board
 
@@ -11,3 +12,66 @@ def test_board_longest_path_returns_valid_path():
     path = board._longest_path(board.entrances[0])
     assert isinstance(path, list)
     assert len(path) > 1
+
+
+def _ladder_board():
+    # two horizontal roads joined by two rungs → the network has a loop
+    board = Board(20, 20, n_roads=0, n_jeeps=0)
+    board.add_road_segment(0, 5, "h_road")
+    board.add_road_segment(0, 8, "h_road")
+    board.add_road_segment(3, 6, "v_road")
+    board.add_road_segment(6, 6, "v_road")
+    return board
+
+def test_longest_path_on_network_with_loop():
+    board = _ladder_board()
+    path = board._longest_path(Vector2(0, 5))
+    tiles = [tuple(p) for p in path]
+    assert len(tiles) == len(set(tiles)) == 16
+    for a, b in zip(path, path[1:]):
+        assert a.distance_to(b) == 1
+    end = next(r for r in board.roads if r.pos == path[-1])
+    assert len(end.neighbors) == 1
+
+def test_longest_path_cache_invalidated_by_new_roads():
+    board = _ladder_board()
+    before = board._longest_path(Vector2(0, 5))
+    assert board._longest_path(Vector2(0, 5)) == before
+    board.add_road_segment(10, 5, "h_road")     # extends the top road
+    after = board._longest_path(Vector2(0, 5))
+    assert len(after) > len(before)
+
+def test_road_index_tracks_new_roads():
+    board = _ladder_board()
+    assert board.road_at(2, 5) is not None
+    assert board.road_at(2, 5).pos == Vector2(2, 5)
+    assert not board.has_road(2, 6)
+    assert board.add_road_segment(2, 6, "v_road")
+    assert board.has_road(2, 6) and board.has_road(2, 7)
+    assert Vector2(2, 6) in board.road_at(2, 5).neighbors
+
+def test_road_index_follows_replaced_and_removed_roads():
+    from my_safari_project.model.road import Road, RoadType
+    board = _ladder_board()
+    old = board.road_at(2, 5)
+    i = board.roads.index(old)
+    board.roads[i] = Road(Vector2(2, 6), RoadType.STRAIGHT_V)     # same length, new tile
+    assert board.road_at(2, 5) is None
+    assert board.road_at(2, 6) is board.roads[i]
+    board.roads.remove(board.roads[i])
+    assert not board.has_road(2, 6)
+
+def test_dead_end_table_follows_the_road_network():
+    board = _ladder_board()
+    expected = [r.pos for r in board.roads if len(r.neighbors) == 1]
+    assert board.road_graph.dead_ends() == expected
+    board.add_road_segment(10, 5, "h_road")
+    assert Vector2(9, 5) not in board.road_graph.dead_ends()
+    assert board.road_graph.dead_ends() == [r.pos for r in board.roads if len(r.neighbors) == 1]
+
+def test_nearest_exit():
+    board = Board(30, 30, n_roads=3, n_jeeps=0)
+    for exit in board.exits:
+        assert board.road_graph.nearest_exit(Vector2(exit)) == exit
+    probe = Vector2(15, 15)
+    assert board.road_graph.nearest_exit(probe) == min(board.exits, key=probe.distance_to)
@@ -0,0 +1,22 @@
+from my_safari_project.model.entity_list import EntityList
+
+
+def test_entity_list_reports_additions_and_removals():
+    added, removed = [], []
+    items = EntityList([1])
+    items.watch(on_add=added.append, on_remove=removed.append)
+    items.append(2)
+    items.extend([3, 4])
+    items.insert(0, 5)
+    items.remove(3)
+    items.pop()
+    del items[0]
+    items[0] = 6
+    items.clear()
+    assert added == [2, 3, 4, 5, 6]
+    assert removed == [3, 4, 5, 1, 6, 2]
+    assert items == []
+
+def test_entity_list_copies_are_plain_lists():
+    items = EntityList([1, 2, 3])
+    assert type(items[:]) is list and items[:] == [1, 2, 3]
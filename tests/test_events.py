@@ -0,0 +1,82 @@
+from pygame.math import Vector2
+from my_safari_project.model.board import Board
+from my_safari_project.model.animal import AnimalSpecies
+from my_safari_project.model.carnivore import Carnivore
+from my_safari_project.model.herbivore import Herbivore
+from my_safari_project.model.poacher import Poacher
+from my_safari_project.model.ranger import Ranger
+from my_safari_project.model.capital import Capital
+from my_safari_project.model.events import EventBus, Spawned, Died, Eaten, Captured
+from my_safari_project.control.wildlife_ai import WildlifeAI
+
+
+def make(board, cls, species, pos=Vector2(1, 1)):
+    return cls(board.population.next_id(), species, Vector2(pos), 1.0, 100, 50)
+
+def test_event_bus_queues_until_flush_and_dispatches_by_type():
+    bus, seen = EventBus(), []
+    bus.subscribe(Spawned, lambda e: seen.append(("spawned", e.entity)))
+    bus.subscribe(Died, lambda e: seen.append(("died", e.cause)))
+    bus.emit(Spawned("a"))
+    bus.emit(Died("b", "eaten"))
+    bus.emit(Eaten("c", "d"))           # no subscriber: dropped
+    assert seen == [] and bus.pending() == 3
+    bus.flush()
+    assert seen == [("spawned", "a"), ("died", "eaten")] and bus.pending() == 0
+
+def test_events_emitted_by_handlers_are_delivered_in_the_same_flush():
+    bus, seen = EventBus(), []
+    bus.subscribe(Spawned, lambda e: bus.emit(Died(e.entity, "old_age")))
+    bus.subscribe(Died, lambda e: seen.append(e.animal))
+    bus.emit(Spawned("x"))
+    bus.flush()
+    assert seen == ["x"]
+
+def test_board_reports_spawns_and_deaths_with_cause():
+    board = Board(10, 10)
+    seen = []
+    board.events.subscribe(Spawned, lambda e: seen.append(("spawned", e.entity.animal_id)))
+    board.events.subscribe(Died, lambda e: seen.append(("died", e.animal.animal_id, e.cause)))
+    zebra = make(board, Herbivore, AnimalSpecies.ZEBRA)
+    board.animals.append(zebra)
+    lion = make(board, Carnivore, AnimalSpecies.LION)
+    board.animals.append(lion)
+    lion.consume(zebra)
+    board.animals.remove(zebra)
+    lion.age = lion.lifespan
+    lion.update(0.1, board)             # dies of old age and leaves the board
+    board.events.flush()
+    assert seen == [("spawned", 1), ("spawned", 2), ("died", 1, "eaten"), ("died", 2, "old_age")]
+
+def test_clearing_living_animals_is_not_a_death():
+    board = Board(10, 10)
+    board.animals.append(make(board, Herbivore, AnimalSpecies.ZEBRA))
+    died = []
+    board.events.subscribe(Died, died.append)
+    board.animals.clear()
+    board.events.flush()
+    assert died == []
+
+def test_wildlife_ai_reacts_to_poaching_and_captures():
+    board = Board(10, 10)
+    capital = Capital(1000)
+    messages = []
+    ai = WildlifeAI(board, capital, feedback_callback=messages.append)
+    zebra = make(board, Herbivore, AnimalSpecies.ZEBRA, Vector2(5, 5))
+    board.animals.append(zebra)
+    poacher = Poacher(id=1, name="P1", position=Vector2(5, 5))
+    board.poachers.append(poacher)
+    ranger = Ranger(id=1, name="R1", salary=100, position=Vector2(5, 5))
+    board.rangers.append(ranger)
+    captured = []
+    board.events.subscribe(Captured, captured.append)
+
+    ai._update_poachers(0.01)
+    ai._update_rangers(0.01)
+    assert capital.getBalance() == 1000     # bounty waits for the flush
+    board.events.flush()
+
+    assert zebra.cause_of_death() == "poached"
+    assert captured == [Captured(poacher, ranger)]
+    assert capital.getBalance() == 1050
+    assert messages == [f"ZEBRA #{zebra.animal_id} was killed by a poacher!", "Poacher eliminated! +$50"]
@@ -34,3 +34,69 @@ def test_spawn_poacher(controller):
     initial = len(controller.board.poachers)
     controller.spawn_poacher()
     assert len(controller.board.poachers) == initial + 1
+
+
+def test_headless_controller_simulates_without_gui():
+    messages = []
+    ctrl = GameController(DifficultyLevel.NORMAL, headless=True, feedback_sink=messages.append)
+    assert ctrl.game_gui is None
+    ctrl.simulate(5.0, dt=0.5)
+    assert ctrl.timer.elapsed_seconds == pytest.approx(5.0)
+    ctrl.enter_chip_mode()
+    assert messages[-1] == "Click an animal to tag with chip"
+
+
+def test_advance_frame_runs_fixed_substeps():
+    from my_safari_project.control.game_controller import SIM_STEP, MAX_SUBSTEPS
+    ctrl = GameController(DifficultyLevel.NORMAL, headless=True)
+    alpha = ctrl.advance_frame(SIM_STEP * 2.5)
+    assert ctrl.timer.elapsed_seconds == pytest.approx(SIM_STEP * 2)
+    assert alpha == pytest.approx(0.5)
+    # a huge frame is capped instead of stalling the loop
+    ctrl.advance_frame(SIM_STEP * (MAX_SUBSTEPS * 10))
+    assert ctrl.timer.elapsed_seconds == pytest.approx(SIM_STEP * (MAX_SUBSTEPS + 2))
+
+def test_each_agent_is_stepped_once_per_tick():
+    controller = GameController(DifficultyLevel.NORMAL, headless=True, seed=1)
+    assert controller.pipeline.names() == [
+        "jeeps", "poacher_spawns", "poacher_quota", "poachers",
+        "rangers", "animals", "tourists", "animal_moves"]
+    controller.spawn_ranger(Vector2(1, 1))
+    controller.spawn_poacher()
+    calls = []
+    for agent in controller.board.rangers + controller.board.poachers:
+        original = agent.update
+        agent.update = lambda dt, board, original=original: calls.append(dt) or original(dt, board)
+    controller.step(0.1)
+    assert len(calls) == 2
+
+def test_pipeline_phase_can_be_skipped():
+    controller = GameController(DifficultyLevel.NORMAL, headless=True, seed=1)
+    controller.spawn_poacher()
+    poacher = controller.board.poachers[0]
+    start = Vector2(poacher.position)
+    controller.pipeline.set_enabled("poachers", False)
+    controller.step(0.5)
+    assert poacher.position == start
+
+def test_loaded_game_keeps_paying_into_the_controller_capital(tmp_path):
+    controller = GameController(DifficultyLevel.NORMAL, headless=True, seed=1)
+    controller.capital.addFunds(250)
+    path = str(tmp_path / "save.json")
+    controller.save_game(path)
+
+    loaded = GameController(DifficultyLevel.NORMAL, headless=True, seed=2)
+    loaded.load_game(path)
+    assert loaded.capital.getBalance() == 1250
+    assert loaded.wildlife_ai.capital is loaded.capital
+    assert loaded.wildlife_ai.tourist_ai.capital is loaded.capital
+
+def test_gui_render_points_the_lod_scheduler_at_the_camera():
+    controller = GameController(DifficultyLevel.NORMAL, seed=1, lod=True)
+    gui = controller.game_gui
+    gui.board_gui.update_day_night(0.0, 0.0, (0, 0))
+    scheduler = controller.wildlife_ai.animal_ai.scheduler
+    assert scheduler.view is None
+    gui._draw()
+    min_x, min_y, max_x, max_y = scheduler.view
+    assert min_x <= gui.board_gui.cam.x < max_x and min_y <= gui.board_gui.cam.y < max_y
@@ -31,7 +31,7 @@ def test_jeep_pickup_tourist(board):
     jeep.position = board.entrances[0]
     t = Tourist(1, Vector2(jeep.position), board)
     board.waiting_tourists.append(t)
-    jeep.update(0.1, 0.0, [j for j in board.jeeps if j != jeep])
+    jeep.update(0.1, 0.0)
     assert len(jeep.tourists) == 1
     assert t not in board.waiting_tourists
 
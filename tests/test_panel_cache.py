@@ -0,0 +1,36 @@
+import pygame
+from my_safari_project.view.panel_cache import CachedPanel
+
+
+def test_panel_repaints_only_when_its_key_changes():
+    panel = CachedPanel(pygame.Rect(10, 20, 40, 30))
+    painted = []
+    paint = lambda surf, key: painted.append(key) or surf.fill((key, 0, 0))
+    assert panel.refresh(1, paint)
+    assert not panel.refresh(1, paint)
+    assert panel.refresh(2, paint)
+    panel.invalidate()
+    assert panel.refresh(2, paint)
+    assert painted == [1, 2, 2]
+    assert panel.surface.get_size() == (40, 30)
+
+def test_panel_blits_at_its_screen_position():
+    screen = pygame.Surface((100, 100))
+    panel = CachedPanel(pygame.Rect(10, 20, 40, 30))
+    panel.refresh("red", lambda surf, key: surf.fill((255, 0, 0)))
+    assert panel.blit(screen) == pygame.Rect(10, 20, 40, 30)
+    assert screen.get_at((10, 20))[:3] == (255, 0, 0)
+    assert screen.get_at((9, 20))[:3] == (0, 0, 0)
+
+def test_idle_paused_frame_pushes_nothing():
+    from my_safari_project.control.game_controller import GameController, DifficultyLevel
+    from my_safari_project.view.gamegui import SCENE_RECT
+    controller = GameController(DifficultyLevel.NORMAL, seed=1)
+    gui = controller.game_gui
+    gui.board_gui.update_day_night(0.0, 0.0, (0, 0))
+    assert gui._draw() == [gui.screen.get_rect()]       # first frame: everything
+    assert gui._draw() == []
+    controller.advance_frame(0.1)
+    assert SCENE_RECT in gui._draw()
+    gui._feedback("Hello")
+    assert gui._draw()
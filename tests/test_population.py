@@ -0,0 +1,36 @@
+from pygame.math import Vector2
+from my_safari_project.model.board import Board
+from my_safari_project.model.animal import AnimalSpecies
+from my_safari_project.model.carnivore import Carnivore
+from my_safari_project.model.herbivore import Herbivore
+
+
+def make(board, cls, species):
+    return cls(board.population.next_id(), species, Vector2(1, 1), 1.0, 100, 50)
+
+def test_population_counts_follow_spawns_deaths_and_removals():
+    board = Board(10, 10)
+    zebra = make(board, Herbivore, AnimalSpecies.ZEBRA)
+    board.animals.append(zebra)
+    lion = make(board, Carnivore, AnimalSpecies.LION)
+    board.animals.append(lion)
+    board.animals.append(make(board, Herbivore, AnimalSpecies.ZEBRA))
+    pop = board.population
+    assert (pop.herbivores, pop.carnivores, pop.count(AnimalSpecies.ZEBRA)) == (2, 1, 2)
+    assert pop.species_present() == 2
+
+    lion.consume(zebra)                 # kills the zebra, which stays on the board for now
+    assert (pop.herbivores, pop.count(AnimalSpecies.ZEBRA)) == (1, 1)
+    board.animals.remove(zebra)
+    assert pop.herbivores == 1
+    lion.kill()
+    board.animals.remove(lion)
+    assert (pop.carnivores, pop.total) == (0, 1)
+
+def test_population_ids_are_never_reused():
+    board = Board(10, 10)
+    first = make(board, Herbivore, AnimalSpecies.ZEBRA)
+    board.animals.append(first)
+    board.animals.append(make(board, Herbivore, AnimalSpecies.ZEBRA))
+    board.animals.remove(first)
+    assert board.population.next_id() == 3
@@ -0,0 +1,40 @@
+import csv
+import json
+
+from my_safari_project.control.profiler import Profiler
+
+
+def test_profiler_records_nothing_while_disabled():
+    prof = Profiler()
+    with prof.section("sim"):
+        pass
+    prof.lap("render.terrain", prof.mark())
+    assert prof.summary() == []
+
+def test_profiler_sections_and_laps_count_calls():
+    prof = Profiler(window=3)
+    prof.toggle()
+    for _ in range(5):
+        with prof.section("sim"):
+            pass
+        t = prof.mark()
+        t = prof.lap("render.background", t)
+        prof.lap("render.terrain", t)
+    rows = {r["section"]: r for r in prof.summary()}
+    assert list(rows) == ["sim", "render.background", "render.terrain"]
+    assert rows["sim"]["calls"] == 5
+    assert len(prof._stats["sim"].samples) == 3        # rolling window
+    assert rows["sim"]["max_ms"] >= rows["sim"]["mean_ms"] >= 0.0
+
+def test_profiler_exports_csv_and_json(tmp_path):
+    prof = Profiler()
+    prof.enabled = True
+    with prof.section("animals.stats"):
+        pass
+    prof.export(str(tmp_path / "out" / "p.csv"))
+    prof.export(str(tmp_path / "p.json"))
+    with open(tmp_path / "out" / "p.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["section"] == "animals.stats" and rows[0]["calls"] == "1"
+    data = json.loads((tmp_path / "p.json").read_text())
+    assert data["sections"][0]["section"] == "animals.stats"
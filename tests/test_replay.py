@@ -0,0 +1,106 @@
+from pygame.math import Vector2
+from my_safari_project.control.game_controller import GameController, DifficultyLevel
+from my_safari_project.control.replay import ReplayLog, replay
+
+
+def snapshot(ctrl):
+    board = ctrl.board
+    return (
+        ctrl.tick,
+        ctrl.capital.getBalance(),
+        [(a.animal_id, tuple(a.position)) for a in board.animals],
+        [tuple(j.position) for j in board.jeeps],
+        [tuple(t.position) for t in board.tourists],
+        len(board.roads),
+    )
+
+
+def test_same_seed_builds_same_world():
+    a = GameController(DifficultyLevel.NORMAL, headless=True, seed=5)
+    b = GameController(DifficultyLevel.NORMAL, headless=True, seed=5)
+    assert [tuple(r.pos) for r in a.board.roads] == [tuple(r.pos) for r in b.board.roads]
+    assert list(a.board.terrain.terrain) == list(b.board.terrain.terrain)
+
+
+def test_replay_reproduces_recorded_session(tmp_path):
+    ctrl = GameController(DifficultyLevel.NORMAL, headless=True, seed=11)
+    for i in range(300):
+        if i == 5:
+            ctrl.buy_item("Zebra", 10, Vector2(30, 30))
+            ctrl.buy_item("Lion", 10)
+        if i == 40:
+            ctrl.place_road(40, 40, "h_road")
+            ctrl.set_speed(4.0)
+        ctrl.step()
+    path = tmp_path / "session.json"
+    ctrl.replay_log.save(str(path))
+
+    again = replay(ReplayLog.load(str(path)))
+    assert snapshot(again) == snapshot(ctrl)
+    assert again.time_multiplier == 4.0
+
+
+def test_replay_uses_recorded_step_lengths(tmp_path):
+    ctrl = GameController(DifficultyLevel.NORMAL, headless=True, seed=3)
+    ctrl.simulate(20.0, dt=0.1)
+    ctrl.buy_item("Zebra", 10, Vector2(20, 20))
+    ctrl.simulate(5.05, dt=0.5)           # ends on a shorter step
+    for _ in range(10):
+        ctrl.step()
+    path = tmp_path / "session.json"
+    ctrl.replay_log.save(str(path))
+
+    again = replay(ReplayLog.load(str(path)))
+    assert again.timer.elapsed_seconds == ctrl.timer.elapsed_seconds
+    assert snapshot(again) == snapshot(ctrl)
+
+
+def test_headless_cli_records_a_replayable_session(tmp_path, capsys):
+    from my_safari_project.headless import main
+    path = tmp_path / "session.json"
+    main(["--months", "0.001", "--seed", "4", "--record", str(path)])
+    recorded = capsys.readouterr().out
+    main(["--replay", str(path)])
+    replayed = capsys.readouterr().out
+    summary = lambda out: [l for l in out.splitlines() if not l.startswith("recorded")]
+    assert summary(replayed) == summary(recorded)
+
+
+def test_replay_reproduces_ranger_orders_and_chip_tags(tmp_path):
+    ctrl = GameController(DifficultyLevel.HARD, headless=True, seed=4)
+    ctrl.buy_item("Ranger", 10, Vector2(10, 10))
+    ctrl.buy_item("Zebra", 10, Vector2(30, 30))
+    while not ctrl.board.poachers:
+        ctrl.step()
+    ranger = ctrl.send_ranger(0)
+    assert ranger.assigned_poacher is ctrl.board.poachers[0]
+    zebra = ctrl.board.animals[-1]
+    assert ctrl.handle_chip_click(Vector2(zebra.position))
+    for _ in range(50):
+        ctrl.step()
+    path = tmp_path / "session.json"
+    ctrl.replay_log.save(str(path))
+
+    again = replay(ReplayLog.load(str(path)))
+    assert snapshot(again) == snapshot(ctrl)
+    assert [tuple(r.position) for r in again.board.rangers] == [tuple(r.position) for r in ctrl.board.rangers]
+    assert again.visible_animals_night == ctrl.visible_animals_night == {zebra.animal_id}
+
+
+def test_replay_of_a_loaded_game_starts_from_the_save(tmp_path):
+    saved = GameController(DifficultyLevel.NORMAL, headless=True, seed=1)
+    saved.buy_item("Zebra", 10, Vector2(25, 25))
+    saved.simulate(10.0)
+    save_path = str(tmp_path / "save.json")
+    saved.save_game(save_path)
+
+    ctrl = GameController(DifficultyLevel.NORMAL, headless=True, seed=2)
+    ctrl.load_game(save_path)
+    for _ in range(100):
+        ctrl.step()
+    path = tmp_path / "session.json"
+    ctrl.replay_log.save(str(path))
+
+    again = replay(ReplayLog.load(str(path)))
+    assert again.timer.elapsed_seconds == ctrl.timer.elapsed_seconds
+    assert snapshot(again) == snapshot(ctrl)
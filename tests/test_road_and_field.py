@@ -16,3 +16,32 @@ def test_field_add_and_remove_object():
     assert field.is_occupied()
     field.remove_object(obj)
     assert not field.is_occupied()
+
+def test_grid_field_writes_through_to_terrain_grid():
+    from my_safari_project.model.field import TerrainType
+    from my_safari_project.model.terrain_grid import TerrainGrid
+    grid = TerrainGrid(4, 3)
+    grid.field(2, 1).set_terrain(TerrainType.HILL)
+    field = grid.field(2, 1)
+    assert field.terrain_type == TerrainType.HILL
+    assert field.movement_cost == 2.0
+    assert grid.terrain_at(2, 1) == TerrainType.HILL
+    assert grid.terrain_at(1, 1) == TerrainType.GRASS
+
+def test_grid_field_occupancy():
+    from my_safari_project.model.terrain_grid import TerrainGrid
+    grid = TerrainGrid(4, 3)
+    obj = object()
+    grid.field(0, 2).add_object(obj)
+    assert grid.field(0, 2).is_occupied()
+    assert obj in grid.field(0, 2).objects_on_field
+    grid.field(0, 2).remove_object(obj)
+    assert not grid.field(0, 2).is_occupied()
+
+def test_terrain_grid_reports_dirty_chunks():
+    from my_safari_project.model.field import TerrainType
+    from my_safari_project.model.terrain_grid import CHUNK, TerrainGrid
+    grid = TerrainGrid(2 * CHUNK, 2 * CHUNK)
+    grid.field(CHUNK + 1, 3).set_terrain(TerrainType.RIVER)
+    assert grid.take_dirty() == {(1, 0)}
+    assert grid.take_dirty() == set()
@@ -0,0 +1,56 @@
+import random
+from pygame.math import Vector2
+from my_safari_project.model.board import Board
+from my_safari_project.model.tourist import Tourist
+from my_safari_project.model.herbivore import Herbivore
+from my_safari_project.model.animal import AnimalSpecies
+from my_safari_project.control.sighting import SightingEngine
+
+
+def zebra(aid, x, y):
+    return Herbivore(aid, AnimalSpecies.ZEBRA, Vector2(x, y), 1.0, 100, 20)
+
+def test_tourists_sharing_a_position_share_one_query():
+    board = Board(20, 20)
+    board.animals.extend([zebra(1, 2, 2), zebra(2, 6, 2), zebra(3, 15, 15)])
+    shared = Vector2(3, 3)                              # e.g. passengers of one jeep
+    riders = [Tourist(i, shared, board) for i in range(3)]
+    walker = Tourist(9, Vector2(14, 14), board)
+    engine = SightingEngine(5.0)
+    for t in riders + [walker]:
+        engine.watch(t)
+
+    assert engine.resolve(board) == 2
+    assert all(t.seen_animals == {1, 2} for t in riders)
+    assert walker.seen_animals == {3}
+
+def test_exiting_tourists_and_dead_animals_are_not_sighted():
+    board = Board(20, 20)
+    dead = zebra(1, 2, 2)
+    dead.is_alive = False
+    board.animals.extend([dead, zebra(2, 3, 3)])
+    leaving = Tourist(1, Vector2(2, 2), board)
+    leaving.movement_state = "exiting"
+    looking = Tourist(2, Vector2(2, 2), board)
+    engine = SightingEngine(5.0)
+    engine.watch(leaving)
+    engine.watch(looking)
+    engine.resolve(board)
+    assert leaving.seen_animals == set() and looking.seen_animals == {2}
+
+def test_sightings_match_a_scan_per_tourist():
+    rng = random.Random(4)
+    board = Board(40, 40)
+    board.animals.extend(zebra(i, rng.uniform(0, 39), rng.uniform(0, 39)) for i in range(1, 200))
+    tourists = [Tourist(i, Vector2(rng.randint(0, 39), rng.randint(0, 39)), board) for i in range(60)]
+    expected = []
+    for t in tourists:
+        probe = Tourist(-1, t.position, board)
+        probe.detect_animals(board.animals, 5.0)
+        expected.append(probe.seen_animals)
+
+    engine = SightingEngine(5.0)
+    for t in tourists:
+        engine.watch(t)
+    engine.resolve(board)
+    assert [t.seen_animals for t in tourists] == expected
@@ -0,0 +1,38 @@
+from pygame.math import Vector2
+from my_safari_project.model.spatial_hash import SpatialHash
+from my_safari_project.model.pond import Pond
+
+
+def test_query_returns_only_neighbouring_cells():
+    grid = SpatialHash(5.0)
+    near, far = Pond(1, Vector2(2, 2)), Pond(2, Vector2(40, 40))
+    grid.rebuild([near, far])
+    found = grid.query(Vector2(3, 3), 5.0)
+    assert near in found
+    assert far not in found
+
+
+def test_query_keeps_insertion_order():
+    grid = SpatialHash(5.0)
+    ponds = [Pond(i, Vector2(9 - i, 1)) for i in range(10)]
+    grid.rebuild(ponds)
+    assert grid.query(Vector2(5, 1), 10.0) == ponds
+
+
+def test_move_rebuckets_entity():
+    grid = SpatialHash(5.0)
+    pond = Pond(1, Vector2(1, 1))
+    grid.insert(pond, pond.position)
+    pond.position = Vector2(30, 30)
+    grid.move(pond, pond.position)
+    assert pond not in grid.query(Vector2(1, 1), 1.0)
+    assert pond in grid.query(Vector2(30, 30), 1.0)
+
+
+def test_remove_entity():
+    grid = SpatialHash(5.0)
+    pond = Pond(1, Vector2(1, 1))
+    grid.insert(pond, pond.position)
+    grid.remove(pond)
+    assert len(grid) == 0
+    assert grid.query(Vector2(1, 1), 5.0) == []
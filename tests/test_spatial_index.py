@@ -0,0 +1,46 @@
+from pygame.math import Vector2
+from my_safari_project.model.board import Board
+from my_safari_project.model.animal import AnimalSpecies
+from my_safari_project.model.herbivore import Herbivore
+from my_safari_project.model.poacher import Poacher
+
+
+def add_zebra(board, x, y):
+    zebra = Herbivore(board.population.next_id(), AnimalSpecies.ZEBRA, Vector2(x, y), 1.0, 100, 20)
+    board.animals.append(zebra)
+    return zebra
+
+def test_index_follows_additions_and_removals_between_refreshes():
+    board = Board(40, 40, n_jeeps=0)
+    near = add_zebra(board, 2, 2)
+    add_zebra(board, 35, 35)
+    assert board.spatial.query_rect("animal", 0, 0, 10, 10) == [near]
+
+    poacher = Poacher(1, "P1", Vector2(3, 3))
+    board.poachers.append(poacher)
+    assert board.spatial.query_rect("poacher", 0, 0, 10, 10) == [poacher]
+    board.poachers.remove(poacher)
+    assert board.spatial.query_rect("poacher", 0, 0, 10, 10) == []
+
+def test_refresh_picks_up_moves_and_drops_dead_animals():
+    board = Board(40, 40, n_jeeps=0)
+    a, b = add_zebra(board, 2, 2), add_zebra(board, 3, 3)
+    a.position = Vector2(30, 30)
+    b.is_alive = False
+    board.spatial.refresh()
+    assert board.spatial.query_rect("animal", 0, 0, 10, 10) == []
+    assert board.spatial.query_rect("animal", 25, 25, 35, 35) == [a]
+    assert board.spatial.entities("animal") == [a, b]
+
+def test_board_gui_culling_does_not_depend_on_zoom():
+    import pygame
+    from my_safari_project.view.boardgui import BoardGUI
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    board = Board(40, 40, n_jeeps=0)
+    a, b = add_zebra(board, 2, 2), add_zebra(board, 3, 3)
+    b.is_alive = False
+    board.spatial.refresh()
+    gui = BoardGUI(board)
+    assert gui._in_view("animal", (-5, -5, 45, 45)) == [a]     # whole board on screen
+    assert gui._in_view("animal", (0, 0, 10, 10)) == [a]
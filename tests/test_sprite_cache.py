@@ -0,0 +1,27 @@
+import pygame
+from my_safari_project.view.sprite_cache import SpriteCache
+
+
+def test_sprite_cache_reuses_scaled_surface():
+    cache = SpriteCache()
+    img = pygame.Surface((8, 8))
+    first = cache.get("img", img, (16, 16))
+    assert first.get_size() == (16, 16)
+    assert cache.get("img", img, (16, 16)) is first
+    assert cache.get("img", img, (32, 32)) is not first
+
+def test_sprite_cache_buckets_rotations():
+    cache = SpriteCache()
+    img = pygame.Surface((8, 4))
+    assert cache.get("jeep", img, (8, 4), 91.0) is cache.get("jeep", img, (8, 4), 89.0)
+    assert cache.get("jeep", img, (8, 4), 90.0).get_size() == (4, 8)
+
+def test_sprite_cache_evicts_least_recently_used():
+    cache = SpriteCache(max_items=2)
+    img = pygame.Surface((4, 4))
+    a = cache.get("a", img, (4, 4))
+    cache.get("b", img, (4, 4))
+    cache.get("a", img, (4, 4))          # touch a, so b is the oldest
+    cache.get("c", img, (4, 4))
+    assert len(cache) == 2
+    assert cache.get("a", img, (4, 4)) is a
@@ -0,0 +1,29 @@
+import pygame
+from pygame.math import Vector2
+from my_safari_project.model.field import Field, TerrainType
+from my_safari_project.view.surface_pool import SurfacePool
+
+
+def test_pool_reuses_a_surface_until_its_size_changes():
+    pool = SurfacePool()
+    hover = pool.get("hover", (32, 32))
+    assert pool.get("hover", (32.0, 32.0)) is hover
+    assert hover.get_flags() & pygame.SRCALPHA
+    assert pool.get("tint", (32, 32), 0) is not hover
+    bigger = pool.get("hover", (40, 40))
+    assert bigger is not hover and bigger.get_size() == (40, 40)
+    assert len(pool) == 2
+
+def test_hill_shading_blends_in_place_like_an_alpha_overlay():
+    surface = pygame.Surface((8, 8))
+    surface.fill((200, 180, 100))
+    hill = Field(Vector2(0, 0), terrain_type=TerrainType.HILL, elevation=2)
+    hill.color_map = {**Field.color_map, TerrainType.HILL: (200, 180, 100)}
+    hill.draw(surface, 8)
+    expected = pygame.Surface((8, 8))
+    expected.fill((200, 180, 100))
+    overlay = pygame.Surface((8, 8), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 60))
+    expected.blit(overlay, (0, 0))
+    got, want = surface.get_at((4, 4)), expected.get_at((4, 4))
+    assert all(abs(a - b) <= 2 for a, b in zip(got[:3], want[:3]))
@@ -0,0 +1,32 @@
+import pygame
+from my_safari_project.view.text_cache import TextCache
+
+pygame.font.init()
+
+
+def test_text_cache_reuses_rendered_text():
+    cache = TextCache()
+    font = pygame.font.Font(None, 24)
+    first = cache.get(font, "Lions: 3", (255, 255, 255))
+    assert cache.get(font, "Lions: 3", [255, 255, 255]) is first
+    assert cache.get(font, "Lions: 3", (255, 0, 0)) is not first
+    assert cache.get(pygame.font.Font(None, 32), "Lions: 3", (255, 255, 255)) is not first
+
+def test_outlined_text_is_composed_one_pixel_larger():
+    cache = TextCache()
+    font = pygame.font.Font(None, 24)
+    plain = cache.get(font, "42", (255, 255, 0))
+    outlined = cache.get(font, "42", (255, 255, 0), outline=(0, 0, 0))
+    assert outlined is not plain
+    assert outlined.get_size() == (plain.get_width() + 2, plain.get_height() + 2)
+    assert cache.get(font, "42", (255, 255, 0), outline=(0, 0, 0)) is outlined
+
+def test_text_cache_evicts_least_recently_used():
+    cache = TextCache(max_items=2)
+    font = pygame.font.Font(None, 24)
+    a = cache.get(font, "a", (0, 0, 0))
+    cache.get(font, "b", (0, 0, 0))
+    cache.get(font, "a", (0, 0, 0))          # touch a, so b is the oldest
+    cache.get(font, "c", (0, 0, 0))
+    assert len(cache) == 2
+    assert cache.get(font, "a", (0, 0, 0)) is a
@@ -0,0 +1,48 @@
+from pygame.math import Vector2
+from my_safari_project.model.board import Board
+from my_safari_project.model.jeep import Jeep
+from my_safari_project.model.events import JeepCrashed
+
+
+def add_jeep(board, jid, x, y):
+    jeep = Jeep(jid, Vector2(x, y))
+    jeep.board = board
+    board.jeeps.append(jeep)
+    return jeep
+
+def test_traffic_tracks_tiles_through_the_jeep_list():
+    board = Board(20, 20, n_jeeps=0)
+    a = add_jeep(board, 1, 3.5, 3.5)
+    b = add_jeep(board, 2, 3.2, 3.9)
+    assert board.traffic.occupants((3, 3)) == [a, b]
+
+    b.position = Vector2(7.5, 3.5)
+    board.traffic.moved(b)
+    assert board.traffic.occupants((3, 3)) == [a]
+    assert board.traffic.occupants((7, 3)) == [b]
+
+    board.jeeps.remove(a)
+    assert a not in board.traffic and board.traffic.occupants((3, 3)) == []
+    board.jeeps.clear()
+    assert len(board.traffic) == 0
+
+def test_nearby_checks_neighbouring_tiles_in_board_order():
+    board = Board(20, 20, n_jeeps=0)
+    me = add_jeep(board, 1, 5.1, 5.1)
+    far = add_jeep(board, 2, 6.5, 5.1)          # next tile, but too far
+    second = add_jeep(board, 3, 4.8, 5.0)        # tile to the left
+    first = add_jeep(board, 4, 5.5, 5.5)         # same tile, added later
+    assert board.traffic.nearby(me, 0.8) == [second, first]
+    assert far not in board.traffic.nearby(me, 0.8)
+
+def test_jeeps_too_close_crash_and_leave_the_board():
+    board = Board(20, 20, n_jeeps=0)
+    a = add_jeep(board, 1, 5.5, 5.5)
+    b = add_jeep(board, 2, 5.9, 5.5)
+    c = add_jeep(board, 3, 15.5, 15.5)
+    crashes = []
+    board.events.subscribe(JeepCrashed, crashes.append)
+    board.update(0.1, 0.0)
+    board.events.flush()
+    assert board.jeeps == [c]
+    assert crashes == [JeepCrashed((a, b))]
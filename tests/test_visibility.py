@@ -0,0 +1,54 @@
+import random
+from pygame.math import Vector2
+from my_safari_project.model.board import Board
+from my_safari_project.model.animal import AnimalSpecies
+from my_safari_project.model.herbivore import Herbivore
+from my_safari_project.model.poacher import Poacher, poacher_watchers
+from my_safari_project.model.ranger import Ranger
+from my_safari_project.model.visibility import VisibilityField
+
+
+class Observer:
+    def __init__(self, x, y):
+        self.position = Vector2(x, y)
+        self.is_alive = True
+
+def test_covers_matches_checking_every_observer():
+    rng = random.Random(3)
+    observers = [(Observer(rng.uniform(0, 60), rng.uniform(0, 60)), rng.choice([2, 5, 12]))
+                 for _ in range(40)]
+    field = VisibilityField(5)
+    for observer, radius in observers:
+        field.stamp(observer, radius)
+    assert len(field) == 40
+    for _ in range(500):
+        pos = Vector2(rng.uniform(-10, 70), rng.uniform(-10, 70))
+        expected = any(pos.distance_to(o.position) <= r for o, r in observers)
+        assert field.covers(pos) == expected
+
+def test_while_alive_observers_stop_seeing_when_they_die():
+    watcher = Observer(10, 10)
+    field = VisibilityField(5)
+    field.stamp(watcher, 3, while_alive=True)
+    assert field.covers(Vector2(12, 10))
+    watcher.is_alive = False
+    assert not field.covers(Vector2(12, 10))
+
+def test_poachers_are_seen_by_rangers_and_living_animals():
+    board = Board(60, 60, n_jeeps=0)
+    board.rangers.append(Ranger(1, "R1", 10, Vector2(5, 5)))
+    zebra = Herbivore(board.population.next_id(), AnimalSpecies.ZEBRA, Vector2(40, 40), 1.0, 100, 20)
+    board.animals.append(zebra)
+    watchers = poacher_watchers(board)
+    assert watchers.covers(Vector2(5, 5 + board.rangers[0].vision))
+    assert watchers.covers(Vector2(48, 40))
+    assert not watchers.covers(Vector2(25, 25))
+
+    poacher = Poacher(1, "P1", Vector2(25, 25))
+    poacher.speed = 0
+    board.poachers.append(poacher)
+    poacher.update(0.1, board)
+    assert not poacher.visible
+    zebra.position = Vector2(30, 25)
+    poacher.update(0.1, board)
+    assert poacher.visible